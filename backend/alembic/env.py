@@ -10,10 +10,13 @@ from alembic import context
 import sys
 import os
 
-sys.path = ['', '..'] + sys.path[1:]
+sys.path = ['', '..', 'app'] + sys.path[1:]
 print(sys.path)
-from app.core import settings
-from app.models import Base
+# Модули импортируются под теми же именами, что и в приложении (core, models):
+# импорт через пакет app загрузил бы их второй раз, и метрики prometheus
+# зарегистрировались бы в REGISTRY повторно.
+from core import settings
+from models import Base
 
 
 
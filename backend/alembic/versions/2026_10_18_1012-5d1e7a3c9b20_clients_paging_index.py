@@ -0,0 +1,32 @@
+"""clients paging index
+
+Revision ID: 5d1e7a3c9b20
+Revises: caf63c2107ae
+Create Date: 2026-10-18 10:12:41.208513
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5d1e7a3c9b20"
+down_revision: Union[str, None] = "caf63c2107ae"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_clients_create_at_day_id",
+        "clients",
+        ["create_at_day", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_clients_create_at_day_id", table_name="clients")
@@ -0,0 +1,46 @@
+"""contacts client_id on delete cascade
+
+Revision ID: 0b8e4f2d6a17
+Revises: 5d1e7a3c9b20
+Create Date: 2026-10-18 11:47:05.631174
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0b8e4f2d6a17"
+down_revision: Union[str, None] = "5d1e7a3c9b20"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_constraint(
+        "contacts_client_id_fkey", "contacts", type_="foreignkey"
+    )
+    op.create_foreign_key(
+        "contacts_client_id_fkey",
+        "contacts",
+        "clients",
+        ["client_id"],
+        ["id"],
+        ondelete="CASCADE",
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint(
+        "contacts_client_id_fkey", "contacts", type_="foreignkey"
+    )
+    op.create_foreign_key(
+        "contacts_client_id_fkey",
+        "contacts",
+        "clients",
+        ["client_id"],
+        ["id"],
+    )
@@ -0,0 +1,58 @@
+"""clients page etag
+
+Revision ID: 7c3f9a1e2b48
+Revises: 0b8e4f2d6a17
+Create Date: 2026-10-18 13:05:22.417390
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "7c3f9a1e2b48"
+down_revision: Union[str, None] = "0b8e4f2d6a17"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# ETag страницы списка строится из (id, update_at_day) самой страницы
+# index-only scan по ix_clients_paging, поэтому индекс пагинации
+# дополняется колонкой update_at_day и заменяет ix_clients_create_at_day_id.
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_clients_paging",
+            "clients",
+            ["create_at_day", "id"],
+            unique=False,
+            postgresql_include=["update_at_day"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_clients_create_at_day_id",
+            table_name="clients",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_clients_create_at_day_id",
+            "clients",
+            ["create_at_day", "id"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_clients_paging",
+            table_name="clients",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,121 @@
+"""client search indexes
+
+Revision ID: e41a6b9d3c05
+Revises: 7c3f9a1e2b48
+Create Date: 2026-10-18 14:22:48.905126
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e41a6b9d3c05"
+down_revision: Union[str, None] = "7c3f9a1e2b48"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+BACKFILL_BATCH_SIZE = 5000
+
+# Колонки поиска — обычные колонки, которые заполняет триггер, а не
+# GENERATED ... STORED: добавление вычисляемой колонки переписывает всю
+# таблицу под ACCESS EXCLUSIVE, а обычная nullable-колонка добавляется
+# мгновенно и заполняется пачками. Та же функция создаётся для
+# metadata.create_all в models/client.py.
+_SEARCH_COLUMNS_FUNCTION_SQL = """
+    CREATE OR REPLACE FUNCTION clients_search_columns() RETURNS trigger AS $$
+    BEGIN
+        NEW.search_tsv := to_tsvector(
+            'simple', NEW.name || ' ' || NEW.sur_name || ' ' || coalesce(NEW.middle_name, '')
+        );
+        NEW.search_name := lower(NEW.name || ' ' || NEW.sur_name || ' ' || coalesce(NEW.middle_name, ''));
+        RETURN NEW;
+    END;
+    $$ LANGUAGE plpgsql
+"""
+
+_SEARCH_COLUMNS_TRIGGER_SQL = """
+    CREATE TRIGGER clients_search_columns
+    BEFORE INSERT OR UPDATE OF name, sur_name, middle_name ON clients
+    FOR EACH ROW EXECUTE FUNCTION clients_search_columns()
+"""
+
+# Каждая пачка фиксируется отдельно (autocommit_block), как в ревизии
+# contacts_normalized_lookup. Строки, уже заполненные триггером или
+# прошлым запуском миграции, не переписываются.
+_BACKFILL_BATCH_SQL = sa.text(
+    """
+    WITH batch AS (
+        SELECT id
+        FROM clients
+        WHERE id > :after
+        ORDER BY id
+        LIMIT :batch_size
+    ),
+    updated AS (
+        UPDATE clients
+        SET search_tsv = to_tsvector('simple', name || ' ' || sur_name || ' ' || coalesce(middle_name, '')),
+            search_name = lower(name || ' ' || sur_name || ' ' || coalesce(middle_name, ''))
+        FROM batch
+        WHERE clients.id = batch.id AND clients.search_name IS NULL
+    )
+    SELECT max(id) FROM batch
+    """
+)
+
+SEARCH_INDEXES = (
+    ("ix_clients_search_tsv", "clients", "search_tsv", None),
+    ("ix_clients_search_name_trgm", "clients", "search_name", "gin_trgm_ops"),
+    ("ix_contacts_email_trgm", "contacts", "email", "gin_trgm_ops"),
+    ("ix_contacts_phone_number_trgm", "contacts", "phone_number", "gin_trgm_ops"),
+)
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute("ALTER TABLE clients ADD COLUMN IF NOT EXISTS search_tsv TSVECTOR")
+    op.execute("ALTER TABLE clients ADD COLUMN IF NOT EXISTS search_name TEXT")
+    # Триггер создаётся до заполнения: новые и изменённые во время
+    # миграции строки заполняются сразу.
+    op.execute(_SEARCH_COLUMNS_FUNCTION_SQL)
+    op.execute("DROP TRIGGER IF EXISTS clients_search_columns ON clients")
+    op.execute(_SEARCH_COLUMNS_TRIGGER_SQL)
+
+    # CREATE INDEX CONCURRENTLY не блокирует запись, но не выполняется в транзакции.
+    with op.get_context().autocommit_block():
+        connection = op.get_bind()
+        last_id = 0
+        while last_id is not None:
+            last_id = connection.execute(
+                _BACKFILL_BATCH_SQL, {"after": last_id, "batch_size": BACKFILL_BATCH_SIZE}
+            ).scalar()
+
+        for index_name, table, column, ops in SEARCH_INDEXES:
+            op.create_index(
+                index_name,
+                table,
+                [column],
+                postgresql_using="gin",
+                postgresql_ops={column: ops} if ops else {},
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for index_name, table, _, _ in reversed(SEARCH_INDEXES):
+            op.drop_index(
+                index_name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+    op.execute("DROP TRIGGER IF EXISTS clients_search_columns ON clients")
+    op.execute("DROP FUNCTION IF EXISTS clients_search_columns()")
+    op.drop_column("clients", "search_name")
+    op.drop_column("clients", "search_tsv")
@@ -0,0 +1,43 @@
+"""contacts client_id index
+
+Revision ID: 9a2c5e7f1d84
+Revises: e41a6b9d3c05
+Create Date: 2026-10-18 15:36:12.407391
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9a2c5e7f1d84"
+down_revision: Union[str, None] = "e41a6b9d3c05"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# CREATE INDEX CONCURRENTLY не блокирует запись в таблицу, но не может
+# выполняться в транзакции, поэтому индекс строится в autocommit_block.
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_contacts_client_id",
+            "contacts",
+            ["client_id"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_contacts_client_id",
+            table_name="contacts",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,172 @@
+"""contacts normalized lookup
+
+Revision ID: 3f6d8b2a4c71
+Revises: 9a2c5e7f1d84
+Create Date: 2026-10-18 16:48:31.520934
+
+"""
+
+import logging
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3f6d8b2a4c71"
+down_revision: Union[str, None] = "9a2c5e7f1d84"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+logger = logging.getLogger("alembic.runtime.migration")
+
+BACKFILL_BATCH_SIZE = 5000
+
+# Те же правила, что у normalize_email/normalize_phone в models/contact.py.
+_EMAIL_NORM_SQL = "NULLIF(lower(btrim(email)), '')"
+_PHONE_E164_SQL = """
+    CASE
+        WHEN digits = '' THEN NULL
+        WHEN length(digits) = 10 THEN '+7' || digits
+        WHEN length(digits) = 11 AND left(digits, 1) = '8' THEN '+7' || substr(digits, 2)
+        ELSE '+' || digits
+    END
+"""
+
+_NORMALIZED_VALUES_SQL = {
+    "email_norm": _EMAIL_NORM_SQL,
+    "phone_e164": _PHONE_E164_SQL,
+}
+
+# Каждая пачка фиксируется отдельно (autocommit_block), поэтому блокировки
+# строк держатся недолго, а WAL не копится одной огромной транзакцией.
+# Проход по id идёт до пустой пачки и захватывает строки,
+# вставленные во время миграции.
+_BACKFILL_BATCH_SQL = """
+    WITH batch AS (
+        SELECT id, regexp_replace(phone_number, '\\D', '', 'g') AS digits
+        FROM contacts
+        WHERE id > :after
+        ORDER BY id
+        LIMIT :batch_size
+    ),
+    updated AS (
+        UPDATE contacts
+        SET {assignments}
+        FROM batch
+        WHERE contacts.id = batch.id
+    )
+    SELECT max(id) FROM batch
+"""
+
+# До миграции "Foo@x.ru" и "foo@x.ru" могли принадлежать разным клиентам.
+# Нормализованное значение остаётся у самого раннего контакта, у остальных
+# колонка остаётся NULL, иначе уникальный индекс не построится.
+_RESET_DUPLICATES_SQL = """
+    UPDATE contacts
+    SET {column} = NULL
+    WHERE id IN (
+        SELECT id
+        FROM (
+            SELECT id, row_number() OVER (PARTITION BY {column} ORDER BY id) AS rank
+            FROM contacts
+            WHERE {column} IS NOT NULL
+        ) AS ranked
+        WHERE rank > 1
+    )
+"""
+
+
+# None — индекса нет. Недостроенный CREATE INDEX CONCURRENTLY оставляет
+# индекс INVALID, который IF NOT EXISTS посчитал бы готовым: при повторном
+# запуске миграции такой индекс удаляется и строится заново.
+_INDEX_IS_VALID_SQL = sa.text(
+    """
+    SELECT pg_index.indisvalid
+    FROM pg_index
+    WHERE pg_index.indexrelid = to_regclass(:name)
+    """
+)
+
+NORMALIZED_INDEXES = (
+    ("ix_contacts_email_norm", "email_norm"),
+    ("ix_contacts_phone_e164", "phone_e164"),
+)
+
+
+def upgrade() -> None:
+    # Колонки фиксируются при входе в autocommit_block, поэтому после сбоя
+    # заполнения или построения индекса миграция запускается повторно.
+    op.execute("ALTER TABLE contacts ADD COLUMN IF NOT EXISTS email_norm VARCHAR(100)")
+    op.execute("ALTER TABLE contacts ADD COLUMN IF NOT EXISTS phone_e164 VARCHAR(16)")
+
+    with op.get_context().autocommit_block():
+        connection = op.get_bind()
+        index_valid = {
+            column: connection.execute(_INDEX_IS_VALID_SQL, {"name": index_name}).scalar()
+            for index_name, column in NORMALIZED_INDEXES
+        }
+        # Колонку с готовым уникальным индексом уже поддерживает приложение.
+        # Повторное заполнение вернуло бы значения дубликатам, сброшенным
+        # в NULL, и упёрлось бы в этот индекс.
+        pending = [column for column, valid in index_valid.items() if not valid]
+
+        if pending:
+            backfill_batch_sql = sa.text(
+                _BACKFILL_BATCH_SQL.format(
+                    assignments=", ".join(
+                        f"{column} = {_NORMALIZED_VALUES_SQL[column]}" for column in pending
+                    )
+                )
+            )
+            last_id = 0
+            while last_id is not None:
+                last_id = connection.execute(
+                    backfill_batch_sql, {"after": last_id, "batch_size": BACKFILL_BATCH_SIZE}
+                ).scalar()
+
+        for column in pending:
+            reset = connection.execute(sa.text(_RESET_DUPLICATES_SQL.format(column=column)))
+            if reset.rowcount:
+                logger.warning(
+                    "contacts.%s: у %s дубликатов значение не заполнено",
+                    column,
+                    reset.rowcount,
+                )
+
+        for index_name, column in NORMALIZED_INDEXES:
+            if index_valid[column] is False:
+                logger.warning("%s: недостроенный индекс удалён и строится заново", index_name)
+                op.drop_index(
+                    index_name,
+                    table_name="contacts",
+                    postgresql_concurrently=True,
+                )
+            op.create_index(
+                index_name,
+                "contacts",
+                [column],
+                unique=True,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_contacts_phone_e164",
+            table_name="contacts",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_contacts_email_norm",
+            table_name="contacts",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.drop_column("contacts", "phone_e164")
+    op.drop_column("contacts", "email_norm")
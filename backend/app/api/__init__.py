@@ -1,9 +1,11 @@
 __all__ = (
     "client_router",
+    "admin_router",
+    "metrics_router",
 )
 
 
 
 from .client_router import router as client_router
-
-
+from .admin_router import router as admin_router
+from .metrics_router import router as metrics_router
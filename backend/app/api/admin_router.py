@@ -0,0 +1,58 @@
+from typing import (
+    Any,
+    Dict,
+)
+
+from fastapi import APIRouter, Response, status
+
+from core import client_cache, count_cache, slow_query_log
+
+
+router = APIRouter(
+    prefix="/admin",
+    tags=["admin"],
+)
+
+
+@router.get("/cache", tags=["admin"], status_code=200)
+async def get_cache_stats() -> Dict[str, Any]:
+    """
+    Возвращает счётчики кеша карточек клиентов текущего процесса.
+
+    Returns:
+        Размер кеша, попадания, промахи, вытеснения и инвалидации.
+    """
+    return client_cache.stats()
+
+
+@router.get("/count-cache", tags=["admin"], status_code=200)
+async def get_count_cache_stats() -> Dict[str, Any]:
+    """
+    Возвращает счётчики кеша точных количеств клиентов текущего процесса.
+
+    Returns:
+        Счётчики кеша, включая число выполненных count(*) (loads)
+        и промахов, дождавшихся чужого подсчёта (coalesced).
+    """
+    return count_cache.stats()
+
+
+@router.get("/slow-queries", tags=["admin"], status_code=200)
+async def get_slow_queries() -> Dict[str, Any]:
+    """
+    Возвращает статистику медленных SQL-запросов текущего процесса.
+
+    Returns:
+        Порог, число видов запросов и по каждому виду отпечаток, типы параметров,
+        количество, суммарное, среднее и максимальное время, эндпоинты и план.
+    """
+    return slow_query_log.stats()
+
+
+@router.delete("/slow-queries", tags=["admin"], status_code=204)
+async def reset_slow_queries() -> Response:
+    """
+    Очищает статистику медленных SQL-запросов текущего процесса.
+    """
+    slow_query_log.reset()
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
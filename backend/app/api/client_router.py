@@ -1,37 +1,71 @@
+import io
 from typing import (
     List,
     Annotated,
+    Literal,
+    Optional,
     )
 
 from fastapi import (
     APIRouter, 
     Depends,
+    Body,
+    Header,
     HTTPException,
+    Query,
+    Request,
+    UploadFile,
     status,
     )
+from fastapi.responses import Response, StreamingResponse
 
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy.exc import DataError, IntegrityError
 
 from schemas import (
     ClientOut,
     ClientIn,
-    ClientUpdate,)
+    ClientUpdate,
+    ClientPage,
+    ClientBulkResult,
+    ImportReport,
+    ClientBulkDeleteResult,
+    ClientSearchPage,
+    ClientBatchGetResult,
+    ClientCount,)
 
 from crud import (fetch_all_clients, 
                   create_client_record, 
                   update_client_record,
                   delete_client_record,
+                  delete_client_records,
+                  fetch_client_json,
+                  fetch_client_etag,
+                  fetch_clients_page_etag,
+                  search_clients,
+                  fetch_client_projection,
+                  fetch_clients_by_ids,
+                  fetch_client_by_contact,
+                  count_clients,
+                  client_projection,
+                  stream_clients_for_export,
+                  create_client_records_bulk,
+                  import_clients_csv,
                   )
 
-from db_connection_async import db_async_session
+from db_connection_async import db_async_session, read_only_route
 from core import (
     DatabaseError,
     UniqueViolationError,
     NotFoundError,
+    BadRequestError,
     crm_logger,
+    settings,
+    stream_export,
+    encode_json,
+    etag_matches,
     )
 
 router = APIRouter(
@@ -40,30 +74,350 @@ router = APIRouter(
                    )
 
 
-@router.get("/", response_model=List[ClientOut], tags=["clients"], status_code=200)
+NOT_MODIFIED_RESPONSE = {304: {"description": "Ресурс не изменился с версии из If-None-Match."}}
+
+CountMode = Literal["exact", "estimate"]
+
+FieldsQuery = Annotated[
+    Optional[str],
+    Query(
+        description=(
+            "Поля ClientOut через запятую, например id,name,sur_name или id,contacts.email; "
+            "contacts — все поля контакта. По умолчанию все поля."
+        ),
+    ),
+]
+
+
+@router.get(
+    "/",
+    response_model=ClientPage,
+    tags=["clients"],
+    status_code=200,
+    responses=NOT_MODIFIED_RESPONSE,
+)
 async def get_all_clients(
     session: Annotated[
         AsyncSession,
-        Depends(db_async_session.session_get)
+        Depends(db_async_session.read_session_get)
     ],
+    limit: Annotated[
+        int,
+        Query(ge=1, le=settings.pagination.max_limit)
+    ] = settings.pagination.default_limit,
+    after: Annotated[Optional[str], Query()] = None,
+    fields: FieldsQuery = None,
+    total: Annotated[
+        Optional[CountMode],
+        Query(description="Добавить заголовок X-Total-Count: точное количество или оценку")
+    ] = None,
+    if_none_match: Annotated[Optional[str], Header()] = None,
   ):
     """
-    Получает всех клиентов из базы данных.
-    
+    Получает страницу клиентов из базы данных.
+
+    Страница читается с реплики, если они настроены (см. DataBaseConnect.read_session_get).
+    Строки кодируются в JSON напрямую через orjson; response_model только
+    описывает ответ в OpenAPI.
+    ETag страницы строится из (id, update_at_day) её клиентов и параметров
+    страницы, поэтому проверка If-None-Match стоит одного index-only scan
+    и выполняется до выборки строк (см. fetch_clients_page_etag).
+
+    Args:
+        session: Асинхронная сессия SQLAlchemy для чтения.
+        limit: Количество клиентов на странице, не больше серверного предела.
+        after: Курсор next_cursor с предыдущей страницы.
+        fields: Поля клиентов в ответе, по умолчанию все.
+        total: Если передан, общее количество клиентов возвращается
+            в заголовке X-Total-Count (см. GET /clients/count).
+        if_none_match: ETag страницы из предыдущего ответа.
+
     Returns:
-        List[ClientOut]: Список всех клиентов.
+        ClientPage: Клиенты страницы и курсор следующей страницы,
+        либо пустой ответ 304, если страница не изменилась.
 
     Raises:
+        BadRequestError: Если передан некорректный курсор или неизвестное поле.
         DatabaseError: Если произошла ошибка при работе с базой данных.
     """
     try:
-        all_clients = await fetch_all_clients(session=session)
+        # ETag читается до строк: если между запросами прошла запись,
+        # ETag окажется старше данных и следующий опрос просто получит 200.
+        projection = client_projection(fields)
+        etag = await fetch_clients_page_etag(
+            session=session, limit=limit, after=after, projection=projection
+        )
+        if etag_matches(if_none_match, etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
 
-        return all_clients
+        clients, next_cursor = await fetch_all_clients(
+            session=session, limit=limit, after=after, projection=projection
+        )
+        headers = {"ETag": etag}
+        if total is not None:
+            headers["X-Total-Count"] = str(await count_clients(session=session, mode=total))
+
+        return Response(
+            content=encode_json({"items": clients, "next_cursor": next_cursor}),
+            media_type="application/json",
+            headers=headers,
+        )
+    except ValueError as error:
+        crm_logger.error("Некорректный курсор пагинации или набор полей %s", error)
+        raise BadRequestError(detail=str(error))
     except ConnectionRefusedError as error:
-        crm_logger.error(f"Ошибка подключения к бд {error}")
+        crm_logger.error("Ошибка подключения к бд %s", error)
         raise DatabaseError(detail="Ошибка сервера")
    
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+
+@router.get(
+    "/export",
+    tags=["clients"],
+    response_class=StreamingResponse,
+    status_code=200,
+    responses={
+        200: {
+            "content": {media_type: {} for media_type in EXPORT_MEDIA_TYPES.values()},
+            "description": "Поток клиентов с контактами в выбранном формате.",
+        }
+    },
+)
+async def export_clients(
+    request: Request,
+    export_format: Annotated[
+        Literal["ndjson", "csv"],
+        Query(alias="format")
+    ] = "ndjson",
+):
+    """
+    Выгружает всех клиентов с контактами потоком NDJSON или CSV.
+
+    Сессия для чтения открывается внутри генератора ответа и живёт, пока поток
+    не будет отправлен целиком; строки читаются серверным курсором пачками.
+
+    Args:
+        request: Запрос, по которому определяется, можно ли читать с реплики.
+        export_format: Формат выгрузки: ndjson (по умолчанию) или csv.
+
+    Returns:
+        StreamingResponse: Потоковый ответ с выгрузкой.
+    """
+
+    primary = db_async_session.prefers_primary(request)
+
+    async def body():
+        try:
+            async with db_async_session.read_session(primary=primary) as session:
+                batches = stream_clients_for_export(
+                    session=session, batch_size=settings.export.batch_size
+                )
+                async for chunk in stream_export(batches, export_format):
+                    yield chunk
+        except ConnectionRefusedError as error:
+            crm_logger.error("Ошибка подключения к бд %s", error)
+            raise
+
+    return StreamingResponse(
+        body(),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={
+            "Content-Disposition": f'attachment; filename="clients.{export_format}"'
+        },
+    )
+
+
+@router.get("/search", tags=["clients"], response_model=ClientSearchPage, status_code=200)
+async def search_clients_route(
+    session: Annotated[AsyncSession, Depends(db_async_session.read_session_get)],
+    q: Annotated[str, Query(min_length=2, max_length=100)],
+    limit: Annotated[
+        int,
+        Query(ge=1, le=settings.pagination.max_limit)
+    ] = settings.pagination.default_limit,
+    offset: Annotated[
+        int,
+        Query(ge=0, le=settings.pagination.search_max_offset)
+    ] = 0,
+    fields: FieldsQuery = None,
+):
+    """
+    Ищет клиентов по части имени, фамилии, отчества, email или телефона.
+
+    Как и список, ответ кодируется orjson без построения моделей ClientSearchPage.
+
+    Args:
+        session: Асинхронная сессия SQLAlchemy для чтения.
+        q: Строка поиска.
+        limit: Количество клиентов на странице.
+        offset: Смещение страницы, не больше серверного предела.
+        fields: Поля клиентов в ответе, по умолчанию все.
+
+    Returns:
+        ClientSearchPage: Найденные клиенты по убыванию релевантности и смещение следующей страницы.
+
+    Raises:
+        BadRequestError: Если передано неизвестное поле.
+        DatabaseError: Если произошла ошибка при работе с базой данных.
+    """
+    try:
+        projection = client_projection(fields)
+        clients, next_offset = await search_clients(
+            session=session, query=q, limit=limit, offset=offset, projection=projection
+        )
+        return Response(
+            content=encode_json({"items": clients, "next_offset": next_offset}),
+            media_type="application/json",
+        )
+    except ValueError as error:
+        raise BadRequestError(detail=str(error))
+    except ConnectionRefusedError as error:
+        crm_logger.error("Ошибка подключения к бд %s", error)
+        raise DatabaseError(detail="Ошибка сервера")
+
+
+@router.get("/count", tags=["clients"], response_model=ClientCount, status_code=200)
+async def count_clients_route(
+    session: Annotated[AsyncSession, Depends(db_async_session.read_session_get)],
+    mode: CountMode = "exact",
+):
+    """
+    Возвращает количество клиентов для пейджеров.
+
+    Точное количество кешируется на settings.pagination.count_cache_ttl_seconds,
+    оценка берётся из статистики таблицы и не зависит от её размера.
+
+    Args:
+        session: Асинхронная сессия SQLAlchemy для чтения.
+        mode: "exact" — точное количество, "estimate" — быстрая оценка.
+
+    Returns:
+        ClientCount: Количество клиентов и способ подсчёта.
+
+    Raises:
+        DatabaseError: Если произошла ошибка при работе с базой данных.
+    """
+    try:
+        return ClientCount(total=await count_clients(session=session, mode=mode), mode=mode)
+    except ConnectionRefusedError as error:
+        crm_logger.error("Ошибка подключения к бд %s", error)
+        raise DatabaseError(detail="Ошибка сервера")
+
+
+@router.get("/by-contact", tags=["clients"], response_model=ClientOut, status_code=200)
+async def get_client_by_contact(
+    session: Annotated[AsyncSession, Depends(db_async_session.read_session_get)],
+    email: Annotated[Optional[str], Query(max_length=100)] = None,
+    phone: Annotated[Optional[str], Query(max_length=32)] = None,
+    fields: FieldsQuery = None,
+):
+    """
+    Находит клиента по email или телефону.
+
+    Сравнение не зависит от регистра email и формата телефона
+    ("+7 (999) 000-00-00", "89990000000" и "9990000000" — один номер)
+    и выполняется одним поиском по уникальному индексу.
+
+    Args:
+        session: Асинхронная сессия SQLAlchemy для чтения.
+        email: Email клиента.
+        phone: Телефон клиента.
+        fields: Поля клиента в ответе, по умолчанию все.
+
+    Returns:
+        ClientOut: Данные найденного клиента.
+
+    Raises:
+        BadRequestError: Если не передан ровно один из email и phone или передано неизвестное поле.
+        NotFoundError: Если клиент не найден.
+        DatabaseError: Если произошла ошибка при работе с базой данных.
+    """
+    try:
+        projection = client_projection(fields)
+        client = await fetch_client_by_contact(
+            session=session, email=email, phone=phone, projection=projection
+        )
+    except ValueError as error:
+        raise BadRequestError(detail=str(error))
+    except ConnectionRefusedError as error:
+        crm_logger.error("Ошибка подключения к бд %s", error)
+        raise DatabaseError(detail="Ошибка сервера")
+
+    if client is None:
+        raise NotFoundError("Клиент с такими контактами не найден")
+    return Response(content=encode_json(client), media_type="application/json")
+
+
+@router.get(
+    "/{client_id}",
+    tags=["clients"],
+    response_model=ClientOut,
+    status_code=200,
+    responses=NOT_MODIFIED_RESPONSE,
+)
+async def get_client(
+    client_id: int,
+    session: Annotated[AsyncSession, Depends(db_async_session.session_get)],
+    fields: FieldsQuery = None,
+    if_none_match: Annotated[Optional[str], Header()] = None,
+):
+    """
+    Получает клиента по ID.
+
+    Ответ берётся из кеша процесса, если клиент недавно запрашивался
+    и с тех пор не изменялся. ETag строится из id и update_at_day;
+    при If-None-Match версия проверяется до чтения и сериализации карточки.
+    Неполный набор полей (fields) читается из базы в обход кеша.
+
+    Args:
+        client_id: ID клиента.
+        session: Асинхронная сессия SQLAlchemy.
+        fields: Поля клиента в ответе, по умолчанию все.
+        if_none_match: ETag клиента из предыдущего ответа.
+
+    Returns:
+        ClientOut: Данные клиента либо пустой ответ 304, если клиент не изменился.
+
+    Raises:
+        BadRequestError: Если передано неизвестное поле.
+        NotFoundError: Если клиент с указанным ID не найден.
+        DatabaseError: Если произошла ошибка при работе с базой данных.
+    """
+    try:
+        projection = client_projection(fields)
+    except ValueError as error:
+        raise BadRequestError(detail=str(error))
+
+    try:
+        if fields is not None:
+            etag, payload = await fetch_client_projection(
+                session=session, client_id=client_id, projection=projection
+            )
+            if etag_matches(if_none_match, etag):
+                return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+            return Response(content=payload, media_type="application/json", headers={"ETag": etag})
+
+        if if_none_match:
+            etag = await fetch_client_etag(session=session, client_id=client_id)
+            if etag is None:
+                raise ValueError(f"Клиент с id {client_id} не найден")
+            if etag_matches(if_none_match, etag):
+                return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+        etag, payload = await fetch_client_json(session=session, client_id=client_id)
+        return Response(content=payload, media_type="application/json", headers={"ETag": etag})
+    except ConnectionRefusedError as error:
+        crm_logger.error("Ошибка подключения к бд %s", error)
+        raise DatabaseError(detail="Ошибка сервера")
+    except ValueError as error:
+        crm_logger.error("Ошибка при получении клиента %s", error)
+        raise NotFoundError(f"Клиент с id={client_id} не найден")
+
+
 @router.post("/", tags=["clients"], response_model=ClientOut, status_code=201)
 async def create_client(
     session: Annotated[AsyncSession, Depends(db_async_session.session_get)], 
@@ -86,18 +440,165 @@ async def create_client(
     """
     try:
         new_client = await create_client_record(session=session, new_client_data=data)
-        crm_logger.debug(f"Клиент создан успешно, id клиента: {new_client.id}")
+        crm_logger.debug("Клиент создан успешно, id клиента: %s", new_client.id)
         return new_client
     except ConnectionRefusedError as error:
-      crm_logger.error(f"Ошибка подключения к бд {error}")
+      crm_logger.error("Ошибка подключения к бд %s", error)
       raise DatabaseError(detail="Ошибка сервера")
     except IntegrityError as error:
-        crm_logger.error(f"Ошибка при создании клиента, уникальное поле: {error}")
+        crm_logger.error("Ошибка при создании клиента, уникальное поле: %s", error)
         raise UniqueViolationError(f"Ошибка при создании клиента, уникальное поле: {error}")
 
 
 
-@router.patch("/{client_id}", tags=["clients"], status_code=200)
+@router.post("/bulk", tags=["clients"], response_model=List[ClientBulkResult], status_code=200)
+async def create_clients_bulk(
+    session: Annotated[AsyncSession, Depends(db_async_session.session_get)],
+    data: Annotated[
+        List[ClientIn],
+        Body(min_length=1, max_length=settings.bulk.max_items)
+    ],
+):
+    """
+    Создает клиентов пачкой в одной транзакции.
+
+    Клиенты и контакты вставляются многострочными INSERT ... RETURNING,
+    конфликты уникальности email/телефона возвращаются по каждому элементу.
+
+    Args:
+        session: Асинхронная сессия SQLAlchemy.
+        data: Список данных новых клиентов.
+
+    Returns:
+        List[ClientBulkResult]: Результат по каждому элементу в порядке запроса.
+
+    Raises:
+        DatabaseError: Если произошла ошибка при работе с базой данных.
+    """
+    try:
+        results = await create_client_records_bulk(
+            session=session,
+            new_clients_data=data,
+            batch_size=settings.bulk.batch_size,
+        )
+        created = sum(result.status == "created" for result in results)
+        crm_logger.debug("Массовое создание: создано %s из %s", created, len(results))
+        return results
+    except ConnectionRefusedError as error:
+        crm_logger.error("Ошибка подключения к бд %s", error)
+        raise DatabaseError(detail="Ошибка сервера")
+
+
+@router.post("/batch-get", tags=["clients"], response_model=ClientBatchGetResult, status_code=200)
+@read_only_route
+async def batch_get_clients(
+    session: Annotated[AsyncSession, Depends(db_async_session.read_session_get)],
+    ids: Annotated[
+        List[int],
+        Body(embed=True, min_length=1, max_length=settings.bulk.max_get_ids)
+    ],
+    fields: FieldsQuery = None,
+):
+    """
+    Получает клиентов по списку ID одним запросом.
+
+    Результаты возвращаются в порядке ids, для ненайденных ID found == false.
+
+    Args:
+        session: Асинхронная сессия SQLAlchemy для чтения.
+        ids: ID клиентов, не больше серверного предела.
+        fields: Поля клиентов в ответе, по умолчанию все.
+
+    Returns:
+        ClientBatchGetResult: Результат по каждому запрошенному ID.
+
+    Raises:
+        BadRequestError: Если передано неизвестное поле.
+        DatabaseError: Если произошла ошибка при работе с базой данных.
+    """
+    try:
+        projection = client_projection(fields)
+    except ValueError as error:
+        raise BadRequestError(detail=str(error))
+
+    try:
+        clients = await fetch_clients_by_ids(
+            session=session, client_ids=ids, projection=projection
+        )
+        items = [
+            {"id": client_id, "found": client is not None, "client": client}
+            for client_id, client in zip(ids, clients)
+        ]
+        return Response(content=encode_json({"items": items}), media_type="application/json")
+    except ConnectionRefusedError as error:
+        crm_logger.error("Ошибка подключения к бд %s", error)
+        raise DatabaseError(detail="Ошибка сервера")
+
+
+# Повтор импорта после конфликта уникальности с конкурентной записью.
+IMPORT_ATTEMPTS = 2
+
+
+@router.post("/import", tags=["clients"], response_model=ImportReport, status_code=200)
+async def import_clients(file: UploadFile):
+    """
+    Импортирует клиентов из CSV-файла через COPY.
+
+    Файл разбирается потоково пачками, строки с ошибками и конфликтами
+    уникальности не прерывают импорт и перечисляются в отчёте.
+    Если конкурентная запись заняла email или телефон между проверкой
+    конфликтов и вставкой, импорт один раз повторяется с начала файла.
+
+    Args:
+        file: CSV-файл с заголовком name,sur_name,middle_name,phone_number,email,facebook,vk.
+
+    Returns:
+        ImportReport: Итоги импорта и пропускная способность в строках в секунду.
+
+    Raises:
+        UniqueViolationError: Если конфликт уникальности повторился при повторном импорте.
+        BadRequestError: Если значение из файла не подходит для колонки базы данных.
+        DatabaseError: Если произошла ошибка при работе с базой данных.
+    """
+    for attempt in range(IMPORT_ATTEMPTS):
+        file.file.seek(0)
+        lines = io.TextIOWrapper(file.file, encoding="utf-8-sig", newline="")
+        try:
+            async with db_async_session.engine.begin() as connection:
+                report = await import_clients_csv(
+                    connection=connection,
+                    lines=lines,
+                    chunk_size=settings.csv_import.chunk_size,
+                    max_reported_errors=settings.csv_import.max_reported_errors,
+                )
+            break
+        except IntegrityError as error:
+            if attempt + 1 == IMPORT_ATTEMPTS:
+                crm_logger.error("Ошибка при импорте клиентов, уникальное поле: %s", error)
+                raise UniqueViolationError(
+                    f"Ошибка при импорте клиентов, уникальное поле: {error.orig}"
+                )
+            crm_logger.warning("Конфликт уникальности при импорте, повтор: %s", error)
+        except DataError as error:
+            crm_logger.error("Некорректное значение при импорте клиентов: %s", error)
+            raise BadRequestError(detail=f"Некорректное значение в файле: {error.orig}")
+        except ConnectionRefusedError as error:
+            crm_logger.error("Ошибка подключения к бд %s", error)
+            raise DatabaseError(detail="Ошибка сервера")
+        finally:
+            # Иначе обёртка при сборке мусора закроет файл загрузки.
+            lines.detach()
+
+    crm_logger.debug(
+        "Импорт завершён: %s из %s строк, %s строк/с",
+        report.imported,
+        report.total_rows,
+        report.rows_per_second,
+    )
+    return report
+
+
+@router.patch("/{client_id}", tags=["clients"], response_model=ClientOut, status_code=200)
 async def update_client(
     client_id: int,
     session: Annotated[AsyncSession, Depends(db_async_session.session_get)],
@@ -124,20 +625,67 @@ async def update_client(
     """
     try:
         update_client = await update_client_record(session=session, new_client_data=data, client_id=client_id)
-        crm_logger.debug(f"Клиент с id={client_id} успешно обновлён.")
+        crm_logger.debug("Клиент с id=%s успешно обновлён.", client_id)
         return update_client
     except ConnectionRefusedError as error:
-        crm_logger.error(f"Ошибка подключения к бд {error}")
+        crm_logger.error("Ошибка подключения к бд %s", error)
         raise DatabaseError(detail="Ошибка сервера")
     except ValueError as error:
-        crm_logger.error(f"Ошибка при обновлении клиента {error}")
+        crm_logger.error("Ошибка при обновлении клиента %s", error)
         raise NotFoundError(f"Клиент с id={client_id} не найден")
     except IntegrityError as error:
-        crm_logger.error(f"Ошибка при обновлении клиента, уникальное поле: {error}")
+        crm_logger.error("Ошибка при обновлении клиента, уникальное поле: %s", error)
         raise UniqueViolationError(f"Ошибка при обновлении клиента, уникальное поле: {error}")
 
 
 
+@router.delete("/", tags=["clients"], response_model=ClientBulkDeleteResult, status_code=200)
+async def delete_clients(
+    session: Annotated[AsyncSession, Depends(db_async_session.session_get)],
+    ids: Annotated[
+        List[str],
+        Query(min_length=1, description="ID клиентов: ids=1,2,3 или ids=1&ids=2")
+    ],
+):
+    """
+    Удаляет клиентов по списку ID одним запросом.
+
+    Args:
+        session: Асинхронная сессия SQLAlchemy.
+        ids: ID клиентов через запятую и/или повторяющимся параметром.
+
+    Returns:
+        ClientBulkDeleteResult: Удалённые ID и ID, которых не было в базе.
+
+    Raises:
+        BadRequestError: Если ID некорректны или их больше допустимого.
+        DatabaseError: Если произошла ошибка при работе с базой данных.
+    """
+    try:
+        client_ids = list(dict.fromkeys(
+            int(part) for value in ids for part in value.split(",") if part.strip()
+        ))
+    except ValueError:
+        raise BadRequestError(detail="ids должны быть целыми числами")
+
+    if len(client_ids) > settings.bulk.max_delete_ids:
+        raise BadRequestError(
+            detail=f"Нельзя удалить больше {settings.bulk.max_delete_ids} клиентов за запрос"
+        )
+
+    try:
+        deleted = await delete_client_records(session=session, client_ids=client_ids)
+        crm_logger.debug("Массовое удаление: удалено %s из %s", len(deleted), len(client_ids))
+        deleted_set = set(deleted)
+        return ClientBulkDeleteResult(
+            deleted=[client_id for client_id in client_ids if client_id in deleted_set],
+            not_found=[client_id for client_id in client_ids if client_id not in deleted_set],
+        )
+    except ConnectionRefusedError as error:
+        crm_logger.error("Ошибка подключения к бд %s", error)
+        raise DatabaseError(detail="Ошибка сервера")
+
+
 @router.delete("/{client_id}", tags=["clients"], status_code=204)
 async def delete_client(client_id: int, 
                         session: Annotated[AsyncSession, Depends(db_async_session.session_get)]):
@@ -157,10 +705,10 @@ async def delete_client(client_id: int,
     """
     try:
         await delete_client_record(session=session, client_id=client_id)
-        crm_logger.debug(f"Клиент с id={client_id} успешно удален")
+        crm_logger.debug("Клиент с id=%s успешно удален", client_id)
     except ConnectionRefusedError as error:
-        crm_logger.error(f"Ошибка подключения к бд {error}")
+        crm_logger.error("Ошибка подключения к бд %s", error)
         raise DatabaseError(detail="Ошибка сервера")
     except ValueError as error:
-        crm_logger.error(f"Ошибка при обновлении клиента {error}")
+        crm_logger.error("Ошибка при обновлении клиента %s", error)
         raise NotFoundError(f"Клиент с id={client_id} не найден")
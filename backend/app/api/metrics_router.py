@@ -0,0 +1,19 @@
+from fastapi import APIRouter
+from fastapi.responses import Response
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+
+
+router = APIRouter(tags=["admin"])
+
+
+@router.get("/metrics", tags=["admin"], status_code=200, response_class=Response)
+async def get_metrics() -> Response:
+    """
+    Отдаёт метрики процесса в текстовом формате Prometheus.
+
+    Метрики собираются в каждом воркере отдельно, как и кеш карточек клиентов.
+
+    Returns:
+        Задержки и статусы запросов по маршрутам, время SQL на запрос и состояние пулов соединений.
+    """
+    return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
@@ -0,0 +1,166 @@
+import asyncio
+from typing import Optional
+
+import asyncpg
+from sqlalchemy.engine import make_url
+
+from core import (
+    LruTtlCache,
+    client_cache,
+    crm_logger,
+    settings,
+)
+
+
+class CacheInvalidationListener:
+    """Фоновый слушатель LISTEN/NOTIFY, сбрасывающий записи кеша во всех воркерах.
+
+    Операции записи в crud_clients.py отправляют NOTIFY с ID клиента в той же
+    транзакции, поэтому уведомление приходит только после фиксации изменений.
+    Слушатель держит отдельное соединение asyncpg вне пула SQLAlchemy.
+
+    Кеш сбрасывается целиком, если уведомления могли быть потеряны:
+    после (пере)подключения и при переполнении очереди необработанных уведомлений.
+
+    Args:
+        dsn (str): DSN для asyncpg.
+        channel (str): Имя канала LISTEN.
+        cache (LruTtlCache): Кеш, записи которого нужно инвалидировать.
+        queue_size (int): Предел очереди уведомлений, ожидающих обработки.
+        reconnect_max_delay (float): Максимальная пауза между переподключениями в секундах.
+        health_check_interval (float): Период проверки соединения в секундах.
+    """
+
+    def __init__(
+        self,
+        dsn: str,
+        channel: str,
+        cache: LruTtlCache,
+        queue_size: int = 10000,
+        reconnect_max_delay: float = 30.0,
+        health_check_interval: float = 30.0,
+    ) -> None:
+        self.dsn = dsn
+        self.channel = channel
+        self.cache = cache
+        self.reconnect_max_delay = reconnect_max_delay
+        self.health_check_interval = health_check_interval
+        self._queue: "asyncio.Queue[str]" = asyncio.Queue(maxsize=queue_size)
+        self._overflowed = False
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        """Запускает слушателя в фоновой задаче."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="cache-invalidation-listener")
+            self._task.add_done_callback(self._on_task_done)
+
+    async def stop(self) -> None:
+        """Останавливает слушателя и закрывает его соединение."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def _on_task_done(self, task: asyncio.Task) -> None:
+        """Сообщает, если цикл слушателя завершился не через stop()."""
+        if task.cancelled():
+            return
+        error = task.exception()
+        crm_logger.error(
+            "Слушатель инвалидаций остановился, кеш больше не сбрасывается: %r",
+            error,
+            exc_info=error,
+        )
+
+    def _on_notify(self, connection, pid, channel, payload: str) -> None:
+        """Колбэк asyncpg: ставит ID клиента в очередь обработки."""
+        try:
+            self._queue.put_nowait(payload)
+        except asyncio.QueueFull:
+            self._overflowed = True
+
+    async def _run(self) -> None:
+        """Цикл подключения с экспоненциальной паузой между попытками."""
+        delay = 1.0
+        while True:
+            connection = None
+            try:
+                connection = await asyncpg.connect(self.dsn)
+                lost = asyncio.Event()
+
+                def on_termination(_) -> None:
+                    lost.set()
+                    self._on_notify(None, 0, self.channel, "")
+
+                connection.add_termination_listener(on_termination)
+                await connection.add_listener(self.channel, self._on_notify)
+
+                # Пока соединения не было, уведомления могли потеряться.
+                self.cache.clear()
+                delay = 1.0
+                crm_logger.info("Слушатель инвалидаций подключён к каналу %s", self.channel)
+
+                await self._consume(connection, lost)
+            except (OSError, asyncio.TimeoutError, asyncpg.PostgresError, asyncpg.InterfaceError) as error:
+                crm_logger.warning("Слушатель инвалидаций потерял соединение: %s", error)
+                self.cache.clear()
+            except Exception as error:
+                # Любая другая ошибка тоже не должна останавливать слушателя навсегда.
+                crm_logger.error("Ошибка слушателя инвалидаций: %r", error, exc_info=error)
+                self.cache.clear()
+            finally:
+                if connection is not None and not connection.is_closed():
+                    connection.terminate()
+
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.reconnect_max_delay)
+
+    async def _consume(self, connection: asyncpg.Connection, lost: asyncio.Event) -> None:
+        """Обрабатывает очередь уведомлений, пока соединение живо."""
+        while not lost.is_set():
+            try:
+                payload = await asyncio.wait_for(
+                    self._queue.get(), timeout=self.health_check_interval
+                )
+            except asyncio.TimeoutError:
+                await connection.execute("SELECT 1", timeout=self.health_check_interval)
+                continue
+
+            if lost.is_set():
+                break
+            if self._overflowed:
+                self._flush()
+                continue
+
+            client_ids = {payload}
+            while not self._queue.empty():
+                client_ids.add(self._queue.get_nowait())
+            self.cache.invalidate_many(
+                int(client_id) for client_id in client_ids if client_id.isdigit()
+            )
+
+        raise ConnectionResetError("соединение слушателя закрыто")
+
+    def _flush(self) -> None:
+        """Сбрасывает весь кеш, когда слушатель не успевает за уведомлениями."""
+        while not self._queue.empty():
+            self._queue.get_nowait()
+        self._overflowed = False
+        self.cache.clear()
+        crm_logger.warning("Очередь инвалидаций переполнена, кеш клиентов сброшен целиком")
+
+
+cache_invalidation_listener = CacheInvalidationListener(
+    dsn=make_url(str(settings.db.url))
+    .set(drivername="postgresql")
+    .render_as_string(hide_password=False),
+    channel=settings.cache.notify_channel,
+    cache=client_cache,
+    queue_size=settings.cache.listener_queue_size,
+    reconnect_max_delay=settings.cache.listener_reconnect_max_delay,
+    health_check_interval=settings.cache.listener_health_check_interval,
+)
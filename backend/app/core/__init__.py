@@ -8,6 +8,24 @@ __all__ = (
     "UniqueViolationError",
     "NotFoundError",
     "crm_logger",
+    "BadRequestError",
+    "encode_cursor",
+    "decode_cursor",
+    "stream_export",
+    "encode_json",
+    "client_row_to_dict",
+    "LruTtlCache",
+    "client_cache",
+    "count_cache",
+    "make_etag",
+    "etag_matches",
+    "MetricsMiddleware",
+    "DbTimingMiddleware",
+    "TimedQueuePool",
+    "instrument_engine",
+    "current_db_stats",
+    "SlowQueryLog",
+    "slow_query_log",
 
     )
 
@@ -23,6 +41,36 @@ from .metadata import (
 from .custom_exceptions import (
     DatabaseError,
     UniqueViolationError,
-    NotFoundError
+    NotFoundError,
+    BadRequestError,
     )
 from .logger import crm_logger
+from .pagination import (
+    encode_cursor,
+    decode_cursor,
+)
+from .export import (
+    stream_export,
+    encode_json,
+    client_row_to_dict,
+)
+from .cache import (
+    LruTtlCache,
+    client_cache,
+    count_cache,
+)
+from .etag import (
+    make_etag,
+    etag_matches,
+)
+from .metrics import (
+    MetricsMiddleware,
+    DbTimingMiddleware,
+    TimedQueuePool,
+    instrument_engine,
+    current_db_stats,
+)
+from .slow_queries import (
+    SlowQueryLog,
+    slow_query_log,
+)
@@ -0,0 +1,191 @@
+import asyncio
+import time
+from collections import OrderedDict
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Optional,
+    Tuple,
+)
+
+from .config import settings
+
+
+class LruTtlCache:
+    """
+    Ограниченный по размеру кеш в памяти процесса с вытеснением LRU и временем жизни записей.
+
+    Кеш не потокобезопасен и рассчитан на использование из одного event loop.
+    Счётчик generation увеличивается при каждой инвалидации: значение,
+    прочитанное из базы до инвалидации, не попадёт в кеш (см. set).
+
+    Attributes:
+        max_size (int): Максимальное количество записей, 0 отключает кеш.
+        ttl (float): Время жизни записи в секундах.
+        hits (int): Количество попаданий.
+        misses (int): Количество промахов, включая просроченные записи.
+        evictions (int): Количество записей, вытесненных по LRU.
+        expirations (int): Количество записей, удалённых по истечении TTL.
+        invalidations (int): Количество записей, удалённых инвалидацией.
+        loads (int): Количество загрузок значений через get_or_load.
+        coalesced (int): Промахи get_or_load, дождавшиеся чужой загрузки вместо своей.
+    """
+
+    def __init__(self, max_size: int, ttl: float) -> None:
+        """
+        Инициализирует кеш.
+
+        Args:
+            max_size: Максимальное количество записей, 0 отключает кеш.
+            ttl: Время жизни записи в секундах.
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+        self.loads = 0
+        self.coalesced = 0
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._loading: Dict[Hashable, asyncio.Lock] = {}
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Возвращает значение по ключу или None, если его нет или оно просрочено."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self.expirations += 1
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    async def get_or_load(self, key: Hashable, load: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Возвращает значение из кеша, а при промахе загружает его через load.
+
+        Одновременные промахи по одному ключу не запускают параллельных загрузок:
+        первый вызов загружает значение, остальные ждут его на блокировке ключа
+        и берут результат из кеша. Если загрузка упала, следующий ожидающий
+        загружает значение сам. При отключённом кеше load вызывается всегда.
+
+        Args:
+            key: Ключ записи.
+            load: Корутинная функция, читающая значение из базы.
+
+        Returns:
+            Значение из кеша или только что загруженное.
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+        if self.max_size <= 0:
+            self.loads += 1
+            return await load()
+
+        lock = self._loading.setdefault(key, asyncio.Lock())
+        try:
+            async with lock:
+                value = self._fresh(key)
+                if value is not None:
+                    self.coalesced += 1
+                    return value
+                generation = self.generation
+                self.loads += 1
+                value = await load()
+                self.set(key, value, generation)
+                return value
+        finally:
+            if not lock.locked() and self._loading.get(key) is lock:
+                del self._loading[key]
+
+    def _fresh(self, key: Hashable) -> Optional[Any]:
+        """Возвращает непросроченное значение, не меняя счётчики и порядок LRU."""
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            return None
+        return entry[1]
+
+    def set(self, key: Hashable, value: Any, generation: Optional[int] = None) -> None:
+        """
+        Сохраняет значение, вытесняя самые давние записи при переполнении.
+
+        Args:
+            key: Ключ записи.
+            value: Значение.
+            generation: Значение generation, снятое до чтения value из базы.
+                Если с тех пор была инвалидация, запись не сохраняется.
+        """
+        if self.max_size <= 0:
+            return
+        if generation is not None and generation != self.generation:
+            return
+
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        """Удаляет запись по ключу."""
+        self.invalidate_many((key,))
+
+    def invalidate_many(self, keys: Iterable[Hashable]) -> None:
+        """Удаляет записи по списку ключей."""
+        self.generation += 1
+        for key in keys:
+            if self._entries.pop(key, None) is not None:
+                self.invalidations += 1
+
+    def clear(self) -> None:
+        """Удаляет все записи."""
+        self.generation += 1
+        self.invalidations += len(self._entries)
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Возвращает счётчики кеша для подбора его размера."""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+            "loads": self.loads,
+            "coalesced": self.coalesced,
+        }
+
+
+client_cache = LruTtlCache(
+    max_size=settings.cache.max_size,
+    ttl=settings.cache.ttl_seconds,
+)
+
+# Точные количества строк для пейджеров: записи не инвалидируются
+# и живут count_cache_ttl_seconds, устаревание в пределах TTL допустимо.
+# Читается через get_or_load, чтобы по истечении TTL count(*) выполнялся
+# один раз на процесс, а не в каждом одновременном запросе.
+count_cache = LruTtlCache(
+    max_size=8 if settings.pagination.count_cache_ttl_seconds > 0 else 0,
+    ttl=settings.pagination.count_cache_ttl_seconds,
+)
@@ -1,4 +1,6 @@
-from pydantic import BaseModel, PostgresDsn
+from typing import List, Literal
+
+from pydantic import BaseModel, Field, PostgresDsn
 
 from dotenv import load_dotenv
 
@@ -16,17 +18,166 @@ class DataBaseConfig(BaseModel):
 
     Attributes:
         url (PostgresDsn): URL подключения к базе данных.
-        echo (bool): Флаг, определяющий необходимость вывода SQL-запросов в консоль. По умолчанию: True.
+        echo (bool): Флаг, определяющий необходимость вывода всех SQL-запросов в консоль, только для отладки.
+            Для поиска дорогих запросов есть журнал медленных запросов (SlowQueryConfig). По умолчанию: False.
         echo_pool (bool): Флаг, определяющий необходимость вывода информации о пуле соединений. По умолчанию: False.
         pool_size (int): Размер пула соединений. По умолчанию: 50.
         max_overflow (int): Максимальное количество дополнительных соединений сверх размера пула. По умолчанию: 10.
+        replica_urls (List[PostgresDsn]): URL реплик только для чтения. По умолчанию: пусто, все запросы идут в основную базу.
+        replica_retry_seconds (float): На сколько секунд недоступная реплика исключается из ротации. По умолчанию: 30.
+        read_your_writes_seconds (int): Сколько секунд после изменения данных чтения клиента идут
+            в основную базу. Должно превышать типичное отставание реплик. По умолчанию: 5.
     """
 
     url: PostgresDsn
-    echo: bool = True
+    echo: bool = False
     echo_pool: bool = False
     pool_size: int = 50
     max_overflow: int = 10
+    replica_urls: List[PostgresDsn] = []
+    replica_retry_seconds: float = 30.0
+    read_your_writes_seconds: int = 5
+
+
+class PaginationConfig(BaseModel):
+    """Настройки постраничной выдачи списков.
+
+    Attributes:
+        default_limit (int): Размер страницы, если клиент не передал limit. По умолчанию: 50.
+        max_limit (int): Жёсткий серверный предел размера страницы. По умолчанию: 500.
+        search_max_offset (int): Максимальное смещение в выдаче поиска. По умолчанию: 1000.
+        search_branch_limit (int): Сколько кандидатов не больше берётся из каждого индекса
+            поиска перед ранжированием; дальше этих кандидатов выдача поиска не
+            листается. По умолчанию: 200.
+        count_cache_ttl_seconds (float): Сколько секунд точное количество клиентов берётся
+            из кеша вместо повторного count(*), 0 отключает кеш. По умолчанию: 10.
+    """
+
+    default_limit: int = 50
+    max_limit: int = 500
+    search_max_offset: int = 1000
+    search_branch_limit: int = 200
+    count_cache_ttl_seconds: float = 10.0
+
+
+class ExportConfig(BaseModel):
+    """Настройки потоковой выгрузки клиентов.
+
+    Attributes:
+        batch_size (int): Количество строк, читаемых из серверного курсора за одну выборку
+            и отправляемых одним фрагментом ответа. По умолчанию: 1000.
+    """
+
+    batch_size: int = 1000
+
+
+class BulkConfig(BaseModel):
+    """Настройки массового создания клиентов.
+
+    Attributes:
+        batch_size (int): Количество строк в одном многострочном INSERT. По умолчанию: 1000.
+        max_items (int): Максимальное количество клиентов в одном запросе. По умолчанию: 50000.
+        max_delete_ids (int): Максимальное количество id в одном массовом удалении. По умолчанию: 10000.
+        max_get_ids (int): Максимальное количество id в одном запросе batch-get. По умолчанию: 1000.
+    """
+
+    batch_size: int = 1000
+    max_items: int = 50000
+    max_delete_ids: int = 10000
+    max_get_ids: int = 1000
+
+
+class ImportConfig(BaseModel):
+    """Настройки импорта клиентов из CSV через COPY.
+
+    Attributes:
+        chunk_size (int): Количество строк CSV, разбираемых и отправляемых через COPY за раз. По умолчанию: 10000.
+        max_reported_errors (int): Сколько отклонённых строк перечислять в отчёте. По умолчанию: 100.
+    """
+
+    chunk_size: int = 10000
+    max_reported_errors: int = 100
+
+
+class CacheConfig(BaseModel):
+    """Настройки кеша карточек клиентов в памяти процесса.
+
+    Attributes:
+        max_size (int): Максимальное количество клиентов в кеше, 0 отключает кеш. По умолчанию: 10000.
+        ttl_seconds (float): Время жизни записи в секундах. По умолчанию: 60.
+        notify_channel (str): Канал LISTEN/NOTIFY для инвалидации между воркерами. По умолчанию: client_changed.
+        listener_enabled (bool): Запускать ли слушателя инвалидаций в lifespan. По умолчанию: True.
+        listener_queue_size (int): Сколько уведомлений может ждать обработки, прежде чем кеш
+            будет сброшен целиком. По умолчанию: 10000.
+        listener_reconnect_max_delay (float): Максимальная пауза между попытками переподключения
+            в секундах. По умолчанию: 30.
+        listener_health_check_interval (float): Период проверки соединения слушателя в секундах. По умолчанию: 30.
+    """
+
+    max_size: int = 10000
+    ttl_seconds: float = 60.0
+    notify_channel: str = "client_changed"
+    listener_enabled: bool = True
+    listener_queue_size: int = 10000
+    listener_reconnect_max_delay: float = 30.0
+    listener_health_check_interval: float = 30.0
+
+
+class MetricsConfig(BaseModel):
+    """Настройки метрик Prometheus.
+
+    Attributes:
+        enabled (bool): Подключать ли MetricsMiddleware и эндпоинт /metrics. По умолчанию: True.
+        db_timing_headers (bool): Добавлять ли в ответы заголовки X-DB-Queries и Server-Timing
+            (DbTimingMiddleware). По умолчанию: True.
+    """
+
+    enabled: bool = True
+    db_timing_headers: bool = True
+
+
+class SlowQueryConfig(BaseModel):
+    """Настройки журнала медленных SQL-запросов.
+
+    Attributes:
+        enabled (bool): Отслеживать ли медленные запросы. По умолчанию: True.
+        threshold_ms (float): Запрос дольше этого порога в миллисекундах считается медленным. По умолчанию: 200.
+        explain (bool): Снимать ли план первого медленного запроса каждого вида. По умолчанию: True.
+        explain_analyze (bool): Снимать план SELECT через EXPLAIN ANALYZE, то есть выполнять
+            запрос повторно в откатываемой транзакции. По умолчанию: False.
+        explain_timeout_seconds (float): statement_timeout для EXPLAIN в секундах. По умолчанию: 5.
+        max_fingerprints (int): Сколько видов запросов хранить в статистике. По умолчанию: 500.
+    """
+
+    enabled: bool = True
+    threshold_ms: float = Field(default=200.0, ge=0.0)
+    explain: bool = True
+    explain_analyze: bool = False
+    explain_timeout_seconds: float = 5.0
+    max_fingerprints: int = 500
+
+
+class LoggingConfig(BaseModel):
+    """Настройки логирования crm_logger.
+
+    Attributes:
+        level (str): Минимальный уровень записей. По умолчанию: DEBUG.
+        format (str): Формат записей: text или json (одна строка JSON на запись). По умолчанию: text.
+        file_path (str): Путь к файлу лога. По умолчанию: logs/crm_app.log.
+        rate_limit_per_second (float): Сколько одинаковых сообщений (по шаблону) в секунду
+            записывается после исчерпания запаса, 0 отключает ограничение. По умолчанию: 5.
+        rate_limit_burst (int): Запас одинаковых сообщений до включения ограничения. По умолчанию: 50.
+        debug_sample_rate (float): Доля записываемых сообщений DEBUG от 0 до 1. По умолчанию: 1.
+        summary_interval_seconds (float): Период сводки о подавленных сообщениях. По умолчанию: 10.
+    """
+
+    level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = "DEBUG"
+    format: Literal["text", "json"] = "text"
+    file_path: str = "logs/crm_app.log"
+    rate_limit_per_second: float = 5.0
+    rate_limit_burst: int = 50
+    debug_sample_rate: float = Field(default=1.0, ge=0.0, le=1.0)
+    summary_interval_seconds: float = 10.0
 
 
 class Settings(BaseSettings):
@@ -39,6 +190,14 @@ class Settings(BaseSettings):
         model_config (SettingsConfigDict): Конфигурация модели настроек.
             Определяет файл конфигурации (.env), а также чувствительность к регистру имен параметров.
         db (DataBaseConfig): Конфигурация подключения к базе данных.
+        pagination (PaginationConfig): Настройки постраничной выдачи.
+        export (ExportConfig): Настройки потоковой выгрузки.
+        bulk (BulkConfig): Настройки массового создания клиентов.
+        csv_import (ImportConfig): Настройки импорта клиентов из CSV.
+        cache (CacheConfig): Настройки кеша карточек клиентов.
+        metrics (MetricsConfig): Настройки метрик Prometheus.
+        logging (LoggingConfig): Настройки логирования.
+        slow_queries (SlowQueryConfig): Настройки журнала медленных SQL-запросов.
     """
 
     model_config = SettingsConfigDict(
@@ -50,6 +209,14 @@ class Settings(BaseSettings):
     )
 
     db: DataBaseConfig
+    pagination: PaginationConfig = PaginationConfig()
+    export: ExportConfig = ExportConfig()
+    bulk: BulkConfig = BulkConfig()
+    csv_import: ImportConfig = ImportConfig()
+    cache: CacheConfig = CacheConfig()
+    metrics: MetricsConfig = MetricsConfig()
+    logging: LoggingConfig = LoggingConfig()
+    slow_queries: SlowQueryConfig = SlowQueryConfig()
 
 
 settings = Settings()
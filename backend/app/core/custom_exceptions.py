@@ -64,4 +64,22 @@ class NotFoundError(HTTPException):
             headers: Дополнительные заголовки HTTP-ответа
         """
 
-        super().__init__(status_code=status.HTTP_404_NOT_FOUND, detail=detail, headers=headers)
\ No newline at end of file
+        super().__init__(status_code=status.HTTP_404_NOT_FOUND, detail=detail, headers=headers)
+
+class BadRequestError(HTTPException):
+    """
+    Исключение, которое используется, когда параметры запроса некорректны.
+
+    Возвращает HTTP-ответ со статусом 400 (Неверный запрос).
+    """
+
+    def __init__(self, detail = None, headers: Optional[dict] = None):
+        """
+        Инициализирует исключение BadRequestError.
+
+        Args:
+            detail: Подробное описание ошибки.
+            headers: Дополнительные заголовки HTTP-ответа
+        """
+
+        super().__init__(status_code=status.HTTP_400_BAD_REQUEST, detail=detail, headers=headers)
@@ -0,0 +1,39 @@
+import hashlib
+from typing import (
+    Any,
+    Optional,
+)
+
+
+def make_etag(*parts: Any) -> str:
+    """Строит сильный ETag из частей, однозначно определяющих версию ресурса.
+
+    Args:
+        parts: Значения, изменение любого из которых меняет ETag.
+
+    Returns:
+        ETag в кавычках, например "3f2a9c0d1b7e4a55".
+    """
+    digest = hashlib.blake2b(repr(parts).encode(), digest_size=8).hexdigest()
+    return f'"{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Проверяет заголовок If-None-Match по правилам слабого сравнения RFC 9110.
+
+    Args:
+        if_none_match: Значение заголовка If-None-Match или None.
+        etag: Текущий ETag ресурса.
+
+    Returns:
+        True, если клиенту можно ответить 304 Not Modified.
+    """
+    if not if_none_match:
+        return False
+
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    if "*" in candidates:
+        return True
+    return etag.removeprefix("W/") in (
+        candidate.removeprefix("W/") for candidate in candidates
+    )
@@ -0,0 +1,86 @@
+import csv
+import datetime
+import io
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    List,
+    Mapping,
+    Sequence,
+)
+
+import orjson
+
+
+CLIENT_FIELDS = ("id", "name", "sur_name", "middle_name", "create_at_day", "update_at_day")
+CONTACT_FIELDS = ("phone_number", "email", "facebook", "vk")
+EXPORT_FIELDS = CLIENT_FIELDS + CONTACT_FIELDS
+
+
+def encode_json(value: Any) -> bytes:
+    """Кодирует словари и списки из строк выборки в JSON через orjson.
+
+    datetime без часового пояса записывается в ISO 8601, как и в ответах Pydantic.
+    """
+    return orjson.dumps(value)
+
+
+def client_row_to_dict(row: Mapping[str, Any]) -> Dict[str, Any]:
+    """Собирает словарь в формате ClientOut из плоской строки выборки.
+
+    Args:
+        row: Строка с колонками клиента и его контакта.
+
+    Returns:
+        Словарь с полями клиента и вложенным словарём contacts.
+    """
+    client = {field: row[field] for field in CLIENT_FIELDS}
+    client["contacts"] = {field: row[field] for field in CONTACT_FIELDS}
+    client["contacts"]["client_id"] = row["id"]
+    return client
+
+
+def encode_ndjson(rows: Sequence[Mapping[str, Any]]) -> bytes:
+    """Кодирует пачку строк в NDJSON: по одному объекту ClientOut на строку."""
+    return b"".join(encode_json(client_row_to_dict(row)) + b"\n" for row in rows)
+
+
+def encode_csv(rows: Sequence[Mapping[str, Any]]) -> bytes:
+    """Кодирует пачку строк в CSV с колонками EXPORT_FIELDS, без заголовка."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow(
+            [
+                value.isoformat() if isinstance(value, datetime.datetime) else value
+                for value in (row[field] for field in EXPORT_FIELDS)
+            ]
+        )
+    return buffer.getvalue().encode()
+
+
+async def stream_export(
+    batches: AsyncIterator[List[Mapping[str, Any]]],
+    export_format: str,
+) -> AsyncIterator[bytes]:
+    """Превращает поток пачек строк в поток байтов ответа.
+
+    Каждая пачка кодируется одним фрагментом, поэтому размер памяти
+    ограничен размером пачки, а не всей выгрузки.
+
+    Args:
+        batches: Асинхронный итератор пачек строк из базы данных.
+        export_format: Формат выгрузки: "ndjson" или "csv".
+
+    Yields:
+        bytes: Очередной фрагмент тела ответа.
+    """
+    if export_format == "csv":
+        yield (",".join(EXPORT_FIELDS) + "\r\n").encode()
+        encode = encode_csv
+    else:
+        encode = encode_ndjson
+
+    async for batch in batches:
+        yield encode(batch)
@@ -1,63 +1,259 @@
+import atexit
+import json
 import logging
-from pathlib import Path
+import queue
 import sys
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener
+from pathlib import Path
+from typing import (
+    Dict,
+    Hashable,
+    List,
+    Tuple,
+)
+
+from .config import settings
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Форматирует запись лога в одну строку JSON для сборщиков логов.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "module": record.module,
+            "function": record.funcName,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
 
-LOG_FILE_PATH = Path("logs/crm_app.log")
-LOG_FILE_PATH.parent.mkdir(parents=True, exist_ok=True)
+
+class LogRateLimiter(logging.Filter):
+    """
+    Фильтр, ограничивающий поток одинаковых сообщений.
+
+    Ключ сообщения — уровень и шаблон до подстановки аргументов, поэтому
+    "Ошибка подключения к бд %s" с разными ошибками считается одним сообщением.
+    На каждый ключ действует token bucket: burst сообщений сразу и rate в секунду
+    дальше. Отброшенные сообщения считаются и забираются pop_suppressed для сводки.
+    Записи DEBUG дополнительно прореживаются: проходит каждая round(1 / debug_sample_rate)-я.
+
+    Attributes:
+        rate (float): Сообщений в секунду на ключ, 0 отключает ограничение.
+        burst (int): Запас сообщений на ключ.
+        debug_sample_rate (float): Доля пропускаемых записей DEBUG от 0 до 1.
+    """
+
+    def __init__(self, rate: float, burst: int, debug_sample_rate: float = 1.0):
+        super().__init__()
+        self.rate = rate
+        self.burst = burst
+        self.debug_sample_rate = debug_sample_rate
+        self._debug_every = round(1 / debug_sample_rate) if debug_sample_rate > 0 else 0
+        self._buckets: Dict[Hashable, Tuple[float, float]] = {}
+        self._debug_seen: Dict[Hashable, int] = {}
+        self._suppressed: Dict[Hashable, List] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        key = (record.levelno, record.msg)
+        with self._lock:
+            if record.levelno == logging.DEBUG and self._debug_every != 1:
+                seen = self._debug_seen.get(key, 0)
+                self._debug_seen[key] = seen + 1
+                if not self._debug_every or seen % self._debug_every:
+                    return False
+
+            if self.rate <= 0:
+                return True
+
+            now = time.monotonic()
+            tokens, updated_at = self._buckets.get(key, (self.burst, now))
+            tokens = min(self.burst, tokens + (now - updated_at) * self.rate)
+            if tokens >= 1:
+                self._buckets[key] = (tokens - 1, now)
+                return True
+
+            self._buckets[key] = (tokens, now)
+            suppressed = self._suppressed.get(key)
+            if suppressed is None:
+                self._suppressed[key] = [1, record]
+            else:
+                suppressed[0] += 1
+            return False
+
+    def pop_suppressed(self) -> List[Tuple[int, logging.LogRecord]]:
+        """
+        Возвращает и обнуляет счётчики отброшенных сообщений.
+
+        Returns:
+            Пары (количество, первая отброшенная запись) по каждому ключу.
+        """
+        with self._lock:
+            suppressed = [(count, record) for count, record in self._suppressed.values()]
+            self._suppressed.clear()
+        return suppressed
 
 
 class CrmLogger:
     """
     Класс для настройки и управления логированием приложения.
+
+    Логгер только кладёт записи в очередь через QueueHandler, а запись в stdout
+    и в файл выполняет QueueListener в фоновом потоке, поэтому обработчики
+    запросов не ждут ввода-вывода. Сообщения принимают аргументы в стиле %:
+    строка собирается, только если уровень записи проходит фильтр.
+
+    Одинаковые сообщения ограничиваются LogRateLimiter; раз в summary_interval
+    секунд фоновый поток пишет, сколько похожих сообщений было подавлено.
     """
 
-    def __init__(self, logger_name: str, log_file_path: str = "logs/crm_app.log"):
+    def __init__(
+        self,
+        logger_name: str,
+        log_file_path: str = "logs/crm_app.log",
+        level: str = "DEBUG",
+        json_format: bool = False,
+        rate_limit: float = 0.0,
+        rate_limit_burst: int = 50,
+        debug_sample_rate: float = 1.0,
+        summary_interval: float = 10.0,
+    ):
         """
-        Инициализирует логгер
+        Инициализирует логгер и запускает фоновый поток записи.
+
+        Args:
+            logger_name: Имя логгера.
+            log_file_path: Путь к файлу лога.
+            level: Минимальный уровень записей (DEBUG, INFO, WARNING, ERROR, CRITICAL).
+            json_format: Писать записи в формате JSON вместо текстового.
+            rate_limit: Сообщений в секунду на один шаблон сообщения, 0 отключает ограничение.
+            rate_limit_burst: Сколько одинаковых сообщений пропускается подряд до ограничения.
+            debug_sample_rate: Доля записываемых сообщений DEBUG от 0 до 1.
+            summary_interval: Период сводки о подавленных сообщениях в секундах.
         """
 
         self.log_file_path = Path(log_file_path)
         self.log_file_path.parent.mkdir(parents=True, exist_ok=True)
         self.logger = logging.getLogger(logger_name)
-        self.logger.setLevel(logging.DEBUG)
-        formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(module)s - %(funcName)s - %(message)s")
+        self.logger.setLevel(level.upper())
+        self.logger.propagate = False
+        if json_format:
+            formatter = JsonFormatter()
+        else:
+            formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(module)s - %(funcName)s - %(message)s")
 
         stdout_handler = logging.StreamHandler(sys.stdout)
         stdout_handler.setFormatter(formatter)
-        self.logger.addHandler(stdout_handler)
 
         file_handler = logging.FileHandler(self.log_file_path)
         file_handler.setFormatter(formatter)
-        self.logger.addHandler(file_handler)
 
-    def log(self, level: int, message: str):
+        self.rate_limiter = LogRateLimiter(
+            rate=rate_limit,
+            burst=rate_limit_burst,
+            debug_sample_rate=debug_sample_rate,
+        )
+        self.logger.addFilter(self.rate_limiter)
+
+        log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        self.queue_handler = QueueHandler(log_queue)
+        self.logger.addHandler(self.queue_handler)
+        self.listener = QueueListener(log_queue, stdout_handler, file_handler)
+        self.listener.start()
+
+        self.summary_interval = summary_interval
+        self._stopped = threading.Event()
+        self._summary_thread = threading.Thread(
+            target=self._report_suppressed, name="crm-log-summary", daemon=True
+        )
+        self._summary_thread.start()
+        atexit.register(self.stop)
+
+    def _report_suppressed(self) -> None:
+        while not self._stopped.wait(self.summary_interval):
+            self.flush_suppressed()
+
+    def flush_suppressed(self) -> None:
+        """
+        Записывает сводку по сообщениям, подавленным с прошлой сводки.
+        """
+        for count, record in self.rate_limiter.pop_suppressed():
+            summary = self.logger.makeRecord(
+                self.logger.name,
+                record.levelno,
+                record.pathname,
+                record.lineno,
+                "Подавлено похожих сообщений: %s (%s)",
+                (count, record.msg),
+                None,
+                record.funcName,
+            )
+            # Сводка минует фильтры логгера и сразу уходит в очередь.
+            self.queue_handler.handle(summary)
+
+    def stop(self) -> None:
+        """
+        Дописывает сводку и оставшиеся в очереди записи и останавливает фоновые потоки.
+        """
+        if not self._stopped.is_set():
+            self._stopped.set()
+            self.flush_suppressed()
+            self.listener.stop()
+
+    def log(self, level: int, message: str, *args, **kwargs):
         """
         Логирует сообщение с указанным уровнем.
 
         Args:
             level: Уровень логирования (DEBUG, INFO, WARNING, ERROR, CRITICAL).
-            message: Сообщение для логирования.
+            message: Сообщение для логирования, может содержать подстановки %s.
+            *args: Аргументы подстановок, форматируются только для записанных сообщений.
         """
-        self.logger.log(level, message)
+        # stacklevel вызывающего отсчитывается от его собственного кадра, а не от этого метода.
+        kwargs["stacklevel"] = kwargs.get("stacklevel", 1) + 1
+        self.logger.log(level, message, *args, **kwargs)
+
+    def debug(self, message: str, *args, **kwargs):
+        kwargs["stacklevel"] = kwargs.get("stacklevel", 1) + 1
+        self.log(logging.DEBUG, message, *args, **kwargs)
 
-    def debug(self, message: str):
-       self.log(logging.DEBUG, message)
+    def info(self, message: str, *args, **kwargs):
+        kwargs["stacklevel"] = kwargs.get("stacklevel", 1) + 1
+        self.log(logging.INFO, message, *args, **kwargs)
 
-    def info(self, message: str):
-        self.log(logging.INFO, message)
 
+    def warning(self, message: str, *args, **kwargs):
+        kwargs["stacklevel"] = kwargs.get("stacklevel", 1) + 1
+        self.log(logging.WARNING, message, *args, **kwargs)
 
-    def warning(self, message: str):
-        self.log(logging.WARNING, message)
 
+    def error(self, message: str, *args, **kwargs):
+        kwargs["stacklevel"] = kwargs.get("stacklevel", 1) + 1
+        self.log(logging.ERROR, message, *args, **kwargs)
 
-    def error(self, message: str):
-        self.log(logging.ERROR, message)
 
+    def critical(self, message: str, *args, **kwargs):
+        kwargs["stacklevel"] = kwargs.get("stacklevel", 1) + 1
+        self.log(logging.CRITICAL, message, *args, **kwargs)
 
-    def critical(self, message: str):
-      self.log(logging.CRITICAL, message)
-    
 
 
-crm_logger = CrmLogger("crm_logger_app")
\ No newline at end of file
+crm_logger = CrmLogger(
+    "crm_logger_app",
+    log_file_path=settings.logging.file_path,
+    level=settings.logging.level,
+    json_format=settings.logging.format == "json",
+    rate_limit=settings.logging.rate_limit_per_second,
+    rate_limit_burst=settings.logging.rate_limit_burst,
+    debug_sample_rate=settings.logging.debug_sample_rate,
+    summary_interval=settings.logging.summary_interval_seconds,
+)
@@ -9,7 +9,11 @@ tags_metadata: List[Dict[str, str]] = [
     {
         "name": "clients",
         "description": "Маршруты для работы с клиентами в crm-системе",
-    }
+    },
+    {
+        "name": "admin",
+        "description": "Служебные маршруты: состояние кешей и диагностика",
+    },
 ]
 
 
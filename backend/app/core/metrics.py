@@ -0,0 +1,285 @@
+import time
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    Optional,
+    Tuple,
+)
+
+from prometheus_client import (
+    REGISTRY,
+    Counter,
+    Gauge,
+    Histogram,
+)
+from prometheus_client.core import GaugeMetricFamily
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+REQUESTS_TOTAL = Counter(
+    "http_requests_total",
+    "Количество обработанных HTTP-запросов.",
+    ["method", "route", "status"],
+)
+REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "Время обработки HTTP-запроса, включая отправку тела ответа.",
+    ["method", "route"],
+)
+REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "Количество HTTP-запросов, обрабатываемых в данный момент.",
+    ["method"],
+)
+REQUEST_DB_DURATION = Histogram(
+    "http_request_db_seconds",
+    "Суммарное время SQL-запросов за один HTTP-запрос.",
+    ["method", "route"],
+)
+REQUEST_DB_QUERIES = Histogram(
+    "http_request_db_queries",
+    "Количество SQL-запросов за один HTTP-запрос.",
+    ["method", "route"],
+    buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100),
+)
+POOL_WAIT = Histogram(
+    "db_pool_wait_seconds",
+    "Время получения соединения из пула, включая открытие нового соединения.",
+    ["pool"],
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+
+
+class DbStats:
+    """Счётчики SQL-запросов одного HTTP-запроса.
+
+    Attributes:
+        queries (int): Количество выполненных запросов.
+        duration (float): Суммарное время выполнения в секундах.
+        scope (Optional[dict]): ASGI scope запроса, по нему определяется эндпоинт.
+    """
+
+    __slots__ = ("queries", "duration", "scope")
+
+    def __init__(self, scope: Optional[dict] = None) -> None:
+        self.queries = 0
+        self.duration = 0.0
+        self.scope = scope
+
+
+# Объект кладёт в контекст MetricsMiddleware, а наполняют обработчики событий
+# движка: SQLAlchemy выполняет запросы в greenlet с контекстом вызывающей задачи.
+_db_stats: ContextVar[Optional[DbStats]] = ContextVar("db_stats", default=None)
+
+
+def current_db_stats() -> Optional[DbStats]:
+    """Возвращает счётчики SQL текущего HTTP-запроса или None вне запроса."""
+    return _db_stats.get()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    context._query_started = time.perf_counter()
+
+
+# Обработчик выполненного запроса: (движок, текст, параметры, контекст, длительность в секундах).
+QueryObserver = Callable[[AsyncEngine, str, Any, Any, float], None]
+
+
+class TimedQueuePool(AsyncAdaptedQueuePool):
+    """Пул соединений, измеряющий время выдачи соединения.
+
+    Имя пула для метки берётся из pool_logging_name движка.
+    """
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            POOL_WAIT.labels(self.logging_name or "default").observe(
+                time.perf_counter() - started
+            )
+
+
+class PoolCollector:
+    """Снимает состояние пулов соединений в момент запроса /metrics."""
+
+    def __init__(self) -> None:
+        self.engines: Dict[str, AsyncEngine] = {}
+
+    def collect(self) -> Iterator[GaugeMetricFamily]:
+        size = GaugeMetricFamily("db_pool_size", "Размер пула соединений.", labels=["pool"])
+        checked_out = GaugeMetricFamily(
+            "db_pool_checked_out", "Соединения, выданные из пула.", labels=["pool"]
+        )
+        checked_in = GaugeMetricFamily(
+            "db_pool_checked_in", "Свободные соединения в пуле.", labels=["pool"]
+        )
+        overflow = GaugeMetricFamily(
+            "db_pool_overflow",
+            "Соединения сверх pool_size (отрицательное значение — ещё не открытые).",
+            labels=["pool"],
+        )
+        for name, engine in self.engines.items():
+            pool = engine.pool
+            size.add_metric([name], pool.size())
+            checked_out.add_metric([name], pool.checkedout())
+            checked_in.add_metric([name], pool.checkedin())
+            overflow.add_metric([name], pool.overflow())
+        yield from (size, checked_out, checked_in, overflow)
+
+
+pool_collector = PoolCollector()
+REGISTRY.register(pool_collector)
+
+
+def instrument_engine(
+    engine: AsyncEngine, name: str, on_query: Optional[QueryObserver] = None
+) -> None:
+    """Подключает движок к метрикам: время SQL в запросе и состояние пула.
+
+    Каждый запрос замеряется одной парой обработчиков событий; on_query
+    получает уже измеренную длительность и не ставит своих обработчиков.
+
+    Args:
+        engine: Асинхронный движок, созданный с poolclass=TimedQueuePool.
+        name: Метка пула в метриках.
+        on_query: Дополнительный обработчик каждого выполненного запроса,
+            например SlowQueryLog.observe.
+    """
+
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+        duration = time.perf_counter() - context._query_started
+        stats = _db_stats.get()
+        if stats is not None:
+            stats.queries += 1
+            stats.duration += duration
+        if on_query is not None:
+            on_query(engine, statement, parameters, context, duration)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine.sync_engine, "after_cursor_execute", after_cursor_execute)
+    pool_collector.engines[name] = engine
+
+
+# Дочерние серии с метками кешируются: .labels() берёт блокировку и проверяет метки
+# на каждом вызове. Маршрут в метке — шаблон пути, поэтому набор ключей ограничен.
+@lru_cache(maxsize=None)
+def _route_metrics(method: str, path: str) -> Tuple[Any, Any, Any]:
+    return (
+        REQUEST_DURATION.labels(method, path),
+        REQUEST_DB_DURATION.labels(method, path),
+        REQUEST_DB_QUERIES.labels(method, path),
+    )
+
+
+@lru_cache(maxsize=None)
+def _requests_counter(method: str, path: str, status: int) -> Any:
+    return REQUESTS_TOTAL.labels(method, path, str(status))
+
+
+@lru_cache(maxsize=None)
+def _in_progress_gauge(method: str) -> Any:
+    return REQUESTS_IN_PROGRESS.labels(method)
+
+
+class MetricsMiddleware:
+    """ASGI-middleware, собирающее метрики HTTP-запросов.
+
+    Маршрут в метках — шаблон пути FastAPI (например /clients/{client_id}),
+    который роутер кладёт в scope["route"], поэтому число серий не зависит
+    от значений параметров. Запросы без маршрута попадают в UNMATCHED_ROUTE.
+    """
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+
+        async def send_with_status(message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        # DbTimingMiddleware внутри цепочки продолжит заполнять эти же счётчики.
+        stats = DbStats(scope)
+        token = _db_stats.set(stats)
+        in_progress = _in_progress_gauge(method)
+        in_progress.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            duration = time.perf_counter() - started
+            in_progress.dec()
+            _db_stats.reset(token)
+
+            route = scope.get("route")
+            path = getattr(route, "path", UNMATCHED_ROUTE)
+            request_duration, db_duration, db_queries = _route_metrics(method, path)
+            _requests_counter(method, path, status_code).inc()
+            request_duration.observe(duration)
+            db_duration.observe(stats.duration)
+            db_queries.observe(stats.queries)
+
+
+class DbTimingMiddleware:
+    """ASGI-middleware, сообщающее клиенту SQL-нагрузку запроса в заголовках ответа.
+
+    X-DB-Queries — количество SQL-запросов, Server-Timing — время обработки
+    (app) и суммарное время SQL (db) в миллисекундах, которые браузер
+    показывает во вкладке Network. Значения снимаются в момент отправки
+    заголовков, поэтому у потоковых ответов учитываются только запросы
+    до первого фрагмента. Использует счётчики MetricsMiddleware, если оно
+    подключено, иначе заводит свои.
+    """
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = None
+        stats = _db_stats.get()
+        if stats is None:
+            stats = DbStats(scope)
+            token = _db_stats.set(stats)
+        started = time.perf_counter()
+
+        async def send_with_timing(message) -> None:
+            if message["type"] == "http.response.start":
+                app_ms = (time.perf_counter() - started) * 1000
+                headers = list(message.get("headers", ()))
+                headers.append((b"x-db-queries", str(stats.queries).encode()))
+                headers.append(
+                    (
+                        b"server-timing",
+                        f"app;dur={app_ms:.2f}, db;dur={stats.duration * 1000:.2f}".encode(),
+                    )
+                )
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            if token is not None:
+                _db_stats.reset(token)
@@ -0,0 +1,41 @@
+import base64
+import binascii
+import datetime
+import json
+from typing import Tuple
+
+
+def encode_cursor(create_at_day: datetime.datetime, client_id: int) -> str:
+    """Кодирует позицию последней записи страницы в непрозрачный курсор.
+
+    Args:
+        create_at_day: Дата создания последнего клиента на странице.
+        client_id: ID последнего клиента на странице.
+
+    Returns:
+        Строка курсора в формате base64url без выравнивания.
+    """
+    raw = json.dumps([create_at_day.isoformat(), client_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime.datetime, int]:
+    """Восстанавливает позицию (create_at_day, id) из курсора.
+
+    Args:
+        cursor: Строка, ранее полученная из encode_cursor.
+
+    Returns:
+        Кортеж из даты создания и ID клиента.
+
+    Raises:
+        ValueError: Если курсор повреждён или имеет неверный формат.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        create_at_day, client_id = json.loads(base64.urlsafe_b64decode(padded))
+        if not isinstance(client_id, int):
+            raise ValueError(client_id)
+        return datetime.datetime.fromisoformat(create_at_day), client_id
+    except (binascii.Error, TypeError, ValueError) as error:
+        raise ValueError(f"Некорректный курсор: {cursor}") from error
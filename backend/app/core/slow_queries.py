@@ -0,0 +1,280 @@
+import asyncio
+import contextvars
+import hashlib
+import json
+import re
+from datetime import datetime, timezone
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Set,
+)
+
+from sqlalchemy.engine.interfaces import ExecuteStyle
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from .config import settings
+from .logger import crm_logger
+from .metrics import current_db_stats
+
+
+EXPLAINABLE = ("SELECT", "INSERT", "UPDATE", "DELETE", "WITH")
+MAX_ENDPOINTS = 10
+MAX_PARALLEL_EXPLAINS = 2
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_BIND_PARAMETER = re.compile(r"\$\d+")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_VALUE_LIST = re.compile(r"\(\s*\?(?:::\w+)?(?:\s*,\s*\?(?:::\w+)?)+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+# Запросы EXPLAIN самого журнала не должны попадать в журнал.
+_explaining: contextvars.ContextVar[bool] = contextvars.ContextVar("explaining", default=False)
+
+
+def fingerprint(statement: str) -> str:
+    """
+    Приводит текст запроса к виду, общему для всех его вызовов.
+
+    Литералы и параметры заменяются на ?, списки значений IN (...) любой
+    длины сворачиваются в (...), пробелы схлопываются.
+    """
+    text = _STRING_LITERAL.sub("?", statement)
+    text = _BIND_PARAMETER.sub("?", text)
+    text = _NUMBER.sub("?", text)
+    text = _VALUE_LIST.sub("(...)", text)
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+def _value_shape(value: Any) -> str:
+    if isinstance(value, (str, bytes)):
+        return f"{type(value).__name__}({len(value)})"
+    if isinstance(value, (list, tuple, set, frozenset)):
+        inner = _value_shape(next(iter(value))) if value else ""
+        return f"{type(value).__name__}[{inner}]({len(value)})"
+    return type(value).__name__
+
+
+def parameter_shapes(parameters: Any) -> List[str]:
+    """Описывает параметры запроса типами и длинами, не раскрывая значений."""
+    if isinstance(parameters, dict):
+        return [f"{name}: {_value_shape(value)}" for name, value in parameters.items()]
+    return [_value_shape(value) for value in parameters or ()]
+
+
+class SlowQueryEntry:
+    """
+    Статистика одного вида медленных запросов.
+
+    Attributes:
+        id (str): Короткий хеш отпечатка запроса.
+        statement (str): Отпечаток запроса (см. fingerprint).
+        parameters (List[str]): Типы параметров первого медленного вызова.
+        count (int): Количество медленных вызовов.
+        total_ms (float): Суммарное время медленных вызовов.
+        max_ms (float): Самый долгий вызов.
+        endpoints (Set[str]): Эндпоинты, из которых запрос был медленным.
+        first_seen (datetime): Время первого медленного вызова.
+        plan (Optional[Any]): План из EXPLAIN (FORMAT JSON), когда он получен.
+    """
+
+    __slots__ = (
+        "id", "statement", "parameters", "count", "total_ms", "max_ms", "endpoints", "first_seen", "plan",
+    )
+
+    def __init__(self, entry_id: str, statement: str, parameters: List[str]) -> None:
+        self.id = entry_id
+        self.statement = statement
+        self.parameters = parameters
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.endpoints: Set[str] = set()
+        self.first_seen = datetime.now(timezone.utc)
+        self.plan: Optional[Any] = None
+
+    def add(self, duration_ms: float, endpoint: Optional[str]) -> None:
+        self.count += 1
+        self.total_ms += duration_ms
+        self.max_ms = max(self.max_ms, duration_ms)
+        if endpoint is not None and len(self.endpoints) < MAX_ENDPOINTS:
+            self.endpoints.add(endpoint)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "statement": self.statement,
+            "parameters": self.parameters,
+            "count": self.count,
+            "total_ms": round(self.total_ms, 2),
+            "mean_ms": round(self.total_ms / self.count, 2) if self.count else 0.0,
+            "max_ms": round(self.max_ms, 2),
+            "endpoints": sorted(self.endpoints),
+            "first_seen": self.first_seen.isoformat(timespec="seconds"),
+            "plan": self.plan,
+        }
+
+
+class SlowQueryLog:
+    """
+    Журнал медленных SQL-запросов процесса.
+
+    Журнал получает каждый запрос с длительностью, уже измеренной
+    обработчиками метрик (см. instrument_engine), но разбирает только
+    те, что дольше порога: первый медленный вызов каждого вида пишется в лог
+    с типами параметров, временем и эндпоинтом, а его план снимается
+    EXPLAIN в фоновой задаче на отдельном соединении пула, не задерживая
+    ответ. Повторные вызовы только пополняют статистику по отпечатку.
+
+    Attributes:
+        threshold_ms (float): Порог медленного запроса в миллисекундах.
+        explain (bool): Снимать ли планы.
+        explain_analyze (bool): Снимать ли планы SELECT с ANALYZE (запрос выполняется повторно).
+        explain_timeout (float): statement_timeout для EXPLAIN в секундах.
+        max_fingerprints (int): Предел числа видов запросов в статистике.
+        dropped (int): Медленные вызовы, не попавшие в статистику из-за предела.
+    """
+
+    def __init__(
+        self,
+        threshold_ms: float,
+        explain: bool = True,
+        explain_analyze: bool = False,
+        explain_timeout: float = 5.0,
+        max_fingerprints: int = 500,
+    ) -> None:
+        self.threshold_ms = threshold_ms
+        self.explain = explain
+        self.explain_analyze = explain_analyze
+        self.explain_timeout = explain_timeout
+        self.max_fingerprints = max_fingerprints
+        self.dropped = 0
+        self._entries: Dict[str, SlowQueryEntry] = {}
+        self._explain_tasks: Set[asyncio.Task] = set()
+
+    def observe(
+        self, engine: AsyncEngine, statement: str, parameters: Any, context: Any, duration: float
+    ) -> None:
+        """Проверяет выполненный запрос; подключается через instrument_engine(on_query=...).
+
+        Args:
+            engine: Движок, выполнивший запрос.
+            statement: Текст запроса.
+            parameters: Параметры запроса.
+            context: Контекст выполнения SQLAlchemy.
+            duration: Длительность запроса в секундах, измеренная метриками.
+        """
+        duration_ms = duration * 1000
+        if duration_ms >= self.threshold_ms and not _explaining.get():
+            if context.execute_style is ExecuteStyle.EXECUTEMANY:
+                parameters = parameters[0]
+            self._record(engine, statement, parameters, duration_ms)
+
+    def _record(self, engine: AsyncEngine, statement: str, parameters: Any, duration_ms: float) -> None:
+        stats = current_db_stats()
+        scope = stats.scope if stats is not None else None
+        endpoint = None
+        if scope is not None:
+            endpoint = f"{scope['method']} {getattr(scope.get('route'), 'path', scope['path'])}"
+
+        normalized = fingerprint(statement)
+        entry_id = hashlib.sha1(normalized.encode()).hexdigest()[:12]
+        entry = self._entries.get(entry_id)
+        if entry is None:
+            if len(self._entries) >= self.max_fingerprints:
+                self.dropped += 1
+                return
+            entry = SlowQueryEntry(entry_id, normalized, parameter_shapes(parameters))
+            self._entries[entry_id] = entry
+            crm_logger.warning(
+                "Медленный SQL-запрос %s: %.1f мс, эндпоинт %s, параметры %s\n%s",
+                entry_id,
+                duration_ms,
+                endpoint or "вне HTTP-запроса",
+                entry.parameters,
+                statement.strip(),
+            )
+            if self.explain:
+                self._schedule_explain(engine, entry, statement, parameters)
+        entry.add(duration_ms, endpoint)
+
+    def _schedule_explain(
+        self, engine: AsyncEngine, entry: SlowQueryEntry, statement: str, parameters: Any
+    ) -> None:
+        if not statement.lstrip().upper().startswith(EXPLAINABLE):
+            return
+        if len(self._explain_tasks) >= MAX_PARALLEL_EXPLAINS:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        # Пустой контекст: запросы EXPLAIN не должны попадать в счётчики
+        # X-DB-Queries и метрики HTTP-запроса, из которого запущена задача.
+        task = contextvars.Context().run(
+            loop.create_task, self._explain(engine, entry, statement, parameters)
+        )
+        self._explain_tasks.add(task)
+        task.add_done_callback(self._explain_tasks.discard)
+
+    async def _explain(
+        self, engine: AsyncEngine, entry: SlowQueryEntry, statement: str, parameters: Any
+    ) -> None:
+        _explaining.set(True)
+        analyze = self.explain_analyze and statement.lstrip().upper().startswith("SELECT")
+        options = "ANALYZE, BUFFERS, FORMAT JSON" if analyze else "FORMAT JSON"
+        if isinstance(parameters, dict):
+            parameters = tuple(parameters.values())
+        try:
+            async with engine.connect() as connection:
+                transaction = await connection.begin()
+                await connection.exec_driver_sql(
+                    f"SET LOCAL statement_timeout = {int(self.explain_timeout * 1000)}"
+                )
+                result = await connection.exec_driver_sql(
+                    f"EXPLAIN ({options}) {statement}", [tuple(parameters or ())]
+                )
+                plan = result.scalar_one()
+                await transaction.rollback()
+        except (DBAPIError, OSError) as error:
+            crm_logger.warning("Не удалось получить план запроса %s: %s", entry.id, error)
+            return
+
+        entry.plan = json.loads(plan) if isinstance(plan, str) else plan
+        crm_logger.info(
+            "План медленного запроса %s: %s", entry.id, json.dumps(entry.plan, ensure_ascii=False)
+        )
+
+    async def close(self) -> None:
+        """Отменяет незавершённые EXPLAIN перед закрытием пулов соединений."""
+        tasks = list(self._explain_tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def stats(self) -> Dict[str, Any]:
+        """Возвращает статистику медленных запросов по убыванию суммарного времени."""
+        entries = sorted(self._entries.values(), key=lambda entry: entry.total_ms, reverse=True)
+        return {
+            "threshold_ms": self.threshold_ms,
+            "fingerprints": len(entries),
+            "dropped": self.dropped,
+            "queries": [entry.to_dict() for entry in entries],
+        }
+
+    def reset(self) -> None:
+        """Очищает статистику; следующие медленные запросы снова попадут в лог."""
+        self._entries.clear()
+        self.dropped = 0
+
+
+slow_query_log = SlowQueryLog(
+    threshold_ms=settings.slow_queries.threshold_ms,
+    explain=settings.slow_queries.explain,
+    explain_analyze=settings.slow_queries.explain_analyze,
+    explain_timeout=settings.slow_queries.explain_timeout_seconds,
+    max_fingerprints=settings.slow_queries.max_fingerprints,
+)
@@ -4,6 +4,20 @@ __all__ = (
     "delete_client_record",
     "update_client_record",
     "create_client_record",
+    "stream_clients_for_export",
+    "create_client_records_bulk",
+    "import_clients_csv",
+    "delete_client_records",
+    "fetch_client_json",
+    "fetch_client_etag",
+    "fetch_clients_page_etag",
+    "search_clients",
+    "fetch_client_projection",
+    "fetch_clients_by_ids",
+    "fetch_client_by_contact",
+    "count_clients",
+    "client_projection",
+    "ClientProjection",
 )
 
 from .crud_clients import (
@@ -11,4 +25,17 @@ from .crud_clients import (
     create_client_record,
     update_client_record,
     delete_client_record,
-    )
\ No newline at end of file
+    stream_clients_for_export,
+    create_client_records_bulk,
+    delete_client_records,
+    fetch_client_json,
+    fetch_client_etag,
+    fetch_clients_page_etag,
+    search_clients,
+    fetch_client_projection,
+    fetch_clients_by_ids,
+    fetch_client_by_contact,
+    count_clients,
+    )
+from .projection import ClientProjection, client_projection
+from .crud_import import import_clients_csv
@@ -1,130 +1,892 @@
-from typing import List
+import json
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Tuple,
+)
 from datetime import datetime, timezone
 
-from sqlalchemy import select, Result
+from sqlalchemy import (
+    select,
+    insert,
+    update,
+    literal,
+    literal_column,
+    cast,
+    func,
+    union,
+    delete,
+    or_,
+    any_,
+    bindparam,
+    tuple_,
+    RowMapping,
+    Integer,
+    String,
+    text,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, insert as pg_insert
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from models import Client, Contact
+from models import (
+    Client,
+    Contact,
+    normalize_email,
+    normalize_phone,
+)
+
+from .projection import ClientProjection, FULL_PROJECTION
 
 from schemas import (
     ClientOut,
     ClientIn,
     ClientUpdate,
+    ClientBulkResult,
 )
 
 from core import (
     DatabaseError,
+    encode_cursor,
+    decode_cursor,
+    client_cache,
+    count_cache,
+    make_etag,
+    settings,
+    encode_json,
+    client_row_to_dict,
+)
+
+_CLIENT_COLUMNS = (
+    Client.id,
+    Client.name,
+    Client.sur_name,
+    Client.middle_name,
+    Client.create_at_day,
+    Client.update_at_day,
 )
+_CONTACT_COLUMNS = (
+    Contact.client_id,
+    Contact.phone_number,
+    Contact.email,
+    Contact.facebook,
+    Contact.vk,
+)
+
+
+def _notify_client_changed():
+    """Выражение pg_notify для RETURNING: уведомляет другие воркеры об изменении клиента.
+
+    Уведомление доставляется слушателям только после COMMIT и не требует
+    отдельного обращения к базе.
+    """
+    return func.pg_notify(
+        settings.cache.notify_channel, cast(Client.id, String)
+    ).label("notified")
+
+
+def _build_client_out(
+    client_row: Mapping[str, Any], contact_row: Optional[Mapping[str, Any]]
+) -> ClientOut:
+    """Собирает ClientOut из колонок, возвращённых RETURNING/SELECT."""
+    return ClientOut.model_validate({**client_row, "contacts": contact_row})
+
+
+def _client_out_from_row(row: Mapping[str, Any]) -> ClientOut:
+    """Собирает ClientOut из плоской строки с колонками клиента и контакта."""
+    return _build_client_out(
+        {column.key: row[column.key] for column in _CLIENT_COLUMNS},
+        {column.key: row[column.key] for column in _CONTACT_COLUMNS},
+    )
+
 
 async def fetch_all_clients(
     session: AsyncSession,
-) -> List[ClientOut]:
-    """Получает всех клиентов из базы данных.
+    limit: int,
+    after: Optional[str] = None,
+    projection: ClientProjection = FULL_PROJECTION,
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """Получает страницу клиентов, упорядоченных по (create_at_day, id).
+
+    Используется keyset-пагинация: следующая страница начинается строго после
+    позиции из курсора, поэтому стоимость запроса не зависит от глубины листания.
+
+    Клиенты читаются плоским Core-запросом и возвращаются словарями в формате
+    ClientOut, готовыми к encode_json: ORM-объекты и модели Pydantic не создаются.
+    Выбираются только колонки из projection; contacts присоединяется, только
+    если запрошены поля контакта.
+
+    Args:
+        session: Асинхронная сессия SQLAlchemy.
+        limit: Максимальное количество клиентов на странице.
+        after: Курсор, полученный с предыдущей страницы.
+        projection: План выборки полей, по умолчанию все поля ClientOut.
+
+    Returns:
+        Кортеж из списка словарей ClientOut и курсора следующей страницы
+        (None, если страница последняя).
+
+    Raises:
+        ValueError: Если курсор некорректен.
+    """
+    stmt = (
+        select(*projection.columns)
+        .order_by(Client.create_at_day, Client.id)
+        .limit(limit + 1)
+    )
+    if projection.needs_contacts:
+        stmt = stmt.outerjoin(Contact, Contact.client_id == Client.id)
+
+    if after is not None:
+        last_create_at_day, last_id = decode_cursor(after)
+        stmt = stmt.where(
+            tuple_(Client.create_at_day, Client.id) > (last_create_at_day, last_id)
+        )
+
+    rows = (await session.execute(stmt)).mappings().all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(last["create_at_day"], last["id"])
+
+    return [projection.to_dict(row) for row in rows], next_cursor
+
+
+async def fetch_clients_by_ids(
+    session: AsyncSession,
+    client_ids: List[int],
+    projection: ClientProjection = FULL_PROJECTION,
+) -> List[Optional[Dict[str, Any]]]:
+    """Получает клиентов по списку ID одним запросом WHERE id = ANY(:ids).
+
+    Массив ID передаётся одним параметром, поэтому текст запроса не зависит
+    от их количества и план переиспользуется.
+
+    Args:
+        session: Асинхронная сессия SQLAlchemy.
+        client_ids: ID клиентов, повторы допускаются.
+        projection: План выборки полей, по умолчанию все поля ClientOut.
+
+    Returns:
+        Словари ClientOut в порядке client_ids, None на месте ненайденных ID.
+    """
+    stmt = select(*projection.columns).where(
+        Client.id == any_(bindparam("client_ids", list(set(client_ids)), type_=ARRAY(Integer)))
+    )
+    if projection.needs_contacts:
+        stmt = stmt.outerjoin(Contact, Contact.client_id == Client.id)
+
+    found = {
+        row["id"]: projection.to_dict(row)
+        for row in (await session.execute(stmt)).mappings()
+    }
+    return [found.get(client_id) for client_id in client_ids]
+
+
+async def fetch_client_by_contact(
+    session: AsyncSession,
+    email: Optional[str] = None,
+    phone: Optional[str] = None,
+    projection: ClientProjection = FULL_PROJECTION,
+) -> Optional[Dict[str, Any]]:
+    """Находит клиента по email или телефону в любом написании.
+
+    Значение нормализуется так же, как при записи, и ищется по уникальному
+    индексу contacts.email_norm или contacts.phone_e164; клиент читается
+    по первичному ключу в том же запросе.
+
+    Args:
+        session: Асинхронная сессия SQLAlchemy.
+        email: Email клиента.
+        phone: Телефон клиента в любом формате.
+        projection: План выборки полей, по умолчанию все поля ClientOut.
+
+    Returns:
+        Словарь ClientOut или None, если клиент не найден.
+
+    Raises:
+        ValueError: Если передан не ровно один из email и phone
+            или значение не удалось нормализовать.
+    """
+    if (email is None) == (phone is None):
+        raise ValueError("Укажите ровно один параметр: email или phone")
+
+    if email is not None:
+        column, value = Contact.email_norm, normalize_email(email)
+    else:
+        column, value = Contact.phone_e164, normalize_phone(phone)
+    if value is None:
+        raise ValueError("Некорректное значение email или phone")
+
+    stmt = (
+        select(*projection.columns)
+        .select_from(Contact)
+        .join(Client, Client.id == Contact.client_id)
+        .where(column == value)
+    )
+    row = (await session.execute(stmt)).mappings().one_or_none()
+    return projection.to_dict(row) if row is not None else None
+
+
+def _client_etag(client_id: int, create_at_day: datetime, update_at_day: Optional[datetime]) -> str:
+    """ETag карточки клиента: меняется при каждом обновлении (update_at_day)."""
+    return make_etag("client", client_id, update_at_day or create_at_day)
+
+
+async def fetch_client_etag(session: AsyncSession, client_id: int) -> Optional[str]:
+    """Возвращает текущий ETag клиента без чтения и сериализации карточки.
+
+    При попадании в кеш ETag берётся из него, иначе выполняется
+    один поиск по первичному ключу.
+
+    Args:
+        session: Асинхронная сессия SQLAlchemy.
+        client_id: ID клиента.
+
+    Returns:
+        ETag клиента или None, если клиент не найден.
+    """
+    cached = client_cache.get(client_id)
+    if cached is not None:
+        return cached[0]
+
+    row = (
+        await session.execute(
+            select(Client.create_at_day, Client.update_at_day).where(Client.id == client_id)
+        )
+    ).one_or_none()
+
+    if row is None:
+        return None
+    return _client_etag(client_id, row.create_at_day, row.update_at_day)
+
+
+async def fetch_client_json(session: AsyncSession, client_id: int) -> Tuple[str, bytes]:
+    """Возвращает карточку клиента в виде сериализованного JSON ClientOut.
+
+    Сначала проверяется кеш процесса; при промахе клиент с контактом читается
+    одним запросом, сериализуется orjson и кладётся в кеш вместе с ETag.
+
+    Args:
+        session: Асинхронная сессия SQLAlchemy.
+        client_id: ID клиента.
+
+    Returns:
+        Кортеж из ETag и JSON-представления ClientOut в байтах.
+
+    Raises:
+        ValueError: Если клиент с указанным ID не найден.
+    """
+    cached = client_cache.get(client_id)
+    if cached is not None:
+        return cached
+
+    generation = client_cache.generation
+    row = (
+        await session.execute(
+            select(*_CLIENT_COLUMNS, *_CONTACT_COLUMNS)
+            .outerjoin(Contact, Contact.client_id == Client.id)
+            .where(Client.id == client_id)
+        )
+    ).mappings().one_or_none()
+
+    if row is None:
+        raise ValueError(f"Клиент с id {client_id} не найден")
+
+    cached = (
+        _client_etag(client_id, row["create_at_day"], row["update_at_day"]),
+        encode_json(client_row_to_dict(row)),
+    )
+    client_cache.set(client_id, cached, generation=generation)
+    return cached
+
+
+async def fetch_client_projection(
+    session: AsyncSession, client_id: int, projection: ClientProjection
+) -> Tuple[str, bytes]:
+    """Возвращает выбранные поля карточки клиента в виде JSON.
+
+    Кеш процесса хранит только полные карточки, поэтому неполный набор полей
+    всегда читается из базы; ETag включает набор полей.
+
+    Args:
+        session: Асинхронная сессия SQLAlchemy.
+        client_id: ID клиента.
+        projection: План выборки полей.
+
+    Returns:
+        Кортеж из ETag и JSON выбранных полей в байтах.
+
+    Raises:
+        ValueError: Если клиент с указанным ID не найден.
+    """
+    stmt = select(*projection.columns).where(Client.id == client_id)
+    if projection.needs_contacts:
+        stmt = stmt.outerjoin(Contact, Contact.client_id == Client.id)
+    row = (await session.execute(stmt)).mappings().one_or_none()
+
+    if row is None:
+        raise ValueError(f"Клиент с id {client_id} не найден")
+
+    etag = make_etag(
+        "client", client_id, row["update_at_day"] or row["create_at_day"], projection.key
+    )
+    return etag, encode_json(projection.to_dict(row))
+
+
+async def fetch_clients_page_etag(
+    session: AsyncSession,
+    limit: int,
+    after: Optional[str] = None,
+    projection: ClientProjection = FULL_PROJECTION,
+) -> str:
+    """Строит ETag страницы списка из (id, update_at_day) её клиентов.
+
+    Читается та же страница, что в fetch_all_clients, но только колонки
+    индекса ix_clients_paging (create_at_day, id) INCLUDE (update_at_day),
+    поэтому запрос обходится index-only scan без чтения строк таблицы.
+    Любое изменение клиента или его контакта обновляет update_at_day,
+    вставка и удаление меняют состав страницы; в путь записи ничего не добавляется.
+
+    Args:
+        session: Асинхронная сессия SQLAlchemy.
+        limit: Максимальное количество клиентов на странице.
+        after: Курсор, полученный с предыдущей страницы.
+        projection: План выборки полей страницы.
+
+    Returns:
+        ETag страницы.
+
+    Raises:
+        ValueError: Если курсор некорректен.
+    """
+    stmt = (
+        select(Client.id, Client.update_at_day)
+        .order_by(Client.create_at_day, Client.id)
+        .limit(limit + 1)
+    )
+    if after is not None:
+        last_create_at_day, last_id = decode_cursor(after)
+        stmt = stmt.where(
+            tuple_(Client.create_at_day, Client.id) > (last_create_at_day, last_id)
+        )
+
+    rows = [tuple(row) for row in await session.execute(stmt)]
+    # Лишняя строка влияет только на наличие next_cursor, но не на содержимое.
+    has_more = len(rows) > limit
+    return make_etag("clients", limit, after, projection.key, rows[:limit], has_more)
+
+
+# Оценка планировщика: reltuples из последнего ANALYZE, пересчитанный
+# на текущий размер таблицы. NULL, если таблицу ещё не анализировали.
+_ESTIMATE_CLIENTS_SQL = text(
+    """
+    SELECT CASE
+               WHEN reltuples < 0 OR relpages = 0 THEN NULL
+               ELSE (reltuples / relpages
+                     * (pg_relation_size(oid) / current_setting('block_size')::int))::bigint
+           END
+    FROM pg_class
+    WHERE oid = 'clients'::regclass
+    """
+)
+
+
+async def count_clients(session: AsyncSession, mode: Literal["exact", "estimate"]) -> int:
+    """Возвращает количество клиентов, точное или оценку.
+
+    Точное значение считается count(*) и хранится в count_cache
+    settings.pagination.count_cache_ttl_seconds секунд; одновременные промахи
+    ждут один count(*) (см. LruTtlCache.get_or_load). Оценка берётся
+    из статистики pg_class и не читает таблицу; для ещё не анализированной
+    таблицы используется оценка строк из EXPLAIN.
+
+    Args:
+        session: Асинхронная сессия SQLAlchemy.
+        mode: "exact" — точное количество, "estimate" — быстрая оценка.
+
+    Returns:
+        Количество клиентов.
+    """
+    if mode == "estimate":
+        estimate = await session.scalar(_ESTIMATE_CLIENTS_SQL)
+        if estimate is None:
+            plan = await session.scalar(text("EXPLAIN (FORMAT JSON) SELECT 1 FROM clients"))
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            estimate = plan[0]["Plan"]["Plan Rows"]
+        return int(estimate)
+
+    return await count_cache.get_or_load(
+        "clients", lambda: session.scalar(select(func.count()).select_from(Client))
+    )
+
+
+def _escape_like(value: str) -> str:
+    """Экранирует спецсимволы LIKE, чтобы строка поиска совпадала буквально."""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+async def search_clients(
+    session: AsyncSession,
+    query: str,
+    limit: int,
+    offset: int = 0,
+    projection: ClientProjection = FULL_PROJECTION,
+) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+    """Ищет клиентов по ФИО, email и телефону с ранжированием по релевантности.
+
+    Кандидаты собираются объединением выборок, каждая из которых опирается на
+    свой GIN-индекс: полнотекстовый по clients.search_tsv и триграммные по
+    clients.search_name, contacts.email и contacts.phone_number. Ранг — наибольшее
+    из ts_rank и similarity по совпавшим полям.
+
+    Каждая выборка сортируется по своей оценке (ts_rank или similarity, при
+    равенстве — по id клиента) и ограничивается settings.pagination.search_branch_limit
+    строками, поэтому короткая строка вроде "999", совпадающая с сотнями тысяч
+    контактов, ранжирует не больше нескольких сотен кандидатов. Набор кандидатов
+    не зависит от offset, так что страницы одного запроса не повторяют и не
+    теряют клиентов; выдача заканчивается, когда кандидаты исчерпаны.
 
     Args:
         session: Асинхронная сессия SQLAlchemy.
+        query: Строка поиска: часть имени, email или телефона.
+        limit: Максимальное количество клиентов на странице.
+        offset: Смещение страницы в отсортированной выдаче.
+        projection: План выборки полей, по умолчанию все поля ClientOut.
 
     Returns:
-        Список объектов Client.
+        Кортеж из списка словарей ClientOut (см. fetch_all_clients) и смещения
+        следующей страницы (None, если страница последняя).
     """
-    stmt = select(Client)
-    result: Result = await session.execute(stmt)
+    text_query = query.strip().lower()
+    digits = "".join(char for char in text_query if char.isdigit())
+    ts_query = func.plainto_tsquery(literal_column("'simple'"), text_query)
+    branch_limit = settings.pagination.search_branch_limit
+
+    # Ветка поиска: (выборка id клиентов, оценка совпадения, колонка id для порядка).
+    branches = [
+        (
+            select(Client.id.label("client_id")).where(
+                Client.search_tsv.match(text_query, postgresql_regconfig="simple")
+            ),
+            func.ts_rank(Client.search_tsv, ts_query),
+            Client.id,
+        )
+    ]
+
+    # Триграммный индекс помогает только для подстрок от трёх символов.
+    if len(text_query) >= 3:
+        pattern = f"%{_escape_like(text_query)}%"
+        branches += [
+            (
+                select(Client.id.label("client_id")).where(Client.search_name.like(pattern)),
+                func.similarity(Client.search_name, text_query),
+                Client.id,
+            ),
+            (
+                select(Contact.client_id).where(Contact.email.ilike(pattern)),
+                func.similarity(func.lower(Contact.email), text_query),
+                Contact.client_id,
+            ),
+        ]
+    if len(digits) >= 3:
+        branches.append(
+            (
+                select(Contact.client_id).where(Contact.phone_number.like(f"%{digits}%")),
+                func.similarity(Contact.phone_number, digits),
+                Contact.client_id,
+            )
+        )
+
+    # Без порядка LIMIT в ветке отдаёт произвольные строки, и набор кандидатов
+    # менялся бы от запроса к запросу вместе со страницами выдачи.
+    hits = union(
+        *(
+            candidate.order_by(score.desc(), id_column).limit(branch_limit)
+            for candidate, score, id_column in branches
+        )
+    ).subquery("hits")
+    rank_parts = [score for _, score, _ in branches]
+    rank = func.greatest(*rank_parts) if len(rank_parts) > 1 else rank_parts[0]
+
+    stmt = (
+        select(*projection.columns)
+        .join(hits, hits.c.client_id == Client.id)
+        .order_by(rank.desc(), Client.id)
+        .limit(limit + 1)
+        .offset(offset)
+    )
+    # Ранг по email и телефону тоже требует контакта, даже если его поля не нужны в ответе.
+    if projection.needs_contacts or len(text_query) >= 3 or len(digits) >= 3:
+        stmt = stmt.outerjoin(Contact, Contact.client_id == Client.id)
+    rows = (await session.execute(stmt)).mappings().all()
+
+    next_offset = offset + limit if len(rows) > limit else None
+    return [projection.to_dict(row) for row in rows[:limit]], next_offset
+
+
+async def stream_clients_for_export(
+    session: AsyncSession,
+    batch_size: int,
+) -> AsyncIterator[List[RowMapping]]:
+    """Читает всех клиентов с контактами через серверный курсор.
 
-    return result.scalars().all()
+    Строки выбираются плоским Core-запросом без построения ORM-объектов
+    и отдаются пачками по batch_size, так что в памяти одновременно
+    находится не больше одной пачки.
+
+    Args:
+        session: Асинхронная сессия SQLAlchemy.
+        batch_size: Размер пачки строк, читаемых из курсора за раз.
+
+    Yields:
+        List[RowMapping]: Очередная пачка строк с колонками клиента и контакта.
+    """
+    stmt = (
+        select(
+            Client.id,
+            Client.name,
+            Client.sur_name,
+            Client.middle_name,
+            Client.create_at_day,
+            Client.update_at_day,
+            Contact.phone_number,
+            Contact.email,
+            Contact.facebook,
+            Contact.vk,
+        )
+        .outerjoin(Contact, Contact.client_id == Client.id)
+        .order_by(Client.id)
+        .execution_options(yield_per=batch_size)
+    )
+    result = await session.stream(stmt)
+
+    async for partition in result.mappings().partitions():
+        yield partition
 
 
 async def create_client_record(
     session: AsyncSession, new_client_data: ClientIn
-) -> Client:
+) -> ClientOut:
     """Создает запись о новом клиенте и связанные с ним контакты в базе данных.
 
+    Клиент и контакт вставляются одним запросом
+    WITH new_client AS (INSERT ... RETURNING), new_contact AS (INSERT ... RETURNING),
+    а ответ собирается из возвращённых колонок без повторного SELECT.
+
     Args:
         session: Асинхронная сессия SQLAlchemy.
         new_client_data: Объект ClientIn, содержащий данные нового клиента.
 
     Returns:
-        Объект Client, представляющий созданного клиента.
+        Объект ClientOut, представляющий созданного клиента.
 
     """
-
-    client = Client(
-        name=new_client_data.name,
-        sur_name=new_client_data.sur_name,
-        middle_name=new_client_data.middle_name,
-        create_at_day=datetime.now(),
+    contact_data = new_client_data.contacts
+
+    new_client = (
+        insert(Client)
+        .values(
+            name=new_client_data.name,
+            sur_name=new_client_data.sur_name,
+            middle_name=new_client_data.middle_name,
+            create_at_day=datetime.now(),
+        )
+        .returning(*_CLIENT_COLUMNS)
+        .cte("new_client")
     )
-
-    session.add(client)
-    await session.flush()
-    contact = Contact(
-        phone_number=new_client_data.contacts.phone_number,
-        email=new_client_data.contacts.email,
-        facebook=new_client_data.contacts.facebook,
-        vk=new_client_data.contacts.vk,
-        client_id=client.id,
+    new_contact = (
+        insert(Contact)
+        .from_select(
+            ["client_id", "phone_number", "email", "facebook", "vk", "email_norm", "phone_e164"],
+            select(
+                new_client.c.id,
+                literal(contact_data.phone_number, String),
+                literal(contact_data.email, String),
+                literal(contact_data.facebook, String),
+                literal(contact_data.vk, String),
+                literal(normalize_email(contact_data.email), String),
+                literal(normalize_phone(contact_data.phone_number), String),
+            ),
+        )
+        .returning(*_CONTACT_COLUMNS)
+        .cte("new_contact")
+    )
+    stmt = select(*new_client.c, *new_contact.c).join_from(
+        new_client, new_contact, new_contact.c.client_id == new_client.c.id
     )
 
-    session.add(contact)
+    row = (await session.execute(stmt)).mappings().one()
     await session.commit()
-    await session.refresh(client)
-
-    return client
 
+    return _client_out_from_row(row)
 
 
 async def update_client_record(session: AsyncSession,
                                client_id: int,
-                               new_client_data: ClientUpdate):
+                               new_client_data: ClientUpdate) -> ClientOut:
     """Обновляет запись о клиенте и связанные с ним контакты в базе данных.
 
+    Поля клиента и поля контакта меняются каждое одним UPDATE ... RETURNING
+    в одной транзакции; если полей контакта нет, контакт читается SELECT.
+
 Args:
     session: Асинхронная сессия SQLAlchemy.
     client_id: ID клиента, данные которого нужно обновить.
     new_client_data: Объект ClientUpdate, содержащий новые данные клиента.
 
 Returns:
-        Объект Client, представляющий обновленного клиента.
+        Объект ClientOut, представляющий обновленного клиента.
 
 Raises:
     ValueError: Если клиент с указанным ID не найден.
 """
-    client = await session.get(Client, client_id)
+    update_data = new_client_data.model_dump(exclude_none=True, exclude={"contacts"})
+    update_data['update_at_day'] = datetime.now()
 
-    if not client:
+    client_row = (
+        await session.execute(
+            update(Client)
+            .where(Client.id == client_id)
+            .values(**update_data)
+            .returning(*_CLIENT_COLUMNS, _notify_client_changed())
+            .execution_options(synchronize_session=False)
+        )
+    ).mappings().one_or_none()
+
+    if client_row is None:
         raise ValueError(f"Клиент с id {client_id} не найден")
 
+    contact_data = (
+        new_client_data.contacts.model_dump(exclude_none=True)
+        if new_client_data.contacts
+        else {}
+    )
+    if "email" in contact_data:
+        contact_data["email_norm"] = normalize_email(contact_data["email"])
+    if "phone_number" in contact_data:
+        contact_data["phone_e164"] = normalize_phone(contact_data["phone_number"])
+    if contact_data:
+        contact_stmt = (
+            update(Contact)
+            .where(Contact.client_id == client_id)
+            .values(**contact_data)
+            .returning(*_CONTACT_COLUMNS)
+            .execution_options(synchronize_session=False)
+        )
+    else:
+        contact_stmt = select(*_CONTACT_COLUMNS).where(Contact.client_id == client_id)
+
+    contact_row = (await session.execute(contact_stmt)).mappings().one_or_none()
+    await session.commit()
+    client_cache.invalidate(client_id)
+
+    return _build_client_out(client_row, contact_row)
 
-    update_data = new_client_data.model_dump(exclude_none=True, exclude={"contacts"})
-    update_data['update_at_day'] = datetime.now()
 
-    for key, value in update_data.items():
-        setattr(client, key, value)
+
+
+async def delete_client_record(session: AsyncSession, client_id: int) -> None:
+    """Удаляет клиента одним DELETE ... RETURNING.
+
+    Контакт удаляется базой данных по ON DELETE CASCADE,
+    граф ORM при этом не загружается.
+
+    Args:
+        session: Асинхронная сессия SQLAlchemy.
+        client_id: ID клиента, которого нужно удалить.
+
+    Raises:
+        ValueError: Если клиент с указанным ID не найден.
+    """
+    deleted_id = await session.scalar(
+        delete(Client)
+        .where(Client.id == client_id)
+        .returning(Client.id, _notify_client_changed())
+        .execution_options(synchronize_session=False)
+    )
+
+    if deleted_id is None:
+        raise ValueError(f"Клиент с id {client_id} не найден")
 
     await session.commit()
-    await session.refresh(client)
+    client_cache.invalidate(client_id)
+
 
-    if new_client_data.contacts:
-        contact = await session.scalar(select(Contact).where(Contact.client_id == client_id))
+async def delete_client_records(session: AsyncSession, client_ids: List[int]) -> List[int]:
+    """Удаляет клиентов по списку ID одним запросом DELETE ... WHERE id = ANY(:ids).
 
-        if contact:
-            contact_data = new_client_data.contacts.model_dump(exclude_none=True)
-            for key, value in contact_data.items():
-                setattr(contact, key, value)
-        session.add(contact)
+    Args:
+        session: Асинхронная сессия SQLAlchemy.
+        client_ids: ID клиентов, которых нужно удалить.
+
+    Returns:
+        ID клиентов, которые действительно были удалены.
+    """
+    result = await session.scalars(
+        delete(Client)
+        .where(Client.id == any_(bindparam("client_ids", client_ids, type_=ARRAY(Integer))))
+        .returning(Client.id, _notify_client_changed())
+        .execution_options(synchronize_session=False)
+    )
+    deleted_ids = list(result)
     await session.commit()
-    return client
+    client_cache.invalidate_many(deleted_ids)
 
+    return deleted_ids
 
 
+async def create_client_records_bulk(
+    session: AsyncSession,
+    new_clients_data: List[ClientIn],
+    batch_size: int,
+) -> List[ClientBulkResult]:
+    """Создает клиентов и их контакты многострочными INSERT в одной транзакции.
 
-async def delete_client_record(session: AsyncSession, client_id: int) -> None:
-    client = await session.get(Client, client_id)
+    Элементы, чей email или телефон повторяется в запросе или уже есть в базе
+    (сравниваются нормализованные значения), не прерывают обработку,
+    а возвращаются со статусом "conflict".
+
+    Args:
+        session: Асинхронная сессия SQLAlchemy.
+        new_clients_data: Список объектов ClientIn.
+        batch_size: Количество строк в одном многострочном INSERT.
+
+    Returns:
+        Результаты в порядке входного списка.
+    """
+    results: List[Optional[ClientBulkResult]] = [None] * len(new_clients_data)
+
+    seen_emails: Dict[str, int] = {}
+    seen_phones: Dict[str, int] = {}
+    for index, data in enumerate(new_clients_data):
+        email = normalize_email(data.contacts.email)
+        phone_number = normalize_phone(data.contacts.phone_number)
+        duplicate = seen_emails.get(email) if email else None
+        if duplicate is None and phone_number:
+            duplicate = seen_phones.get(phone_number)
+        if duplicate is not None:
+            results[index] = ClientBulkResult(
+                index=index,
+                status="conflict",
+                detail=f"email или телефон повторяет элемент {duplicate} запроса",
+            )
+            continue
+        seen_emails[email] = index
+        seen_phones[phone_number] = index
+
+    pending = [index for index, result in enumerate(results) if result is None]
+    for start in range(0, len(pending), batch_size):
+        await _insert_clients_batch(
+            session, new_clients_data, pending[start:start + batch_size], results
+        )
 
-    if not client:
-        raise ValueError(f"Клиент с id {client_id} не найден")
-    
-    await session.delete(client)
     await session.commit()
+    return results
 
 
+async def _insert_clients_batch(
+    session: AsyncSession,
+    new_clients_data: List[ClientIn],
+    indexes: List[int],
+    results: List[Optional[ClientBulkResult]],
+) -> None:
+    """Вставляет одну пачку клиентов и заполняет results для её элементов."""
+    normalized = {
+        index: (
+            normalize_email(new_clients_data[index].contacts.email),
+            normalize_phone(new_clients_data[index].contacts.phone_number),
+        )
+        for index in indexes
+    }
+    existing = await session.execute(
+        select(Contact.email_norm, Contact.phone_e164).where(
+            or_(
+                Contact.email_norm.in_([email for email, _ in normalized.values()]),
+                Contact.phone_e164.in_([phone for _, phone in normalized.values()]),
+            )
+        )
+    )
+    taken_emails, taken_phones = set(), set()
+    for email, phone_number in existing:
+        taken_emails.add(email)
+        taken_phones.add(phone_number)
+    taken_emails.discard(None)
+    taken_phones.discard(None)
+
+    to_insert = []
+    for index in indexes:
+        email, phone_number = normalized[index]
+        if email in taken_emails or phone_number in taken_phones:
+            results[index] = ClientBulkResult(
+                index=index,
+                status="conflict",
+                detail="email или телефон уже принадлежит другому клиенту",
+            )
+        else:
+            to_insert.append(index)
+
+    if not to_insert:
+        return
+
+    now = datetime.now()
+    client_rows = (
+        await session.execute(
+            insert(Client).returning(*_CLIENT_COLUMNS, sort_by_parameter_order=True),
+            [
+                {
+                    "name": new_clients_data[index].name,
+                    "sur_name": new_clients_data[index].sur_name,
+                    "middle_name": new_clients_data[index].middle_name,
+                    "create_at_day": now,
+                }
+                for index in to_insert
+            ],
+        )
+    ).mappings().all()
+
+    # ON CONFLICT DO NOTHING закрывает гонку с параллельными вставками:
+    # такие строки просто не вернутся из RETURNING.
+    contact_rows = (
+        await session.execute(
+            pg_insert(Contact).on_conflict_do_nothing().returning(*_CONTACT_COLUMNS),
+            [
+                {
+                    "client_id": client_row["id"],
+                    **new_clients_data[index].contacts.model_dump(),
+                    "email_norm": normalized[index][0],
+                    "phone_e164": normalized[index][1],
+                }
+                for index, client_row in zip(to_insert, client_rows)
+            ],
+        )
+    ).mappings().all()
+    contacts_by_client = {row["client_id"]: row for row in contact_rows}
+
+    orphan_ids = []
+    for index, client_row in zip(to_insert, client_rows):
+        contact_row = contacts_by_client.get(client_row["id"])
+        if contact_row is None:
+            orphan_ids.append(client_row["id"])
+            results[index] = ClientBulkResult(
+                index=index,
+                status="conflict",
+                detail="email или телефон уже принадлежит другому клиенту",
+            )
+        else:
+            results[index] = ClientBulkResult(
+                index=index,
+                status="created",
+                client=_build_client_out(client_row, contact_row),
+            )
+
+    if orphan_ids:
+        await session.execute(delete(Client).where(Client.id.in_(orphan_ids)))
@@ -0,0 +1,274 @@
+import asyncio
+import csv
+import time
+from itertools import islice
+from re import fullmatch
+from typing import (
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Tuple,
+)
+
+from pydantic import ValidationError
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from models import (
+    Client,
+    Contact,
+    normalize_email,
+    normalize_phone,
+)
+
+from schemas import (
+    ClientIn,
+    ImportReport,
+    ImportRowError,
+)
+
+
+STAGING_TABLE = "clients_import_staging"
+STAGING_COLUMNS = (
+    "row_num",
+    "name",
+    "sur_name",
+    "middle_name",
+    "phone_number",
+    "email",
+    "facebook",
+    "vk",
+    "email_norm",
+    "phone_e164",
+)
+
+_STRING_LIMITS: Dict[str, int] = {
+    column.name: column.type.length
+    for table in (Client.__table__, Contact.__table__)
+    for column in table.columns
+    if column.name in STAGING_COLUMNS and getattr(column.type, "length", None)
+}
+
+_CREATE_STAGING_SQL = text(
+    f"""
+    CREATE TEMP TABLE {STAGING_TABLE} (
+        row_num bigint PRIMARY KEY,
+        name text NOT NULL,
+        sur_name text NOT NULL,
+        middle_name text,
+        phone_number text NOT NULL,
+        email text NOT NULL,
+        facebook text,
+        vk text,
+        email_norm text NOT NULL,
+        phone_e164 text NOT NULL
+    ) ON COMMIT DROP
+    """
+)
+
+# Повторы внутри файла (кроме первого вхождения) и строки, чей email или
+# телефон уже занят в contacts, удаляются из staging одним запросом.
+# Сравниваются нормализованные значения, поэтому проверки занятости
+# идут по уникальным индексам email_norm и phone_e164.
+_REJECT_CONFLICTS_SQL = text(
+    f"""
+    WITH ranked AS (
+        SELECT row_num,
+               row_number() OVER (PARTITION BY email_norm ORDER BY row_num) AS email_rank,
+               row_number() OVER (PARTITION BY phone_e164 ORDER BY row_num) AS phone_rank
+        FROM {STAGING_TABLE}
+    ),
+    rejected AS (
+        DELETE FROM {STAGING_TABLE} AS staging
+        WHERE staging.row_num IN (
+                SELECT row_num FROM ranked WHERE email_rank > 1 OR phone_rank > 1
+            )
+           OR EXISTS (SELECT 1 FROM contacts WHERE contacts.email_norm = staging.email_norm)
+           OR EXISTS (
+                SELECT 1 FROM contacts WHERE contacts.phone_e164 = staging.phone_e164
+            )
+        RETURNING staging.row_num
+    )
+    SELECT count(*) AS rejected,
+           (array_agg(row_num ORDER BY row_num))[1:(:sample_size)] AS sample
+    FROM rejected
+    """
+)
+
+# id клиентов выдаются заранее из последовательности, чтобы вставить
+# clients и contacts из одного набора строк без сопоставления RETURNING.
+_INSERT_FROM_STAGING_SQL = text(
+    f"""
+    WITH numbered AS MATERIALIZED (
+        SELECT nextval(pg_get_serial_sequence('clients', 'id')) AS client_id,
+               name, sur_name, middle_name, phone_number, email, facebook, vk,
+               email_norm, phone_e164
+        FROM {STAGING_TABLE}
+    ),
+    new_clients AS (
+        INSERT INTO clients (id, name, sur_name, middle_name, create_at_day)
+        SELECT client_id, name, sur_name, middle_name, now() FROM numbered
+    )
+    INSERT INTO contacts (client_id, phone_number, email, facebook, vk, email_norm, phone_e164)
+    SELECT client_id, phone_number, email, facebook, vk, email_norm, phone_e164 FROM numbered
+    """
+)
+
+
+def _validation_message(error: ValidationError) -> str:
+    """Сворачивает ошибки Pydantic в одну строку."""
+    return "; ".join(
+        f"{'.'.join(str(part) for part in item['loc'])}: {item['msg']}"
+        for item in error.errors()
+    )
+
+
+def _parse_row(row_num: int, row: Dict[str, str]) -> Tuple:
+    """Проверяет строку CSV по правилам ClientIn/ContactIn и модели Contact.
+
+    Args:
+        row_num: Номер строки данных в файле.
+        row: Строка CSV в виде словаря колонка -> значение.
+
+    Returns:
+        Кортеж значений в порядке STAGING_COLUMNS.
+
+    Raises:
+        ValueError: Если строка не проходит проверку.
+    """
+    client = ClientIn.model_validate(
+        {
+            "name": row.get("name"),
+            "sur_name": row.get("sur_name"),
+            "middle_name": row.get("middle_name") or None,
+            "contacts": {
+                "phone_number": row.get("phone_number"),
+                "email": row.get("email"),
+                "facebook": row.get("facebook") or None,
+                "vk": row.get("vk") or None,
+            },
+        }
+    )
+    contacts = client.contacts
+
+    if not fullmatch(Contact.EMAIL_REGEX, contacts.email):
+        raise ValueError(f"Некорректный адрес электронной почты: {contacts.email}")
+    if not fullmatch(Contact.PHONE_NUMBER_REGEX, contacts.phone_number):
+        raise ValueError(f"Некорректный номер телефона: {contacts.phone_number}")
+
+    record = (
+        row_num,
+        client.name,
+        client.sur_name,
+        client.middle_name,
+        contacts.phone_number,
+        contacts.email,
+        contacts.facebook,
+        contacts.vk,
+        normalize_email(contacts.email),
+        normalize_phone(contacts.phone_number),
+    )
+    for column, value in zip(STAGING_COLUMNS, record):
+        limit = _STRING_LIMITS.get(column)
+        if limit and value is not None and len(value) > limit:
+            raise ValueError(f"Поле {column} длиннее {limit} символов")
+
+    return record
+
+
+def _parse_chunk(
+    rows: Iterator[Tuple[int, Dict[str, str]]], chunk_size: int
+) -> Tuple[int, List[Tuple], List[ImportRowError]]:
+    """Читает и проверяет очередные chunk_size строк CSV.
+
+    Returns:
+        Количество прочитанных строк, корректные записи и ошибки.
+    """
+    records, errors = [], []
+    read = 0
+    for row_num, row in islice(rows, chunk_size):
+        read += 1
+        try:
+            records.append(_parse_row(row_num, row))
+        except ValidationError as error:
+            errors.append(ImportRowError(row=row_num, error=_validation_message(error)))
+        except ValueError as error:
+            errors.append(ImportRowError(row=row_num, error=str(error)))
+    return read, records, errors
+
+
+async def import_clients_csv(
+    connection: AsyncConnection,
+    lines: Iterable[str],
+    chunk_size: int,
+    max_reported_errors: int,
+) -> ImportReport:
+    """Загружает клиентов и контакты из CSV через COPY во временную таблицу.
+
+    Файл читается и проверяется пачками по chunk_size строк, каждая пачка
+    отправляется через asyncpg copy_records_to_table, поэтому память не
+    зависит от размера файла. Проверка уникальности и создание записей
+    выполняются множественными SQL-запросами по staging-таблице.
+
+    Функция не фиксирует транзакцию: её открывает и завершает вызывающий код.
+
+    Args:
+        connection: Асинхронное соединение SQLAlchemy с открытой транзакцией.
+        lines: Строки CSV-файла с заголовком
+            (name, sur_name, middle_name, phone_number, email, facebook, vk).
+        chunk_size: Количество строк, обрабатываемых за один COPY.
+        max_reported_errors: Сколько отклонённых строк перечислить в отчёте.
+
+    Returns:
+        ImportReport: Итоги импорта и пропускная способность.
+    """
+    started = time.perf_counter()
+    rows = enumerate(csv.DictReader(lines), start=1)
+
+    await connection.execute(_CREATE_STAGING_SQL)
+    raw_connection = await connection.get_raw_connection()
+    driver_connection = raw_connection.driver_connection
+
+    total_rows = 0
+    rejected_invalid = 0
+    errors: List[ImportRowError] = []
+    while True:
+        read, records, chunk_errors = await asyncio.to_thread(_parse_chunk, rows, chunk_size)
+        if not read:
+            break
+        total_rows += read
+        rejected_invalid += len(chunk_errors)
+        errors.extend(chunk_errors[: max_reported_errors - len(errors)])
+        if records:
+            await driver_connection.copy_records_to_table(
+                STAGING_TABLE, records=records, columns=STAGING_COLUMNS
+            )
+
+    rejected = (
+        await connection.execute(
+            _REJECT_CONFLICTS_SQL, {"sample_size": max_reported_errors}
+        )
+    ).one()
+    for row_num in rejected.sample or []:
+        if len(errors) >= max_reported_errors:
+            break
+        errors.append(
+            ImportRowError(
+                row=row_num,
+                error="email или телефон повторяется в файле или уже есть в базе",
+            )
+        )
+
+    imported = (await connection.execute(_INSERT_FROM_STAGING_SQL)).rowcount
+
+    duration = time.perf_counter() - started
+    return ImportReport(
+        total_rows=total_rows,
+        imported=imported,
+        rejected_invalid=rejected_invalid,
+        rejected_conflicts=rejected.rejected,
+        errors=sorted(errors, key=lambda error: error.row),
+        duration_seconds=round(duration, 3),
+        rows_per_second=round(total_rows / duration, 1) if duration else 0.0,
+    )
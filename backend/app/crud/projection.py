@@ -0,0 +1,100 @@
+from functools import lru_cache
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Mapping,
+    Optional,
+    Tuple,
+)
+
+from models import Client, Contact
+
+
+CLIENT_FIELDS = ("id", "name", "sur_name", "middle_name", "create_at_day", "update_at_day")
+CONTACT_FIELDS = ("phone_number", "email", "facebook", "vk", "client_id")
+
+# Колонки, которые выбираются всегда: по ним строятся курсор и ETag.
+_BASE_COLUMNS = (Client.id, Client.create_at_day, Client.update_at_day)
+
+
+class ClientProjection:
+    """
+    План выборки клиентов с подмножеством полей ClientOut.
+
+    Запрос выбирает только нужные колонки, а contacts присоединяется, только
+    если запрошено хотя бы одно поле контакта. Планы кешируются по набору
+    полей (см. client_projection), поэтому разбор fields и сборка списка
+    колонок выполняются один раз на каждый набор.
+
+    Attributes:
+        client_fields (Tuple[str, ...]): Поля клиента в ответе.
+        contact_fields (Tuple[str, ...]): Поля вложенного объекта contacts в ответе.
+        columns (Tuple): Колонки SELECT.
+        key (str): Нормализованный набор полей для ETag.
+    """
+
+    def __init__(self, client_fields: Tuple[str, ...], contact_fields: Tuple[str, ...]) -> None:
+        self.client_fields = client_fields
+        self.contact_fields = contact_fields
+        self.needs_contacts = bool(contact_fields)
+        self.key = ",".join(client_fields + tuple(f"contacts.{field}" for field in contact_fields))
+
+        client_columns = _BASE_COLUMNS + tuple(
+            getattr(Client, field) for field in client_fields
+            if field not in ("id", "create_at_day", "update_at_day")
+        )
+        contact_columns = tuple(getattr(Contact, field) for field in contact_fields)
+        self.columns = client_columns + contact_columns
+
+    def to_dict(self, row: Mapping[str, Any]) -> Dict[str, Any]:
+        """Собирает словарь ответа из строки выборки."""
+        item = {field: row[field] for field in self.client_fields}
+        if self.contact_fields:
+            item["contacts"] = {field: row[field] for field in self.contact_fields}
+        return item
+
+
+@lru_cache(maxsize=256)
+def _projection(fields: FrozenSet[str]) -> ClientProjection:
+    unknown = sorted(
+        field for field in fields
+        if field not in CLIENT_FIELDS
+        and field != "contacts"
+        and not (field.startswith("contacts.") and field[len("contacts."):] in CONTACT_FIELDS)
+    )
+    if unknown:
+        raise ValueError(f"Неизвестные поля: {', '.join(unknown)}")
+
+    client_fields = tuple(field for field in CLIENT_FIELDS if field in fields)
+    if "contacts" in fields:
+        contact_fields = CONTACT_FIELDS
+    else:
+        contact_fields = tuple(field for field in CONTACT_FIELDS if f"contacts.{field}" in fields)
+    return ClientProjection(client_fields, contact_fields)
+
+
+FULL_PROJECTION = _projection(frozenset(CLIENT_FIELDS + ("contacts",)))
+
+
+def client_projection(fields: Optional[str]) -> ClientProjection:
+    """
+    Возвращает план выборки для параметра fields.
+
+    Args:
+        fields: Поля ClientOut через запятую, например "id,name,contacts.email";
+            "contacts" означает все поля контакта. None — все поля.
+
+    Returns:
+        ClientProjection: Кешированный план для этого набора полей.
+
+    Raises:
+        ValueError: Если набор пуст или содержит неизвестные поля.
+    """
+    if fields is None:
+        return FULL_PROJECTION
+
+    names = frozenset(name.strip() for name in fields.split(",") if name.strip())
+    if not names:
+        raise ValueError("Не указано ни одного поля")
+    return _projection(names)
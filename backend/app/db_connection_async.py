@@ -1,5 +1,15 @@
-from typing import AsyncGenerator
+import time
+from contextlib import asynccontextmanager
+from typing import (
+    AsyncGenerator,
+    Callable,
+    List,
+    Optional,
+    Sequence,
+)
 
+from fastapi import Request
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio import (
     create_async_engine,
     AsyncEngine,
@@ -8,7 +18,40 @@ from sqlalchemy.ext.asyncio import (
 )
 
 
-from core import settings
+from core import (
+    settings,
+    crm_logger,
+    TimedQueuePool,
+    instrument_engine,
+    SlowQueryLog,
+    slow_query_log,
+)
+
+
+READ_PRIMARY_COOKIE = "crm_read_primary"
+READ_PRIMARY_HEADER = "X-Read-Primary"
+
+
+def read_only_route(endpoint: Callable) -> Callable:
+    """Помечает эндпоинт, который только читает данные, хотя вызывается не GET-запросом.
+
+    После такого запроса middleware read_your_writes не ставит куку
+    READ_PRIMARY_COOKIE, и следующие чтения клиента остаются на репликах.
+    Декоратор ставится под декоратором маршрута:
+
+        @router.post("/batch-get")
+        @read_only_route
+        async def batch_get_clients(...): ...
+    """
+    endpoint.read_only = True
+    return endpoint
+
+
+def is_read_only_route(request: Request) -> bool:
+    """Проверяет, что запрос обработан эндпоинтом, помеченным read_only_route."""
+    route = request.scope.get("route")
+    return getattr(getattr(route, "endpoint", None), "read_only", False)
+
 
 class DataBaseConnect:
     """Класс для управления подключениями к базе данных.
@@ -16,9 +59,20 @@ class DataBaseConnect:
     Этот класс обеспечивает создание и управление асинхронными соединениями с базой данных.
     Он использует движок SQLAlchemy для создания и настройки соединений.
 
+    Движки подключены к метрикам Prometheus (core.metrics): время SQL-запросов
+    учитывается в текущем HTTP-запросе, состояние пулов отдаётся в /metrics.
+
+    Чтения, которым допустимо небольшое отставание, можно направлять на реплики
+    через read_session/read_session_get. Реплики перебираются по кругу; соединение
+    проверяется при выдаче из пула (pool_pre_ping), и реплика, к которой не удалось
+    подключиться, исключается из ротации на replica_retry_seconds. Если живых
+    реплик нет, чтение идёт в основную базу.
+
     Attributes:
         engine (AsyncEngine): Асинхронный движок базы данных.
         session_factory (async_sessionmaker[AsyncSession]): Фабрика сессий для создания асинхронных сессий.
+        replica_engines (List[AsyncEngine]): Движки реплик только для чтения.
+        replica_session_factories (List[async_sessionmaker[AsyncSession]]): Фабрики сессий реплик.
 
     Args:
         url (str): URL для подключения к базе данных.
@@ -26,25 +80,39 @@ class DataBaseConnect:
         echo_pool (bool): Включает/выключает вывод информации о пуле соединений.
         pool_size (int): Размер пула соединений.
         max_overflow (int): Максимальное количество соединений, которое может выйти за пределы пула.
+        replica_urls (Sequence[str]): URL реплик только для чтения.
+        replica_retry_seconds (float): Время исключения недоступной реплики из ротации.
+        slow_query_log (Optional[SlowQueryLog]): Журнал медленных запросов всех движков.
+        instrument (bool): Подключать ли движки к глобальным метрикам и журналу медленных запросов.
 
     """
 
     def __init__(
         self,
         url: str,
-        echo: bool = True,
+        echo: bool = False,
         echo_pool: bool = False,
         pool_size: int = 5,
         max_overflow: int = 10,
+        replica_urls: Sequence[str] = (),
+        replica_retry_seconds: float = 30.0,
+        slow_query_log: Optional[SlowQueryLog] = None,
+        instrument: bool = True,
     ) -> None:
         """Инициализация класса DataBaseConnect.
 
         Attributes:
             url (str): URL подключения к базе данных.
-            echo (bool, optional): Включает логирование SQL-запросов. По умолчанию: True.
+            echo (bool, optional): Включает логирование SQL-запросов. По умолчанию: False.
             echo_pool (bool, optional): Включает логирование событий пула соединений. По умолчанию: False.
             pool_size (int, optional): Размер пула соединений. По умолчанию: 5.
             max_overflow (int, optional): Максимальное количество дополнительных соединений сверх размера пула. По умолчанию: 10.
+            replica_urls (Sequence[str], optional): URL реплик. По умолчанию: реплик нет.
+            replica_retry_seconds (float, optional): Время исключения недоступной реплики из ротации. По умолчанию: 30.
+            slow_query_log (Optional[SlowQueryLog], optional): Журнал медленных запросов. По умолчанию: не ведётся.
+            instrument (bool, optional): Подключать ли движки к метрикам процесса (pool_collector
+                и обработчики SQL-запросов). Выключается для временных подключений, например
+                в тестах, чтобы не подменить пул основного подключения в /metrics. По умолчанию: True.
         """
         self.engine: AsyncEngine = create_async_engine(
             url=url,
@@ -52,7 +120,12 @@ class DataBaseConnect:
             echo_pool=echo_pool,
             pool_size=pool_size,
             max_overflow=max_overflow,
+            poolclass=TimedQueuePool,
+            pool_logging_name="primary",
         )
+        on_query = slow_query_log.observe if slow_query_log is not None else None
+        if instrument:
+            instrument_engine(self.engine, "primary", on_query)
 
         self.session_factory: async_sessionmaker[AsyncSession] = async_sessionmaker(
             bind=self.engine,
@@ -60,6 +133,30 @@ class DataBaseConnect:
             expire_on_commit=False,
         )
 
+        self.replica_engines: List[AsyncEngine] = [
+            create_async_engine(
+                url=replica_url,
+                echo=echo,
+                echo_pool=echo_pool,
+                pool_size=pool_size,
+                max_overflow=max_overflow,
+                pool_pre_ping=True,
+                poolclass=TimedQueuePool,
+                pool_logging_name=f"replica{index}",
+            )
+            for index, replica_url in enumerate(replica_urls)
+        ]
+        if instrument:
+            for index, engine in enumerate(self.replica_engines):
+                instrument_engine(engine, f"replica{index}", on_query)
+        self.replica_session_factories: List[async_sessionmaker[AsyncSession]] = [
+            async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+            for engine in self.replica_engines
+        ]
+        self.replica_retry_seconds = replica_retry_seconds
+        self._next_replica = 0
+        self._replica_down_until: List[float] = [0.0] * len(self.replica_engines)
+
     async def dispose(self) -> None:
         """Освобождение ресурсов, связанных с двигателем базы данных.
 
@@ -67,6 +164,8 @@ class DataBaseConnect:
         """
         if self.engine:
             await self.engine.dispose()
+        for engine in self.replica_engines:
+            await engine.dispose()
 
     async def session_get(self) -> AsyncGenerator[AsyncSession, None]:
         """Получение асинхронной сессии из фабрики сессий.
@@ -78,12 +177,73 @@ class DataBaseConnect:
         async with self.session_factory() as session:
             yield session
 
+    async def _replica_session(self) -> Optional[AsyncSession]:
+        """Открывает сессию на следующей по кругу доступной реплике.
+
+        Returns:
+            AsyncSession с уже полученным соединением или None, если ни одна реплика не отвечает.
+        """
+        now = time.monotonic()
+        for _ in range(len(self.replica_session_factories)):
+            index = self._next_replica % len(self.replica_session_factories)
+            self._next_replica = index + 1
+            if self._replica_down_until[index] > now:
+                continue
+
+            session = self.replica_session_factories[index]()
+            try:
+                await session.connection()
+            except (DBAPIError, OSError) as error:
+                await session.close()
+                self._replica_down_until[index] = now + self.replica_retry_seconds
+                crm_logger.warning("Реплика %s недоступна, исключена из ротации: %s", index, error)
+                continue
+            return session
+        return None
+
+    @asynccontextmanager
+    async def read_session(self, primary: bool = False) -> AsyncGenerator[AsyncSession, None]:
+        """Открывает сессию для чтения на реплике или на основной базе.
+
+        Args:
+            primary: Читать из основной базы, например сразу после записи.
+
+        Yields:
+            AsyncSession: Асинхронная сессия реплики либо основной базы, если реплик нет или все недоступны.
+        """
+        session = None
+        if not primary and self.replica_session_factories:
+            session = await self._replica_session()
+        if session is None:
+            session = self.session_factory()
+        async with session:
+            yield session
+
+    @staticmethod
+    def prefers_primary(request: Request) -> bool:
+        """Проверяет, должен ли запрос читать свои недавние записи из основной базы.
+
+        Признак ставится кукой READ_PRIMARY_COOKIE после успешного изменения данных
+        либо передаётся клиентом в заголовке READ_PRIMARY_HEADER.
+        """
+        return READ_PRIMARY_COOKIE in request.cookies or READ_PRIMARY_HEADER in request.headers
+
+    async def read_session_get(self, request: Request) -> AsyncGenerator[AsyncSession, None]:
+        """Получение асинхронной сессии для чтения, зависимость для списков, поиска и выгрузки.
+
+        Yields:
+            AsyncSession: Сессия реплики или основной базы (см. read_session)."""
+        async with self.read_session(primary=self.prefers_primary(request)) as session:
+            yield session
+
 
 db_async_session = DataBaseConnect(
     url=str(settings.db.url),
     echo=settings.db.echo,
     echo_pool=settings.db.echo_pool,
     pool_size=settings.db.pool_size,
-    max_overflow=settings.db.max_overflow
-
+    max_overflow=settings.db.max_overflow,
+    replica_urls=[str(url) for url in settings.db.replica_urls],
+    replica_retry_seconds=settings.db.replica_retry_seconds,
+    slow_query_log=slow_query_log if settings.slow_queries.enabled else None,
 )
@@ -0,0 +1,47 @@
+"""Импорт клиентов из CSV-файла через COPY.
+
+Запуск из каталога app:
+
+    python import_clients.py clients.csv [--chunk-size 10000]
+"""
+
+import argparse
+import asyncio
+
+from core import settings, crm_logger
+from crud import import_clients_csv
+from db_connection_async import db_async_session
+
+
+async def main(path: str, chunk_size: int) -> None:
+    """Импортирует файл в одной транзакции и выводит отчёт в формате JSON."""
+    try:
+        with open(path, encoding="utf-8-sig", newline="") as lines:
+            async with db_async_session.engine.begin() as connection:
+                report = await import_clients_csv(
+                    connection=connection,
+                    lines=lines,
+                    chunk_size=chunk_size,
+                    max_reported_errors=settings.csv_import.max_reported_errors,
+                )
+    finally:
+        await db_async_session.dispose()
+
+    crm_logger.info(
+        "Импорт %s: %s из %s строк за %s с (%s строк/с)",
+        path,
+        report.imported,
+        report.total_rows,
+        report.duration_seconds,
+        report.rows_per_second,
+    )
+    print(report.model_dump_json(indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Импорт клиентов из CSV через COPY")
+    parser.add_argument("path", help="CSV-файл с заголовком name,sur_name,middle_name,phone_number,email,facebook,vk")
+    parser.add_argument("--chunk-size", type=int, default=settings.csv_import.chunk_size)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.path, args.chunk_size))
@@ -0,0 +1,233 @@
+"""Проверка планов запросов CRUD-слоя на последовательное сканирование.
+
+Скрипт выполняет функции crud на тестовых данных внутри транзакции,
+которая в конце откатывается, перехватывает все отправленные запросы
+и для каждого строит EXPLAIN (FORMAT JSON) с теми же параметрами.
+Seq Scan по таблице, в которой по pg_class.reltuples не меньше
+--min-rows строк, считается пропущенным индексом.
+
+Запуск из каталога app:
+
+    python index_advisor.py [--min-rows 10000]
+
+Код возврата 1, если найдено хотя бы одно последовательное сканирование.
+"""
+
+import argparse
+import asyncio
+import io
+import json
+import uuid
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Tuple,
+)
+
+from sqlalchemy import event, text
+from sqlalchemy.engine.interfaces import ExecuteStyle
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+from core import client_cache
+from crud import (
+    client_projection,
+    create_client_record,
+    create_client_records_bulk,
+    delete_client_record,
+    delete_client_records,
+    fetch_all_clients,
+    fetch_client_by_contact,
+    fetch_client_json,
+    fetch_client_projection,
+    fetch_clients_by_ids,
+    fetch_clients_page_etag,
+    import_clients_csv,
+    search_clients,
+    stream_clients_for_export,
+    update_client_record,
+)
+from db_connection_async import db_async_session
+from schemas import ClientIn, ClientUpdate
+
+
+EXPLAINABLE = ("SELECT", "INSERT", "UPDATE", "DELETE", "WITH")
+
+
+class StatementRecorder:
+    """Собирает уникальные запросы, отправленные драйверу, с меткой операции.
+
+    Attributes:
+        operation (str): Имя текущей операции CRUD.
+        statements (Dict[str, Tuple[str, Any]]): Текст запроса -> (операция, параметры).
+    """
+
+    def __init__(self) -> None:
+        self.operation = ""
+        self.statements: Dict[str, Tuple[str, Any]] = {}
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        if not statement.lstrip().upper().startswith(EXPLAINABLE):
+            return
+        if context.execute_style is ExecuteStyle.EXECUTEMANY:
+            parameters = parameters[0]
+        self.statements.setdefault(statement, (self.operation, parameters))
+
+
+def _client_in(tag: str, number: int) -> ClientIn:
+    """Собирает данные клиента: контакты однозначно определяются tag и number."""
+    return ClientIn.model_validate(
+        {
+            "name": f"advisor{number}",
+            "sur_name": tag,
+            "contacts": {
+                "phone_number": f"9{number:09d}",
+                "email": f"{tag}-{number}@advisor.test",
+            },
+        }
+    )
+
+
+async def _run_crud(
+    session: AsyncSession, connection: AsyncConnection, recorder: StatementRecorder
+) -> None:
+    """Вызывает каждую функцию crud хотя бы один раз."""
+    tag = uuid.uuid4().hex[:8]
+
+    recorder.operation = "create_client_record"
+    client = await create_client_record(session, _client_in(tag, 0))
+
+    recorder.operation = "create_client_records_bulk"
+    bulk = await create_client_records_bulk(
+        session, [_client_in(tag, 1), _client_in(tag, 2)], batch_size=100
+    )
+
+    recorder.operation = "fetch_all_clients"
+    _, next_cursor = await fetch_all_clients(session, limit=1)
+    await fetch_all_clients(session, limit=1, after=next_cursor)
+
+    recorder.operation = "fetch_client_json"
+    client_cache.clear()
+    await fetch_client_json(session, client.id)
+
+    recorder.operation = "fetch_clients_by_ids"
+    await fetch_clients_by_ids(session, [client.id, bulk[0].client.id])
+
+    recorder.operation = "fetch_client_projection"
+    await fetch_client_projection(session, client.id, client_projection("id,contacts.email"))
+
+    recorder.operation = "fetch_client_by_contact"
+    await fetch_client_by_contact(session, email=f"{tag.upper()}-0@advisor.test")
+    await fetch_client_by_contact(session, phone=client.contacts.phone_number)
+
+    recorder.operation = "fetch_clients_page_etag"
+    await fetch_clients_page_etag(session, limit=1, after=next_cursor)
+
+    recorder.operation = "search_clients"
+    await search_clients(session, query=f"advisor0 {tag}", limit=10)
+
+    recorder.operation = "stream_clients_for_export"
+    async for _ in stream_clients_for_export(session, batch_size=10):
+        break
+
+    recorder.operation = "update_client_record"
+    await update_client_record(session, client.id, ClientUpdate(name="advisor"))
+    await update_client_record(
+        session, client.id, ClientUpdate.model_validate({"contacts": {"vk": "advisor"}})
+    )
+
+    recorder.operation = "delete_client_records"
+    await delete_client_records(session, [result.client.id for result in bulk])
+
+    recorder.operation = "delete_client_record"
+    await delete_client_record(session, client.id)
+
+    recorder.operation = "import_clients_csv"
+    lines = io.StringIO(
+        "name,sur_name,middle_name,phone_number,email,facebook,vk\n"
+        f"advisor,{tag},,9000000000,{tag}@advisor.test,,\n"
+    )
+    await import_clients_csv(connection, lines, chunk_size=100, max_reported_errors=10)
+
+
+def _seq_scans(plan: Dict[str, Any]) -> Iterator[str]:
+    """Обходит дерево плана и возвращает таблицы узлов Seq Scan."""
+    if plan.get("Node Type") == "Seq Scan":
+        yield plan["Relation Name"]
+    for child in plan.get("Plans", ()):
+        yield from _seq_scans(child)
+
+
+async def _explain(connection: AsyncConnection, statement: str, parameters: Any) -> List[str]:
+    """Возвращает таблицы, которые план запроса читает последовательно."""
+    result = await connection.exec_driver_sql(
+        f"EXPLAIN (FORMAT JSON) {statement}", [tuple(parameters or ())]
+    )
+    plan = result.scalar_one()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return sorted(set(_seq_scans(plan[0]["Plan"])))
+
+
+async def main(min_rows: int) -> int:
+    """Собирает запросы CRUD-слоя, печатает отчёт и возвращает код выхода."""
+    recorder = StatementRecorder()
+    findings: List[Tuple[str, str, int, str]] = []
+
+    try:
+        async with db_async_session.engine.connect() as connection:
+            transaction = await connection.begin()
+            session = AsyncSession(
+                bind=connection,
+                join_transaction_mode="create_savepoint",
+                expire_on_commit=False,
+            )
+            event.listen(connection.sync_engine, "before_cursor_execute", recorder)
+            try:
+                await _run_crud(session, connection, recorder)
+            finally:
+                event.remove(connection.sync_engine, "before_cursor_execute", recorder)
+
+            table_rows = dict(
+                (
+                    await connection.execute(
+                        text(
+                            "SELECT relname, reltuples::bigint FROM pg_class "
+                            "WHERE relkind = 'r' AND relnamespace = 'public'::regnamespace"
+                        )
+                    )
+                ).all()
+            )
+            for statement, (operation, parameters) in recorder.statements.items():
+                for table in await _explain(connection, statement, parameters):
+                    rows = table_rows.get(table, 0)
+                    if rows >= min_rows:
+                        findings.append((operation, table, rows, statement))
+
+            await session.close()
+            await transaction.rollback()
+    finally:
+        await db_async_session.dispose()
+
+    print(f"Проверено запросов: {len(recorder.statements)}")
+    for operation, table, rows, statement in findings:
+        print(f"\n[{operation}] Seq Scan по {table} (~{rows} строк):\n{statement.strip()}")
+    if not findings:
+        print(f"Последовательных сканирований таблиц от {min_rows} строк не найдено")
+    return 1 if findings else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="EXPLAIN запросов CRUD-слоя и поиск последовательных сканирований"
+    )
+    parser.add_argument(
+        "--min-rows",
+        type=int,
+        default=10000,
+        help="Минимальный размер таблицы (pg_class.reltuples), при котором Seq Scan считается проблемой",
+    )
+    args = parser.parse_args()
+
+    raise SystemExit(asyncio.run(main(args.min_rows)))
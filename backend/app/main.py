@@ -1,24 +1,36 @@
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.responses import ORJSONResponse
 
 
-from db_connection_async import db_async_session
-from api import client_router
+from db_connection_async import db_async_session, is_read_only_route, READ_PRIMARY_COOKIE
+from cache_invalidation import cache_invalidation_listener
+from api import client_router, admin_router, metrics_router
 from core import (
     version,
     description,
     tags_metadata,
     title,
+    settings,
+    slow_query_log,
+    MetricsMiddleware,
+    DbTimingMiddleware,
 )
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    listen = settings.cache.listener_enabled and settings.cache.max_size > 0
+    if listen:
+        await cache_invalidation_listener.start()
     try:
         yield
     finally:
+        if listen:
+            await cache_invalidation_listener.stop()
+        # EXPLAIN медленных запросов держит соединения пула, который закрывается следом.
+        await slow_query_log.close()
         await db_async_session.dispose()
 
 # app.add_middleware(CORSMiddleware, allow_origins=['*'])
@@ -28,10 +40,47 @@ app = FastAPI(
     description=description,
     version=version,
     openapi_tags=tags_metadata,
+    default_response_class=ORJSONResponse,
 )
 
 app.include_router(client_router)
+app.include_router(admin_router)
+if settings.metrics.enabled:
+    app.include_router(metrics_router)
 
 
 
 
+
+
+@app.middleware("http")
+async def read_your_writes(request: Request, call_next):
+    """Отправляет чтения клиента в основную базу, пока реплики догоняют его запись.
+
+    После успешного изменяющего запроса ставится короткоживущая кука,
+    которую проверяет DataBaseConnect.read_session_get. Чтения методом POST
+    (например /clients/batch-get) помечены read_only_route и куку не ставят.
+    """
+    response = await call_next(request)
+    if (
+        settings.db.replica_urls
+        and request.method not in ("GET", "HEAD", "OPTIONS")
+        and response.status_code < 400
+        and not is_read_only_route(request)
+    ):
+        response.set_cookie(
+            READ_PRIMARY_COOKIE,
+            "1",
+            max_age=settings.db.read_your_writes_seconds,
+            httponly=True,
+            samesite="lax",
+        )
+    return response
+
+
+if settings.metrics.db_timing_headers:
+    app.add_middleware(DbTimingMiddleware)
+
+# Добавляется последним, чтобы быть внешним слоем и учитывать время остальных middleware.
+if settings.metrics.enabled:
+    app.add_middleware(MetricsMiddleware)
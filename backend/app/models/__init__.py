@@ -2,12 +2,14 @@ __all__ = (
     "Base",
     "Client",
     "Contact",
+    "normalize_email",
+    "normalize_phone",
 )
 
 
 from .base import Base
 from .client import Client
-from .contact import Contact
+from .contact import Contact, normalize_email, normalize_phone
 
 
 
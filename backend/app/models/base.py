@@ -1,3 +1,7 @@
+from sqlalchemy import (
+    DDL,
+    event,
+)
 from sqlalchemy.orm import (
     DeclarativeBase,
     mapped_column,
@@ -15,3 +19,12 @@ class Base(DeclarativeBase):
     def __tablename__(cls) -> str:
         """Метод назначает имя таблице в базу данных"""
         return f"{cls.__name__.lower()}s"
+
+
+# Триграммные GIN-индексы clients/contacts требуют расширения pg_trgm,
+# в миграциях его создаёт ревизия поиска, здесь — metadata.create_all.
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm"),
+)
@@ -6,10 +6,15 @@ from typing import (
 import datetime
 
 from sqlalchemy import (
+    DDL,
     String,
+    Text,
     DateTime,
+    Index,
+    event,
     func,
 )
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import (
     mapped_column,
     Mapped,
@@ -35,8 +40,21 @@ class Client(Base):
         create_at_day (datetime.date): Дата создания записи о клиенте.
         update_at_day (Optional[datetime.date]): Дата последнего обновления записи о клиенте (необязательно).
         contacts (List['Contact']): Список контактов клиента
+        search_tsv (str): tsvector по ФИО для полнотекстового поиска, заполняется триггером (загружается отложенно).
+        search_name (str): ФИО в нижнем регистре для триграммного поиска, заполняется триггером (загружается отложенно).
     """
 
+    __table_args__ = (
+        Index("ix_clients_paging", "create_at_day", "id", postgresql_include=["update_at_day"]),
+        Index("ix_clients_search_tsv", "search_tsv", postgresql_using="gin"),
+        Index(
+            "ix_clients_search_name_trgm",
+            "search_name",
+            postgresql_using="gin",
+            postgresql_ops={"search_name": "gin_trgm_ops"},
+        ),
+    )
+
     name: Mapped[str] = mapped_column(String(30), nullable=False)
     sur_name: Mapped[str] = mapped_column(String(30), nullable=False)
     middle_name: Mapped[Optional[str]] = mapped_column(
@@ -45,7 +63,18 @@ class Client(Base):
     create_at_day: Mapped[datetime.datetime] = mapped_column(DateTime, server_default=func.now(), nullable=False)
     update_at_day: Mapped[Optional[datetime.datetime]] = mapped_column(DateTime, nullable=True)
 
-    contacts: Mapped["Contact"] = relationship(back_populates="client",  uselist=False, lazy="joined", cascade="all, delete-orphan")
+    # Обычные колонки, а не Computed: их заполняет триггер clients_search_columns,
+    # чтобы миграция поиска не переписывала таблицу (см. ревизию client_search_indexes).
+    search_tsv: Mapped[Optional[str]] = mapped_column(TSVECTOR, nullable=True, deferred=True)
+    search_name: Mapped[Optional[str]] = mapped_column(Text, nullable=True, deferred=True)
+
+    contacts: Mapped["Contact"] = relationship(
+        back_populates="client",
+        uselist=False,
+        lazy="joined",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
 
     def __str__(self) -> str:
         """Возвращает строковое представление объекта."""
@@ -62,4 +91,34 @@ class Client(Base):
     def __repr__(self) -> str:
         """Возвращает строковое представление объекта для отображения в интерпретаторе."""
         return str(self)
-    
+
+
+# Для metadata.create_all: в миграциях функцию и триггер создаёт ревизия поиска.
+event.listen(
+    Client.__table__,
+    "after_create",
+    DDL(
+        """
+        CREATE OR REPLACE FUNCTION clients_search_columns() RETURNS trigger AS $$
+        BEGIN
+            NEW.search_tsv := to_tsvector(
+                'simple', NEW.name || ' ' || NEW.sur_name || ' ' || coalesce(NEW.middle_name, '')
+            );
+            NEW.search_name := lower(NEW.name || ' ' || NEW.sur_name || ' ' || coalesce(NEW.middle_name, ''));
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    ),
+)
+event.listen(
+    Client.__table__,
+    "after_create",
+    DDL(
+        """
+        CREATE TRIGGER clients_search_columns
+        BEFORE INSERT OR UPDATE OF name, sur_name, middle_name ON clients
+        FOR EACH ROW EXECUTE FUNCTION clients_search_columns()
+        """
+    ),
+)
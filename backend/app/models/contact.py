@@ -1,4 +1,4 @@
-from re import fullmatch
+from re import fullmatch, sub
 
 from typing import (
     Optional,
@@ -9,6 +9,7 @@ from sqlalchemy import (
     String,
     Integer,
     ForeignKey,
+    Index,
 )
 
 from sqlalchemy.orm import (
@@ -26,6 +27,41 @@ if TYPE_CHECKING:
     from .client import Client
 
 
+# Код страны для номеров без него: в базе хранятся 10-значные номера РФ.
+DEFAULT_PHONE_COUNTRY_CODE = "7"
+
+
+def normalize_email(email: str) -> Optional[str]:
+    """
+    Приводит email к виду для сравнения: без пробелов по краям и в нижнем регистре.
+
+    Returns:
+        Нормализованный email или None для пустой строки.
+    """
+    return email.strip().lower() or None
+
+
+def normalize_phone(number: str) -> Optional[str]:
+    """
+    Приводит телефон к формату E.164 (+79990000000).
+
+    Из номера удаляется всё, кроме цифр. Номеру из 10 цифр добавляется
+    DEFAULT_PHONE_COUNTRY_CODE, ведущая 8 в 11-значном номере заменяется на 7.
+    Ту же формулу на SQL применяет миграция contacts_normalized_lookup.
+
+    Returns:
+        Номер в формате E.164 или None, если в строке нет цифр.
+    """
+    digits = sub(r"\D", "", number)
+    if not digits:
+        return None
+    if len(digits) == 10:
+        return f"+{DEFAULT_PHONE_COUNTRY_CODE}{digits}"
+    if len(digits) == 11 and digits[0] == "8":
+        return f"+{DEFAULT_PHONE_COUNTRY_CODE}{digits[1:]}"
+    return f"+{digits}"
+
+
 class Contact(Base):
     """
         Модель для хранения контактной информации клиента.
@@ -35,13 +71,35 @@ class Contact(Base):
             client_id (int): Идентификатор клиента, которому принадлежит контакт.
             phone_number (sqlalchemy_utils.types.PhoneNumberType): Телефонный номер клиента.
             email (sqlalchemy_utils.types.EmailType): Адрес электронной почты клиента.
+            email_norm (Optional[str]): Email после normalize_email, уникален.
+            phone_e164 (Optional[str]): Телефон после normalize_phone, уникален.
             facebook (Optional[str]): Ссылка на профиль клиента в Facebook (необязательное поле).
             vk (Optional[str]): Ссылка на профиль клиента в VK (необязательное поле).
             client (Client): Связь с объектом клиента
     """
 
+    __table_args__ = (
+        Index(
+            "ix_contacts_email_trgm",
+            "email",
+            postgresql_using="gin",
+            postgresql_ops={"email": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_contacts_phone_number_trgm",
+            "phone_number",
+            postgresql_using="gin",
+            postgresql_ops={"phone_number": "gin_trgm_ops"},
+        ),
+        Index("ix_contacts_email_norm", "email_norm", unique=True),
+        Index("ix_contacts_phone_e164", "phone_e164", unique=True),
+    )
+
     client_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey("clients.id"), nullable=False
+        Integer,
+        ForeignKey("clients.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
     )
     phone_number: Mapped[str] = mapped_column(
         String(10),
@@ -53,6 +111,10 @@ class Contact(Base):
         nullable=False,
         unique=True,
     )
+    # Заполняются кодом записи (crud) вместе с email и phone_number;
+    # NULL только у дубликатов, оставленных миграцией без нормализации.
+    email_norm: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    phone_e164: Mapped[Optional[str]] = mapped_column(String(16), nullable=True)
     facebook: Mapped[Optional[str]] = mapped_column(
         String(30), nullable=True, default=None
     )
@@ -61,7 +123,7 @@ class Contact(Base):
     client: Mapped["Client"] = relationship(back_populates="contacts")
 
     EMAIL_REGEX = r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b"
-    PHONE_NUMBER_REGEX = r"^(\+?\d{1,2})?[-\s]?$?\d{3}$?[-\s]?\d{3}[-\s]?\d{4}$"
+    PHONE_NUMBER_REGEX = r"^(\+?\d{1,2})?[-\s]?\(?\d{3}\)?[-\s]?\d{3}[-\s]?\d{4}$"
 
     @validates
     def validate_email(self, key, address):
@@ -4,6 +4,15 @@ __all__ = (
     "ClientIn",
     "ContactUpdate",
     "ClientUpdate",
+    "ClientPage",
+    "ClientBulkResult",
+    "ClientBulkDeleteResult",
+    "ClientSearchPage",
+    "ClientCount",
+    "ClientBatchGetItem",
+    "ClientBatchGetResult",
+    "ImportReport",
+    "ImportRowError",
     )
 
 
@@ -11,8 +20,20 @@ from .schemas_client import (
     ClientOut,
     ClientIn,
     ClientUpdate,
+    ClientPage,
+    ClientBulkResult,
+    ClientBulkDeleteResult,
+    ClientSearchPage,
+    ClientCount,
+    ClientBatchGetItem,
+    ClientBatchGetResult,
 )
 
 from .schemas_contact import (
     ContactOut,
     ContactUpdate,)
+
+from .schemas_import import (
+    ImportReport,
+    ImportRowError,
+)
@@ -1,6 +1,7 @@
 from typing import (
     Optional,
     List,
+    Literal,
     TYPE_CHECKING,
     Union
 )
@@ -76,3 +77,96 @@ class ClientUpdate(ClientBase):
     contacts: Union[ContactUpdate, None] = None
 
 
+class ClientPage(BaseModel):
+    """
+    Страница списка клиентов при курсорной пагинации.
+
+    Attributes:
+        items (List[ClientOut]): Клиенты текущей страницы.
+        next_cursor (Optional[str]): Курсор следующей страницы, None если страница последняя.
+    """
+
+    items: List[ClientOut]
+    next_cursor: Optional[str] = None
+
+
+class ClientBulkResult(BaseModel):
+    """
+    Результат создания одного клиента в массовом запросе.
+
+    Attributes:
+        index (int): Позиция клиента во входном массиве.
+        status (Literal["created", "conflict"]): Итог обработки элемента.
+        client (Optional[ClientOut]): Созданный клиент, если status == "created".
+        detail (Optional[str]): Причина отказа, если status == "conflict".
+    """
+
+    index: int
+    status: Literal["created", "conflict"]
+    client: Optional[ClientOut] = None
+    detail: Optional[str] = None
+
+
+class ClientBulkDeleteResult(BaseModel):
+    """
+    Результат массового удаления клиентов.
+
+    Attributes:
+        deleted (List[int]): ID удалённых клиентов.
+        not_found (List[int]): ID, которых не было в базе.
+    """
+
+    deleted: List[int]
+    not_found: List[int]
+
+
+class ClientSearchPage(BaseModel):
+    """
+    Страница результатов поиска клиентов, упорядоченных по релевантности.
+
+    Attributes:
+        items (List[ClientOut]): Найденные клиенты текущей страницы.
+        next_offset (Optional[int]): Смещение следующей страницы, None если страница последняя.
+    """
+
+    items: List[ClientOut]
+    next_offset: Optional[int] = None
+
+
+class ClientCount(BaseModel):
+    """
+    Количество клиентов.
+
+    Attributes:
+        total (int): Количество клиентов.
+        mode (Literal["exact", "estimate"]): Точное значение или оценка по статистике таблицы.
+    """
+
+    total: int
+    mode: Literal["exact", "estimate"]
+
+
+class ClientBatchGetItem(BaseModel):
+    """
+    Результат поиска одного ID в запросе batch-get.
+
+    Attributes:
+        id (int): Запрошенный ID.
+        found (bool): Найден ли клиент.
+        client (Optional[ClientOut]): Клиент, если found == True.
+    """
+
+    id: int
+    found: bool
+    client: Optional[ClientOut] = None
+
+
+class ClientBatchGetResult(BaseModel):
+    """
+    Ответ batch-get: по элементу на каждый запрошенный ID в порядке запроса.
+
+    Attributes:
+        items (List[ClientBatchGetItem]): Результаты поиска.
+    """
+
+    items: List[ClientBatchGetItem]
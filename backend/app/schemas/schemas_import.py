@@ -0,0 +1,39 @@
+from typing import List
+
+from pydantic import BaseModel
+
+
+class ImportRowError(BaseModel):
+    """
+    Описание строки CSV, отклонённой при импорте.
+
+    Attributes:
+        row (int): Номер строки данных в файле (без заголовка, с единицы).
+        error (str): Причина отказа.
+    """
+
+    row: int
+    error: str
+
+
+class ImportReport(BaseModel):
+    """
+    Отчёт об импорте клиентов из CSV.
+
+    Attributes:
+        total_rows (int): Количество прочитанных строк данных.
+        imported (int): Количество созданных клиентов.
+        rejected_invalid (int): Строки, не прошедшие проверку полей.
+        rejected_conflicts (int): Строки с email/телефоном, повторяющимися в файле или в базе.
+        errors (List[ImportRowError]): Первые отклонённые строки.
+        duration_seconds (float): Длительность импорта.
+        rows_per_second (float): Пропускная способность по прочитанным строкам.
+    """
+
+    total_rows: int
+    imported: int
+    rejected_invalid: int
+    rejected_conflicts: int
+    errors: List[ImportRowError]
+    duration_seconds: float
+    rows_per_second: float
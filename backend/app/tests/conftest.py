@@ -0,0 +1,68 @@
+from contextlib import contextmanager
+from typing import Iterator, List
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from db_connection_async import db_async_session
+from main import app
+
+
+@pytest.fixture
+def query_budget():
+    """
+    Проверяет, что блок кода выполняет не больше заданного числа SQL-запросов.
+
+    Считаются запросы всех движков приложения (основного и реплик). Превышение
+    проваливает тест со списком выполненных запросов, поэтому лишний SELECT
+    после commit или N+1 при чтении списка видны сразу.
+
+    Пример:
+        with query_budget(1):
+            client.get("/clients/1")
+    """
+
+    @contextmanager
+    def budget(max_queries: int) -> Iterator[List[str]]:
+        statements: List[str] = []
+
+        def record(conn, cursor, statement, parameters, context, executemany) -> None:
+            statements.append(statement)
+
+        engines = [db_async_session.engine, *db_async_session.replica_engines]
+        for engine in engines:
+            event.listen(engine.sync_engine, "before_cursor_execute", record)
+        try:
+            yield statements
+        finally:
+            for engine in engines:
+                event.remove(engine.sync_engine, "before_cursor_execute", record)
+
+        if len(statements) > max_queries:
+            listing = "\n\n".join(statement.strip() for statement in statements)
+            pytest.fail(
+                f"Выполнено SQL-запросов: {len(statements)}, бюджет {max_queries}:\n\n{listing}",
+                pytrace=False,
+            )
+
+    return budget
+
+
+@pytest.fixture(scope="session")
+def api_client():
+    """
+    TestClient приложения на всю сессию тестов.
+
+    Один экземпляр на сессию: lifespan запускается один раз, и фоновые задачи
+    приложения не переезжают между циклами событий разных TestClient.
+    Тесты пропускаются, если база данных недоступна.
+    """
+    with TestClient(app) as client:
+        try:
+            response = client.get("/clients/count", params={"mode": "estimate"})
+        except OSError as error:
+            pytest.skip(f"База данных недоступна: {error}")
+        if response.status_code >= 500:
+            pytest.skip(f"База данных недоступна: {response.text}")
+        yield client
@@ -0,0 +1,79 @@
+import asyncio
+import time
+
+import cache_invalidation
+from cache_invalidation import CacheInvalidationListener
+from core import LruTtlCache
+
+
+def test_lru_eviction():
+    cache = LruTtlCache(max_size=2, ttl=60)
+    cache.set(1, b"one")
+    cache.set(2, b"two")
+    cache.get(1)
+    cache.set(3, b"three")
+
+    assert cache.get(2) is None
+    assert cache.get(1) == b"one"
+    assert cache.evictions == 1
+
+
+def test_ttl_expiration():
+    cache = LruTtlCache(max_size=10, ttl=0.01)
+    cache.set(1, b"one")
+    time.sleep(0.02)
+
+    assert cache.get(1) is None
+    assert cache.expirations == 1
+
+
+def test_stale_value_is_not_cached_after_invalidation():
+    cache = LruTtlCache(max_size=10, ttl=60)
+    generation = cache.generation
+    cache.invalidate(1)
+    cache.set(1, b"stale", generation=generation)
+
+    assert cache.get(1) is None
+
+
+def test_concurrent_misses_load_once():
+    cache = LruTtlCache(max_size=10, ttl=60)
+    calls = []
+
+    async def load():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return 42
+
+    async def main():
+        return await asyncio.gather(*(cache.get_or_load("clients", load) for _ in range(10)))
+
+    assert asyncio.run(main()) == [42] * 10
+    assert len(calls) == 1
+    assert cache.coalesced == 9
+
+
+def test_listener_reconnects_after_unexpected_error(monkeypatch):
+    attempts = []
+
+    async def connect(dsn):
+        attempts.append(dsn)
+        if len(attempts) == 1:
+            raise RuntimeError("неожиданная ошибка")
+        await asyncio.Event().wait()
+
+    monkeypatch.setattr(cache_invalidation.asyncpg, "connect", connect)
+    cache = LruTtlCache(max_size=10, ttl=60)
+    cache.set(1, b"one")
+
+    async def main():
+        listener = CacheInvalidationListener("postgresql://", "channel", cache)
+        await listener.start()
+        # Первая пауза перед переподключением — одна секунда.
+        await asyncio.sleep(1.1)
+        assert not listener._task.done()
+        await listener.stop()
+
+    asyncio.run(main())
+    assert len(attempts) == 2
+    assert cache.get(1) is None
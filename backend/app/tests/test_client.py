@@ -78,9 +78,10 @@ async def test_fetch_all_clients(test_db, client):
 
     response = client.get("/clients")
     assert response.status_code == 200
-    assert isinstance(response.json(), List)
-    assert len(response.json()) == 1
-    assert response.json()[0]["email"] == client_data["email"]
+    assert isinstance(response.json()["items"], List)
+    assert len(response.json()["items"]) == 1
+    assert response.json()["next_cursor"] is None
+    assert response.json()["items"][0]["email"] == client_data["email"]
 
 @pytest.mark.asyncio
 async def test_update_client(test_db, client):
@@ -0,0 +1,18 @@
+import pytest
+
+from models import normalize_email, normalize_phone
+
+
+@pytest.mark.parametrize(
+    "number",
+    ["9990000000", "+7 (999) 000-0000", "8 999 000 00 00", "79990000000"],
+)
+def test_phone_formats_normalize_to_one_e164_number(number):
+    assert normalize_phone(number) == "+79990000000"
+
+
+def test_normalization_of_foreign_and_empty_values():
+    assert normalize_phone("+44 20 7946 0958") == "+442079460958"
+    assert normalize_phone("---") is None
+    assert normalize_email("  Foo@X.ru ") == "foo@x.ru"
+    assert normalize_email("   ") is None
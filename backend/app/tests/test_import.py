@@ -0,0 +1,33 @@
+import importlib
+
+from sqlalchemy.exc import IntegrityError
+
+from schemas import ImportReport
+
+
+# api.client_router в пакете api — объект роутера, модуль берётся по имени.
+client_router = importlib.import_module("api.client_router")
+
+
+CSV = "name,sur_name,middle_name,phone_number,email,facebook,vk\n"
+
+
+def test_import_retries_once_after_concurrent_unique_violation(api_client, monkeypatch):
+    calls = []
+
+    async def import_clients_csv(connection, lines, **kwargs):
+        calls.append(lines.read())
+        if len(calls) < 3:
+            raise IntegrityError("INSERT INTO contacts", {}, Exception("duplicate key"))
+        return ImportReport(
+            total_rows=0, imported=0, rejected_invalid=0, rejected_conflicts=0,
+            errors=[], duration_seconds=0.0, rows_per_second=0.0,
+        )
+
+    monkeypatch.setattr(client_router, "import_clients_csv", import_clients_csv)
+    files = {"file": ("clients.csv", CSV, "text/csv")}
+
+    assert api_client.post("/clients/import", files=files).status_code == 400
+    assert api_client.post("/clients/import", files=files).status_code == 200
+    # Повтор читает файл с начала.
+    assert calls == [CSV] * 3
@@ -0,0 +1,32 @@
+import datetime
+import uuid
+
+from core import encode_cursor
+
+
+def test_list_etag_follows_page_rows(api_client):
+    tag = uuid.uuid4().hex[:8]
+    payload = {
+        "name": "etag",
+        "sur_name": tag,
+        "contacts": {"phone_number": f"4{uuid.uuid4().int % 10 ** 9:09d}", "email": f"{tag}@etag.test"},
+    }
+    created = api_client.post("/clients/", json=payload).json()
+    client_id = created["id"]
+    try:
+        # Страница из одного нового клиента: курсор стоит сразу перед ним.
+        create_at_day = datetime.datetime.fromisoformat(created["create_at_day"])
+        params = {"limit": 1, "after": encode_cursor(create_at_day, client_id - 1)}
+        page = api_client.get("/clients/", params=params)
+        assert page.json()["items"][0]["id"] == client_id
+
+        etag = page.headers["etag"]
+        unchanged = api_client.get("/clients/", params=params, headers={"If-None-Match": etag})
+        assert unchanged.status_code == 304
+
+        api_client.patch(f"/clients/{client_id}", json={"contacts": {"vk": "etag"}})
+        changed = api_client.get("/clients/", params=params, headers={"If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.headers["etag"] != etag
+    finally:
+        api_client.delete(f"/clients/{client_id}")
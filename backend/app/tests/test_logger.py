@@ -0,0 +1,50 @@
+import logging
+
+from core.logger import LogRateLimiter, crm_logger
+
+
+def make_record(level, msg, *args):
+    return logging.LogRecord("test", level, __file__, 1, msg, args, None)
+
+
+def test_rate_limit_suppresses_storm_per_template():
+    limiter = LogRateLimiter(rate=0.001, burst=2)
+
+    passed = [
+        limiter.filter(make_record(logging.ERROR, "Ошибка подключения к бд %s", error))
+        for error in range(5)
+    ]
+
+    assert passed == [True, True, False, False, False]
+    assert limiter.filter(make_record(logging.ERROR, "Другая ошибка %s", 1))
+    [(count, record)] = limiter.pop_suppressed()
+    assert count == 3
+    assert record.msg == "Ошибка подключения к бд %s"
+    assert limiter.pop_suppressed() == []
+
+
+def test_debug_sampling():
+    limiter = LogRateLimiter(rate=0, burst=0, debug_sample_rate=0.25)
+
+    passed = [limiter.filter(make_record(logging.DEBUG, "Клиент создан %s", i)) for i in range(8)]
+
+    assert passed == [True, False, False, False, True, False, False, False]
+    assert limiter.filter(make_record(logging.INFO, "Клиент создан %s", 1))
+
+
+def warn_from_helper(message, *args):
+    crm_logger.warning(message, *args, stacklevel=2)
+
+
+def test_level_methods_report_caller_and_accept_stacklevel(caplog):
+    with caplog.at_level(logging.INFO, logger=crm_logger.logger.name):
+        crm_logger.info("default %s", 1)
+        warn_from_helper("explicit %s", 2)
+        crm_logger.log(logging.INFO, "log %s", 3)
+
+    default, explicit, direct = caplog.records[-3:]
+    caller = "test_level_methods_report_caller_and_accept_stacklevel"
+    assert (default.getMessage(), default.funcName) == ("default 1", caller)
+    # stacklevel=2 из обёртки указывает на того, кто вызвал обёртку.
+    assert (explicit.getMessage(), explicit.funcName) == ("explicit 2", caller)
+    assert (direct.getMessage(), direct.funcName) == ("log 3", caller)
@@ -0,0 +1,56 @@
+import pathlib
+import uuid
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import text
+
+from db_connection_async import db_async_session
+
+NORMALIZED_LOOKUP_REVISION = "3f6d8b2a4c71"
+PREVIOUS_REVISION = "9a2c5e7f1d84"
+
+
+def _alembic_config() -> Config:
+    # Без alembic.ini: fileConfig перенастроил бы логгеры приложения.
+    config = Config()
+    config.set_main_option(
+        "script_location", str(pathlib.Path(__file__).parents[2] / "alembic")
+    )
+    return config
+
+
+def test_normalized_lookup_upgrade_can_be_rerun(api_client):
+    tag = uuid.uuid4().hex[:8]
+    client_ids = []
+    for email in (f"{tag}@dup.test", f"{tag}-other@dup.test"):
+        payload = {
+            "name": "migration",
+            "sur_name": tag,
+            "contacts": {"phone_number": f"4{uuid.uuid4().int % 10 ** 9:09d}", "email": email},
+        }
+        client_ids.append(api_client.post("/clients/", json=payload).json()["id"])
+
+    async def execute(statement: str) -> None:
+        async with db_async_session.engine.begin() as connection:
+            await connection.execute(text(statement), {"client_id": client_ids[1]})
+
+    config = _alembic_config()
+    try:
+        command.downgrade(config, PREVIOUS_REVISION)
+        # До миграции адреса, отличающиеся регистром, могли принадлежать разным клиентам.
+        api_client.portal.call(
+            execute,
+            f"UPDATE contacts SET email = '{tag.upper()}@DUP.TEST' WHERE client_id = :client_id",
+        )
+        command.upgrade(config, NORMALIZED_LOOKUP_REVISION)
+
+        # Повторный запуск после успешного: индексы уже валидны, дубликат остаётся NULL.
+        command.stamp(config, PREVIOUS_REVISION)
+        command.upgrade(config, NORMALIZED_LOOKUP_REVISION)
+    finally:
+        try:
+            command.upgrade(config, "head")
+        finally:
+            for client_id in client_ids:
+                api_client.delete(f"/clients/{client_id}")
@@ -0,0 +1,22 @@
+import datetime
+
+import pytest
+
+from core import (
+    encode_cursor,
+    decode_cursor,
+)
+
+
+def test_cursor_round_trip():
+    create_at_day = datetime.datetime(2025, 1, 5, 17, 9, 12, 537992)
+
+    cursor = encode_cursor(create_at_day, 42)
+
+    assert decode_cursor(cursor) == (create_at_day, 42)
+
+
+@pytest.mark.parametrize("cursor", ["garbage", "", "WzEsMl0", "WyJ4IiwiMSJd"])
+def test_decode_cursor_rejects_malformed(cursor):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
@@ -0,0 +1,25 @@
+import pytest
+
+from crud import client_projection
+
+
+def test_projection_is_cached_per_field_set():
+    assert client_projection("id,name") is client_projection(" name , id ")
+    assert client_projection(None) is client_projection("contacts,update_at_day,create_at_day,middle_name,sur_name,name,id")
+
+
+def test_projection_joins_contacts_only_when_needed():
+    names_only = client_projection("id,name,sur_name")
+    with_email = client_projection("name,contacts.email")
+
+    assert not names_only.needs_contacts
+    assert [column.key for column in with_email.columns][-1] == "email"
+    assert with_email.to_dict(
+        {"id": 1, "create_at_day": None, "update_at_day": None, "name": "a", "email": "a@b.ru"}
+    ) == {"name": "a", "contacts": {"email": "a@b.ru"}}
+
+
+@pytest.mark.parametrize("fields", ["", "id,password", "contacts.password"])
+def test_projection_rejects_unknown_fields(fields):
+    with pytest.raises(ValueError):
+        client_projection(fields)
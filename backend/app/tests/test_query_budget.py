@@ -0,0 +1,24 @@
+import uuid
+
+
+def test_client_crud_stays_within_query_budget(api_client, query_budget):
+    tag = uuid.uuid4().hex[:8]
+    payload = {
+        "name": "budget",
+        "sur_name": tag,
+        "contacts": {"phone_number": f"3{uuid.uuid4().int % 10 ** 9:09d}", "email": f"{tag}@budget.test"},
+    }
+
+    with query_budget(1):
+        client_id = api_client.post("/clients/", json=payload).json()["id"]
+    with query_budget(1):
+        response = api_client.get(f"/clients/{client_id}")
+    with query_budget(2):
+        api_client.get("/clients/", params={"limit": 50})
+    with query_budget(2):
+        api_client.patch(f"/clients/{client_id}", json={"contacts": {"vk": "budget"}})
+    with query_budget(1):
+        api_client.delete(f"/clients/{client_id}")
+
+    assert response.headers["x-db-queries"] == "1"
+    assert "db;dur=" in response.headers["server-timing"]
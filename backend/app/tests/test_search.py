@@ -0,0 +1,32 @@
+import uuid
+
+
+def test_search_pages_do_not_repeat_or_skip_clients(api_client):
+    tag = uuid.uuid4().hex[:8]
+    created_ids = []
+    try:
+        # У всех клиентов одинаковый ранг: порядок держится только на id.
+        for number in range(7):
+            payload = {
+                "name": "search",
+                "sur_name": tag,
+                "contacts": {
+                    "phone_number": f"4{uuid.uuid4().int % 10 ** 9:09d}",
+                    "email": f"{tag}{number}@search.test",
+                },
+            }
+            created_ids.append(api_client.post("/clients/", json=payload).json()["id"])
+
+        found_ids = []
+        offset = 0
+        while offset is not None:
+            page = api_client.get("/clients/search", params={"q": tag, "limit": 2, "offset": offset})
+            assert page.status_code == 200
+            found_ids += [client["id"] for client in page.json()["items"]]
+            offset = page.json()["next_offset"]
+
+        assert len(found_ids) == len(set(found_ids))
+        assert set(created_ids) <= set(found_ids)
+    finally:
+        for client_id in created_ids:
+            api_client.delete(f"/clients/{client_id}")
@@ -0,0 +1,32 @@
+import asyncio
+
+from core.slow_queries import SlowQueryLog, fingerprint, parameter_shapes
+
+
+def test_fingerprint_ignores_values_and_list_length():
+    assert fingerprint("SELECT * FROM t WHERE id IN ($1::INTEGER, $2::INTEGER) AND name = 'x'") == fingerprint(
+        "SELECT *\n  FROM t WHERE id IN ($1::INTEGER, $2::INTEGER, $3::INTEGER) AND name = 'y'"
+    )
+    assert fingerprint("SELECT anon_1 FROM t LIMIT 10") == "SELECT anon_1 FROM t LIMIT ?"
+
+
+def test_slow_query_is_aggregated_by_fingerprint_without_values():
+    log = SlowQueryLog(threshold_ms=0, explain=False)
+    log._record(None, "SELECT * FROM t WHERE email = $1", ("secret@x.ru",), 30.0)
+    log._record(None, "SELECT * FROM t WHERE email = $1", ("other@x.ru",), 10.0)
+
+    (entry,) = log.stats()["queries"]
+    assert (entry["count"], entry["total_ms"], entry["max_ms"]) == (2, 40.0, 30.0)
+    assert entry["parameters"] == parameter_shapes(("secret@x.ru",)) == ["str(11)"]
+
+
+def test_close_cancels_pending_explains():
+    log = SlowQueryLog(threshold_ms=0)
+
+    async def main():
+        task = asyncio.get_running_loop().create_task(asyncio.sleep(60))
+        log._explain_tasks.add(task)
+        await log.close()
+        return task
+
+    assert asyncio.run(main()).cancelled()
@@ -0,0 +1,87 @@
+"""Сравнение путей сериализации списка клиентов.
+
+orm_pydantic — прежний путь GET /clients/: select(Client) с joined-загрузкой
+контактов, проверка ClientPage с from_attributes и кодирование через
+jsonable_encoder + json. core_orjson — текущий fetch_all_clients: плоские
+строки Core, словари ClientOut и orjson.
+
+Запуск из каталога backend (нужна база из APP_CONFIG__DB__URL):
+
+    python benchmarks/list_serialization.py [--limit 500] [--iterations 50]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from sqlalchemy import select  # noqa: E402
+
+from core import encode_json  # noqa: E402
+from crud import fetch_all_clients  # noqa: E402
+from db_connection_async import db_async_session  # noqa: E402
+from models import Client  # noqa: E402
+from schemas import ClientPage  # noqa: E402
+
+
+async def orm_pydantic(session, limit: int) -> bytes:
+    stmt = select(Client).order_by(Client.create_at_day, Client.id).limit(limit)
+    clients = (await session.execute(stmt)).scalars().all()
+    page = ClientPage.model_validate({"items": clients, "next_cursor": None}, from_attributes=True)
+    return json.dumps(jsonable_encoder(page), ensure_ascii=False).encode()
+
+
+async def core_orjson(session, limit: int) -> bytes:
+    clients, next_cursor = await fetch_all_clients(session, limit=limit)
+    return encode_json({"items": clients, "next_cursor": next_cursor})
+
+
+async def run(path, limit: int, iterations: int):
+    """Возвращает страниц в секунду и пиковую память одного вызова в КиБ."""
+    async with db_async_session.session_factory() as session:
+        await path(session, limit)
+
+        started = time.perf_counter()
+        for _ in range(iterations):
+            await path(session, limit)
+            session.expunge_all()
+        elapsed = time.perf_counter() - started
+
+        tracemalloc.start()
+        await path(session, limit)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        session.expunge_all()
+
+    return iterations / elapsed, peak / 1024
+
+
+async def main(limit: int, iterations: int) -> None:
+    try:
+        results = {
+            path.__name__: await run(path, limit, iterations)
+            for path in (orm_pydantic, core_orjson)
+        }
+    finally:
+        await db_async_session.dispose()
+
+    print(f"Страница из {limit} клиентов, {iterations} итераций")
+    for name, (pages_per_second, peak_kib) in results.items():
+        print(f"  {name:13} {pages_per_second:8.1f} стр/с  пик памяти {peak_kib:9.1f} КиБ")
+    base, fast = results["orm_pydantic"], results["core_orjson"]
+    print(f"  ускорение x{fast[0] / base[0]:.1f}, память x{base[1] / fast[1]:.1f} меньше")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Сериализация страницы клиентов: ORM+Pydantic и Core+orjson")
+    parser.add_argument("--limit", type=int, default=500)
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.limit, args.iterations))
@@ -0,0 +1,332 @@
+"""Нагрузочный тест HTTP API клиентов.
+
+Скрипт наполняет базу тестовыми клиентами, поднимает app из main.py
+в процессе (httpx.ASGITransport, без сети и uvicorn) и прогоняет сценарии
+на фиксированных уровнях конкурентности. Для каждого сценария и уровня
+считаются p50/p95/p99 задержки, запросы в секунду, доля ошибок и число
+SQL-запросов к базе на один HTTP-запрос.
+
+Тестовые клиенты помечаются sur_name = "loadtest" и переиспользуются между
+запусками, если их количество совпадает с --seed. Клиенты, созданные
+сценарием create, удаляются сценарием delete того же уровня.
+
+Запуск из каталога backend (нужна база из APP_CONFIG__DB__URL):
+
+    python benchmarks/load_test.py [--seed 10000] [--concurrency 1 8 32]
+        [--requests 500] [--output report.json]
+
+Сравнение с сохранённым отчётом, код возврата 1 при регрессии:
+
+    python benchmarks/load_test.py --baseline baseline.json [--tolerance 0.15]
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import platform
+import random
+import sys
+import time
+from datetime import datetime, timezone
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+# Запись каждого запроса в лог и эхо SQL искажают замеры.
+os.environ.setdefault("APP_CONFIG__LOGGING__LEVEL", "WARNING")
+os.environ.setdefault("APP_CONFIG__DB__ECHO", "false")
+
+import httpx  # noqa: E402
+from sqlalchemy import event, text  # noqa: E402
+
+from db_connection_async import db_async_session  # noqa: E402
+from main import app  # noqa: E402
+
+
+SEED_TAG = "loadtest"
+
+_DELETE_SEED_SQL = text("DELETE FROM clients WHERE sur_name = :tag")
+
+# Тот же приём, что в импорте CSV: id выдаются из последовательности заранее,
+# поэтому clients и contacts вставляются из одного набора строк.
+_SEED_SQL = text(
+    """
+    WITH numbered AS MATERIALIZED (
+        SELECT nextval(pg_get_serial_sequence('clients', 'id')) AS client_id, n
+        FROM generate_series(1, :count) AS n
+    ),
+    new_clients AS (
+        INSERT INTO clients (id, name, sur_name, create_at_day)
+        SELECT client_id, 'load' || n, :tag, now() - n * interval '1 second' FROM numbered
+    )
+    INSERT INTO contacts (client_id, phone_number, email, email_norm, phone_e164)
+    SELECT client_id,
+           '5' || lpad(n::text, 9, '0'),
+           'load' || n || '@load.test',
+           'load' || n || '@load.test',
+           '+75' || lpad(n::text, 9, '0')
+    FROM numbered
+    """
+)
+
+
+class DbRoundTrips:
+    """Считает запросы, отправленные драйверу всеми движками приложения."""
+
+    def __init__(self) -> None:
+        self.count = 0
+
+    def __call__(self, *args) -> None:
+        self.count += 1
+
+
+async def seed(count: int) -> List[int]:
+    """Создаёт count тестовых клиентов, если их ещё нет, и возвращает их id."""
+    async with db_async_session.engine.begin() as connection:
+        existing = (
+            await connection.execute(
+                text("SELECT id FROM clients WHERE sur_name = :tag ORDER BY id"), {"tag": SEED_TAG}
+            )
+        ).scalars().all()
+        if len(existing) == count:
+            return list(existing)
+
+        await connection.execute(_DELETE_SEED_SQL, {"tag": SEED_TAG})
+        await connection.execute(_SEED_SQL, {"count": count, "tag": SEED_TAG})
+        ids = (
+            await connection.execute(
+                text("SELECT id FROM clients WHERE sur_name = :tag ORDER BY id"), {"tag": SEED_TAG}
+            )
+        ).scalars().all()
+
+    async with db_async_session.engine.connect() as connection:
+        await connection.execution_options(isolation_level="AUTOCOMMIT")
+        await connection.execute(text("ANALYZE clients"))
+        await connection.execute(text("ANALYZE contacts"))
+    return list(ids)
+
+
+RequestFactory = Callable[[int], Tuple[str, str, Dict[str, Any]]]
+
+
+def build_scenarios(seed_ids: List[int], created: List[int], run_tag: str) -> Dict[str, RequestFactory]:
+    """Сценарии: имя -> функция, возвращающая (метод, путь, аргументы httpx) для i-го запроса."""
+    rng = random.Random(42)
+    seed_count = len(seed_ids)
+
+    def created_id(i: int) -> int:
+        return created[i % len(created)]
+
+    return {
+        "list": lambda i: ("GET", "/clients/", {"params": {"limit": 50}}),
+        "list_fields": lambda i: ("GET", "/clients/", {"params": {"limit": 50, "fields": "id,name,sur_name"}}),
+        "list_total": lambda i: ("GET", "/clients/", {"params": {"limit": 50, "total": "exact"}}),
+        "get": lambda i: ("GET", f"/clients/{rng.choice(seed_ids)}", {}),
+        "batch_get": lambda i: ("POST", "/clients/batch-get", {"json": {"ids": rng.sample(seed_ids, min(50, seed_count))}}),
+        "by_contact": lambda i: (
+            "GET", "/clients/by-contact", {"params": {"phone": f"8 5{rng.randint(1, seed_count):09d}"}}
+        ),
+        "search": lambda i: ("GET", "/clients/search", {"params": {"q": f"load{rng.randint(1, seed_count)}", "limit": 10}}),
+        # Короткие строки совпадают почти со всеми тестовыми клиентами:
+        # проверка предела кандидатов поиска (search_branch_limit).
+        "search_broad": lambda i: ("GET", "/clients/search", {"params": {"q": ("loa", "000", "test")[i % 3], "limit": 10}}),
+        "count_estimate": lambda i: ("GET", "/clients/count", {"params": {"mode": "estimate"}}),
+        "create": lambda i: (
+            "POST",
+            "/clients/",
+            {
+                "json": {
+                    "name": "bench",
+                    "sur_name": run_tag,
+                    "contacts": {"phone_number": f"6{i:09d}", "email": f"{run_tag}-{i}@load.test"},
+                }
+            },
+        ),
+        "patch": lambda i: ("PATCH", f"/clients/{created_id(i)}", {"json": {"name": f"bench{i}"}}),
+        "delete": lambda i: ("DELETE", f"/clients/{created.pop()}", {}),
+    }
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Перцентиль по методу ближайшего ранга."""
+    index = max(0, min(len(sorted_values) - 1, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+async def run_scenario(
+    client: httpx.AsyncClient,
+    factory: RequestFactory,
+    requests: int,
+    concurrency: int,
+    round_trips: DbRoundTrips,
+    on_response: Optional[Callable[[httpx.Response], None]] = None,
+) -> Dict[str, Any]:
+    """Выполняет requests запросов сценария в concurrency параллельных воркерах."""
+    latencies: List[float] = []
+    errors = 0
+    counter = itertools.count()
+
+    async def worker() -> None:
+        nonlocal errors
+        for i in counter:
+            if i >= requests:
+                return
+            method, path, kwargs = factory(i)
+            started = time.perf_counter()
+            response = await client.request(method, path, **kwargs)
+            latencies.append(time.perf_counter() - started)
+            if response.status_code >= 400:
+                errors += 1
+            elif on_response is not None:
+                on_response(response)
+
+    queries_before = round_trips.count
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "requests": requests,
+        "errors": errors,
+        "rps": round(requests / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 0.50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 0.95) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 2),
+        "db_round_trips_per_request": round((round_trips.count - queries_before) / requests, 2),
+    }
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+    """Наполняет базу, прогоняет все сценарии и возвращает отчёт."""
+    round_trips = DbRoundTrips()
+    for engine in (db_async_session.engine, *db_async_session.replica_engines):
+        event.listen(engine.sync_engine, "after_cursor_execute", round_trips)
+
+    results: Dict[str, Dict[str, Any]] = {}
+    async with app.router.lifespan_context(app):
+        seed_ids = await seed(args.seed)
+        run_tag = f"bench{int(time.time())}"
+        created: List[int] = []
+        scenarios = build_scenarios(seed_ids, created, run_tag)
+        selected = args.scenarios or list(scenarios)
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            for _ in range(args.warmup):
+                await client.get("/clients/", params={"limit": 50})
+
+            for concurrency in args.concurrency:
+                offset = concurrency * args.requests
+                for name in selected:
+                    factory = scenarios[name]
+                    on_response = None
+                    if name == "create":
+                        # Уникальные контакты на каждом уровне конкурентности.
+                        factory = lambda i, create=scenarios["create"], offset=offset: create(offset + i)
+                        on_response = lambda response: created.append(response.json()["id"])
+                    if name in ("patch", "delete") and not created:
+                        continue
+                    requests = min(args.requests, len(created)) if name == "delete" else args.requests
+                    result = await run_scenario(
+                        client, factory, requests, concurrency, round_trips, on_response
+                    )
+                    # Кука read_your_writes после записи перевела бы чтения следующих
+                    # сценариев на основную базу.
+                    client.cookies.clear()
+                    results.setdefault(name, {})[str(concurrency)] = result
+                    print(
+                        f"{name:15} c={concurrency:<4} {result['rps']:9.1f} rps  "
+                        f"p50 {result['p50_ms']:7.2f}  p95 {result['p95_ms']:7.2f}  "
+                        f"p99 {result['p99_ms']:7.2f} ms  "
+                        f"sql/req {result['db_round_trips_per_request']:5.2f}  "
+                        f"errors {result['errors']}"
+                    )
+
+        if created:
+            async with db_async_session.engine.begin() as connection:
+                await connection.execute(_DELETE_SEED_SQL, {"tag": run_tag})
+
+    return {
+        "meta": {
+            "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "seed_clients": args.seed,
+            "requests_per_scenario": args.requests,
+            "concurrency": args.concurrency,
+        },
+        "results": results,
+    }
+
+
+def compare(report: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """Возвращает описания регрессий относительно baseline.
+
+    Регрессия — рост p95 или падение rps больше чем на tolerance,
+    рост числа SQL-запросов на HTTP-запрос или появление ошибок.
+    """
+    regressions = []
+    for name, levels in report["results"].items():
+        for concurrency, current in levels.items():
+            previous = baseline.get("results", {}).get(name, {}).get(concurrency)
+            if previous is None:
+                continue
+            label = f"{name} c={concurrency}"
+            if current["p95_ms"] > previous["p95_ms"] * (1 + tolerance):
+                regressions.append(f"{label}: p95 {previous['p95_ms']} -> {current['p95_ms']} мс")
+            if current["rps"] < previous["rps"] * (1 - tolerance):
+                regressions.append(f"{label}: rps {previous['rps']} -> {current['rps']}")
+            if current["db_round_trips_per_request"] > previous["db_round_trips_per_request"]:
+                regressions.append(
+                    f"{label}: SQL на запрос {previous['db_round_trips_per_request']}"
+                    f" -> {current['db_round_trips_per_request']}"
+                )
+            if current["errors"] > previous["errors"]:
+                regressions.append(f"{label}: ошибок {previous['errors']} -> {current['errors']}")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Нагрузочный тест API клиентов с отчётом в JSON")
+    parser.add_argument("--seed", type=int, default=10000, help="Количество тестовых клиентов в базе")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--requests", type=int, default=500, help="Запросов на сценарий и уровень")
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--scenarios", nargs="+", help="Подмножество сценариев, по умолчанию все")
+    parser.add_argument("--output", default="load_test_report.json")
+    parser.add_argument("--baseline", help="Отчёт прошлого запуска для сравнения")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.15,
+        help="Допустимое ухудшение p95 и rps относительно baseline (0.15 = 15%%)",
+    )
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+    with open(args.output, "w", encoding="utf-8") as file:
+        json.dump(report, file, ensure_ascii=False, indent=2)
+    print(f"Отчёт записан в {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as file:
+            regressions = compare(report, json.load(file), args.tolerance)
+        for regression in regressions:
+            print(f"РЕГРЕССИЯ {regression}")
+        if regressions:
+            return 1
+        print("Регрессий относительно baseline нет")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,130 @@
+"""Накладные расходы метрик Prometheus на горячем эндпоинте.
+
+Запросы подаются прямо в ASGI-приложение, без сети и HTTP-клиента,
+поэтому в замер попадает только работа приложения. Раунды с метриками
+и без них чередуются, сравниваются медианы времени на запрос.
+
+Запуск из каталога backend (нужна база из APP_CONFIG__DB__URL):
+
+    python benchmarks/metrics_overhead.py [--requests 2000] [--rounds 15] [--max-overhead 2]
+
+Код возврата 1, если накладные расходы превышают --max-overhead процентов.
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+from sqlalchemy import event, select  # noqa: E402
+
+from core import MetricsMiddleware  # noqa: E402
+from core.metrics import _after_cursor_execute, _before_cursor_execute  # noqa: E402
+from db_connection_async import db_async_session  # noqa: E402
+from main import app  # noqa: E402
+from models import Client  # noqa: E402
+
+
+def build_stacks():
+    """Собирает стек middleware приложения с метриками и без них."""
+    instrumented = app.build_middleware_stack()
+    middleware = app.user_middleware
+    app.user_middleware = [item for item in middleware if item.cls is not MetricsMiddleware]
+    plain = app.build_middleware_stack()
+    app.user_middleware = middleware
+    return {True: instrumented, False: plain}
+
+
+def set_instrumentation(stacks, enabled: bool) -> None:
+    """Переключает стек middleware и обработчики событий движка."""
+    engine = db_async_session.engine.sync_engine
+    if enabled and not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    elif not enabled and event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.remove(engine, "before_cursor_execute", _before_cursor_execute)
+        event.remove(engine, "after_cursor_execute", _after_cursor_execute)
+    app.middleware_stack = stacks[enabled]
+
+
+async def call(path: str) -> int:
+    """Выполняет GET-запрос к приложению и возвращает статус ответа."""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 1),
+        "server": ("bench", 80),
+    }
+    status = 0
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app(scope, receive, send)
+    return status
+
+
+async def measure(path: str, requests: int) -> float:
+    """Возвращает среднее время одного запроса в микросекундах."""
+    started = time.perf_counter()
+    for _ in range(requests):
+        await call(path)
+    return (time.perf_counter() - started) / requests * 1e6
+
+
+async def main(requests: int, rounds: int, max_overhead: float) -> int:
+    async with app.router.lifespan_context(app):
+        async with db_async_session.session_factory() as session:
+            client_id = await session.scalar(select(Client.id).limit(1))
+        if client_id is None:
+            print("В базе нет клиентов, создайте хотя бы одного")
+            return 1
+
+        path = f"/clients/{client_id}"
+        if await call(path) != 200:
+            print(f"{path} не отвечает 200")
+            return 1
+
+        stacks = build_stacks()
+        timings = {True: [], False: []}
+        for _ in range(rounds):
+            for enabled in (False, True):
+                set_instrumentation(stacks, enabled)
+                await measure(path, requests // 10)
+                timings[enabled].append(await measure(path, requests))
+
+    plain = statistics.median(timings[False])
+    instrumented = statistics.median(timings[True])
+    overhead = (instrumented - plain) / plain * 100
+    print(f"GET {path} (кеш процесса), медиана из {rounds} раундов по {requests} запросов")
+    print(f"  без метрик:  {plain:8.1f} мкс/запрос")
+    print(f"  с метриками: {instrumented:8.1f} мкс/запрос")
+    print(f"  накладные расходы: {overhead:+.2f}% (порог {max_overhead}%)")
+    return 1 if overhead > max_overhead else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Накладные расходы метрик Prometheus")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--rounds", type=int, default=15)
+    parser.add_argument("--max-overhead", type=float, default=2.0)
+    args = parser.parse_args()
+
+    raise SystemExit(asyncio.run(main(args.requests, args.rounds, args.max_overhead)))
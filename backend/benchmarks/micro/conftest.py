@@ -0,0 +1,92 @@
+"""Общие фикстуры микробенчмарков.
+
+Бенчмарки синхронные (pytest-benchmark), поэтому корутины CRUD выполняются
+в одном event loop на всю сессию через фикстуру run. Каждый замер дополняется
+пиковой памятью одного вызова по tracemalloc (фикстура track_memory), она
+попадает в extra_info отчёта --benchmark-json.
+
+Запуск из каталога backend (нужна база из APP_CONFIG__DB__URL, без неё
+бенчмарки CRUD пропускаются):
+
+    pip install -r benchmarks/micro/requirements.txt
+    python -m pytest benchmarks/micro --benchmark-autosave
+
+Сравнение с сохранённым запуском и провал при замедлении медианы больше 10%:
+
+    python -m pytest benchmarks/micro --benchmark-compare --benchmark-compare-fail=median:10%
+"""
+
+import asyncio
+import os
+import sys
+import tracemalloc
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Iterator,
+)
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "app"))
+
+# Запись в лог и эхо SQL искажают замеры.
+os.environ.setdefault("APP_CONFIG__LOGGING__LEVEL", "WARNING")
+os.environ.setdefault("APP_CONFIG__DB__ECHO", "false")
+
+from sqlalchemy.exc import DBAPIError  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncSession  # noqa: E402
+
+from db_connection_async import db_async_session  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def run() -> Iterator[Callable[[Awaitable], Any]]:
+    """Выполняет корутину в общем event loop сессии."""
+    loop = asyncio.new_event_loop()
+    yield loop.run_until_complete
+    loop.run_until_complete(db_async_session.dispose())
+    loop.close()
+
+
+@pytest.fixture(scope="session")
+def db_session(run) -> Iterator[AsyncSession]:
+    """Сессия внутри внешней транзакции, которая откатывается после всех замеров.
+
+    commit функций CRUD фиксирует только точку сохранения, поэтому база
+    не меняется между запусками. Без доступной базы тесты пропускаются.
+    """
+    try:
+        connection = run(db_async_session.engine.connect())
+    except (OSError, DBAPIError) as error:
+        pytest.skip(f"База данных недоступна: {error}")
+
+    transaction = run(connection.begin())
+    session = AsyncSession(
+        bind=connection,
+        join_transaction_mode="create_savepoint",
+        expire_on_commit=False,
+    )
+    yield session
+    run(session.close())
+    run(transaction.rollback())
+    run(connection.close())
+
+
+@pytest.fixture
+def track_memory(benchmark) -> Callable[[Callable[[], Any]], None]:
+    """Замеряет пиковую и оставшуюся память одного вызова и пишет их в extra_info."""
+
+    def measure(function: Callable[[], Any]) -> None:
+        tracemalloc.start()
+        try:
+            result = function()
+            current, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        del result
+        benchmark.extra_info["peak_kib"] = round(peak / 1024, 1)
+        benchmark.extra_info["retained_kib"] = round(current / 1024, 1)
+
+    return measure
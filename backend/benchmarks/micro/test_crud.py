@@ -0,0 +1,80 @@
+"""Функции CRUD на реальной базе данных.
+
+Все изменения выполняются внутри транзакции фикстуры db_session
+и откатываются после сессии бенчмарков.
+"""
+
+import itertools
+import uuid
+
+import pytest
+
+from crud import (
+    client_projection,
+    create_client_record,
+    fetch_all_clients,
+    search_clients,
+    update_client_record,
+)
+from schemas import ClientIn, ClientUpdate
+
+
+_TAG = uuid.uuid4().hex[:8]
+_numbers = itertools.count()
+
+
+def _client_in():
+    number = next(_numbers)
+    return ClientIn.model_validate(
+        {
+            "name": "bench",
+            "sur_name": _TAG,
+            "contacts": {
+                "phone_number": f"4{number:09d}",
+                "email": f"{_TAG}-{number}@bench.test",
+            },
+        }
+    )
+
+
+def test_create_client_record(benchmark, track_memory, run, db_session):
+    track_memory(lambda: run(create_client_record(db_session, _client_in())))
+    benchmark(lambda: run(create_client_record(db_session, _client_in())))
+
+
+def test_update_client_record(benchmark, track_memory, run, db_session):
+    client = run(create_client_record(db_session, _client_in()))
+    names = (f"bench{number}" for number in itertools.count())
+
+    def update():
+        return run(update_client_record(db_session, client.id, ClientUpdate(name=next(names))))
+
+    track_memory(update)
+    benchmark(update)
+
+
+@pytest.mark.parametrize("limit", [50, 500])
+@pytest.mark.parametrize("fields", [None, "id,name,sur_name"], ids=["all", "names"])
+def test_fetch_all_clients(benchmark, track_memory, run, db_session, limit, fields):
+    projection = client_projection(fields)
+
+    def fetch():
+        return run(fetch_all_clients(db_session, limit=limit, projection=projection))
+
+    track_memory(fetch)
+    benchmark(fetch)
+
+
+# "bench" и "000" совпадают со многими клиентами, поэтому время не должно
+# расти с размером таблицы: ранжируется не больше search_branch_limit
+# кандидатов из каждого индекса.
+@pytest.mark.parametrize("query", ["bench", "000", "@bench.test"], ids=["name", "phone", "email"])
+def test_search_clients(benchmark, track_memory, run, db_session, query):
+    for _ in range(50):
+        run(create_client_record(db_session, _client_in()))
+
+    def search():
+        return run(search_clients(db_session, query=query, limit=10))
+
+    track_memory(search)
+    benchmark(search)
@@ -0,0 +1,99 @@
+"""Сериализация списков клиентов без базы данных.
+
+Сравниваются пути, которыми API отдавал и отдаёт списки:
+ClientOut.model_validate по ORM-объектам, ClientPage + jsonable_encoder + json
+(прежний путь), ClientPage.model_dump_json и encode_json (orjson) по словарям,
+которые возвращает fetch_all_clients.
+"""
+
+import datetime
+import json
+
+import pytest
+from fastapi.encoders import jsonable_encoder
+
+from core import encode_json
+from models import Client, Contact
+from schemas import ClientOut, ClientPage
+
+
+SIZES = (1000, 10000, 100000)
+# Число повторов на размер: 100k клиентов кодируются секундами.
+ROUNDS = {1000: 20, 10000: 5, 100000: 2}
+
+_CREATED = datetime.datetime(2026, 1, 1, 12, 0, 0)
+
+
+def _client_dicts(size):
+    return [
+        {
+            "id": number,
+            "name": f"Имя{number}",
+            "sur_name": f"Фамилия{number}",
+            "middle_name": None,
+            "create_at_day": _CREATED,
+            "update_at_day": None,
+            "contacts": {
+                "phone_number": f"9{number:09d}",
+                "email": f"client{number}@example.ru",
+                "facebook": None,
+                "vk": f"id{number}",
+                "client_id": number,
+            },
+        }
+        for number in range(1, size + 1)
+    ]
+
+
+def _orm_clients(size):
+    clients = []
+    for item in _client_dicts(size):
+        contacts = Contact(**item.pop("contacts"))
+        clients.append(Client(**item, contacts=contacts))
+    return clients
+
+
+@pytest.fixture(scope="module", params=SIZES, ids=lambda size: f"{size}")
+def size(request):
+    return request.param
+
+
+@pytest.fixture(scope="module")
+def client_dicts(size):
+    return _client_dicts(size)
+
+
+def test_model_validate_orm(benchmark, track_memory, size):
+    clients = _orm_clients(size)
+
+    def validate():
+        return [ClientOut.model_validate(client) for client in clients]
+
+    track_memory(validate)
+    benchmark.pedantic(validate, rounds=ROUNDS[size])
+
+
+def test_encode_jsonable_encoder(benchmark, track_memory, client_dicts, size):
+    def encode():
+        page = ClientPage.model_validate({"items": client_dicts, "next_cursor": None})
+        return json.dumps(jsonable_encoder(page), ensure_ascii=False).encode()
+
+    track_memory(encode)
+    benchmark.pedantic(encode, rounds=ROUNDS[size])
+
+
+def test_encode_pydantic_dump_json(benchmark, track_memory, client_dicts, size):
+    def encode():
+        page = ClientPage.model_validate({"items": client_dicts, "next_cursor": None})
+        return page.model_dump_json().encode()
+
+    track_memory(encode)
+    benchmark.pedantic(encode, rounds=ROUNDS[size])
+
+
+def test_encode_orjson(benchmark, track_memory, client_dicts, size):
+    def encode():
+        return encode_json({"items": client_dicts, "next_cursor": None})
+
+    track_memory(encode)
+    benchmark.pedantic(encode, rounds=ROUNDS[size])